@@ -0,0 +1,166 @@
+"""
+Benchmark Harness
+Registry, timing loop and baseline comparison for the benchmark suite
+"""
+
+import gc
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# name -> (setup, options); setup returns the callable to time
+BENCHMARKS = {}
+
+# Target wall time for one timed repeat when the loop count is calibrated
+MIN_REPEAT_TIME = 0.05
+
+# Slowdowns smaller than this per call are timer and cache noise, never regressions
+NOISE_FLOOR = 1e-6
+
+# Cleanups registered by the benchmark being run, undone once it is timed
+_cleanups = []
+
+
+class Skip(Exception):
+    """Raised by a benchmark setup when it cannot run here (missing toolkit etc.)"""
+
+
+def benchmark(name, repeat=5, number=None, tolerance=None):
+    """Register a benchmark setup function under name
+
+    The setup runs once and returns a zero-argument callable; that
+    callable is timed.  number fixes the calls per repeat, otherwise it
+    is calibrated so each repeat takes at least MIN_REPEAT_TIME.
+    tolerance overrides the runner's allowed slowdown for a benchmark
+    known to be noisy (disk I/O, threads).
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, {"repeat": repeat, "number": number, "tolerance": tolerance})
+        return setup
+    return register
+
+
+def on_cleanup(callback):
+    """Call callback once the running benchmark has been timed (last registered, first called)"""
+    _cleanups.append(callback)
+
+
+def temporary_directory():
+    """Directory for the running benchmark, removed once it has been timed"""
+    directory = tempfile.TemporaryDirectory(prefix="daggerheart-bench-", ignore_cleanup_errors=True)
+    on_cleanup(directory.cleanup)
+    return Path(directory.name)
+
+
+def _run_cleanups():
+    while _cleanups:
+        _cleanups.pop()()
+
+
+def _calibrate(func):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= MIN_REPEAT_TIME:
+            return number
+        number *= 2
+
+
+def run_benchmark(name):
+    """Run one registered benchmark, returning its result dict"""
+    setup, options = BENCHMARKS[name]
+    try:
+        return _time_benchmark(name, setup, options)
+    finally:
+        _run_cleanups()
+
+
+def _time_benchmark(name, setup, options):
+    try:
+        func = setup()
+    except Skip as e:
+        return {"name": name, "status": "skipped", "reason": str(e)}
+
+    number = options["number"]
+    timings = []
+    # Start from a collected heap, so garbage left by earlier benchmarks is not timed here
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = number or _calibrate(func)
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+    except Exception as e:
+        return {"name": name, "status": "error", "reason": f"{type(e).__name__}: {e}"}
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    result = {
+        "name": name,
+        "status": "ok",
+        "number": number,
+        "repeat": options["repeat"],
+        "min": min(timings),
+        "median": statistics.median(timings),
+    }
+    if options["tolerance"] is not None:
+        result["tolerance"] = options["tolerance"]
+    return result
+
+
+def merge_runs(runs):
+    """Combine the results of several full runs of one benchmark
+
+    The fastest repeat of any run is what gets compared: noise only ever
+    adds time, so one slow run (another process waking up, a frequency
+    dip) cannot move it.
+    """
+    ok = [result for result in runs if result["status"] == "ok"]
+    if len(ok) < len(runs):
+        return next(result for result in runs if result["status"] != "ok")
+    merged = dict(ok[0])
+    merged["runs"] = len(ok)
+    merged["min"] = min(result["min"] for result in ok)
+    merged["median"] = statistics.median(result["median"] for result in ok)
+    return merged
+
+
+def compare(results, baseline, tolerance):
+    """Compare measured results with a baseline
+
+    Returns (rows, regressions, scale).  rows holds (name,
+    baseline_seconds, measured_seconds, ratio) for every benchmark
+    measured in both, by fastest time per call.  scale is the median
+    ratio over all of them, floored at 1: how much slower this machine
+    runs right now than when the baseline was recorded.  A benchmark
+    regresses when its ratio divided by scale exceeds 1 + its tolerance
+    and it lost more than NOISE_FLOOR per call, so neither a uniformly
+    busy machine nor jitter on a sub-microsecond call fails the gate.
+    A machine that runs faster is not factored in: speedups are rarely
+    uniform, and dividing by them would flag every benchmark that did
+    not share in one.
+    """
+    rows = []
+    limits = {}
+    reference = {entry["name"]: entry for entry in baseline.get("results", [])}
+    for result in results:
+        before = reference.get(result["name"])
+        if result["status"] != "ok" or not before or before.get("status") != "ok":
+            continue
+        ratio = result["min"] / before["min"] if before["min"] else float("inf")
+        rows.append((result["name"], before["min"], result["min"], ratio))
+        limits[result["name"]] = 1 + result.get("tolerance", tolerance)
+    scale = max(1.0, statistics.median(row[3] for row in rows)) if rows else 1.0
+    regressions = [
+        row for row in rows
+        if row[3] / scale > limits[row[0]] and row[2] / scale - row[1] > NOISE_FLOOR
+    ]
+    return rows, regressions, scale
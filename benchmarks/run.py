@@ -0,0 +1,151 @@
+"""
+Benchmark Runner
+Runs the suite offscreen, writes JSON results and checks them against a stored baseline
+
+    python -m benchmarks.run                      # run and compare with the baseline
+    python -m benchmarks.run --json results.json  # also write machine-readable results
+    python -m benchmarks.run --save-baseline      # add benchmarks missing from the baseline
+    python -m benchmarks.run --replace-baseline   # re-record the whole baseline for this profile
+
+The baseline is recorded once per machine profile.  --save-baseline only
+adds benchmarks it does not hold yet, so a new benchmark never re-times
+the existing ones; re-record it all only when the machine changes.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def prepare_environment():
+    """Run toolkits offscreen and keep the user's real settings and saves out of reach
+
+    Returns the TemporaryDirectory standing in for HOME; clean it up when done.
+    """
+    home_dir = tempfile.TemporaryDirectory(prefix="daggerheart-bench-", ignore_cleanup_errors=True)
+    home = home_dir.name
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    os.environ["KIVY_HOME"] = os.path.join(home, ".kivy")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    return home_dir
+
+
+def detect_profile():
+    """Baseline profile for this machine: rpi or desktop"""
+    from components.platform_config import PlatformConfig
+    return "rpi" if PlatformConfig.is_raspberry_pi() else "desktop"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Daggerheart Tracker benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--profile", help="baseline profile (default: rpi or desktop, detected)")
+    parser.add_argument("--baseline", type=Path, help="baseline file (default: baselines/<profile>.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="add results for benchmarks the baseline does not hold yet")
+    parser.add_argument("--replace-baseline", action="store_true", help="store these results as the whole baseline")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="full passes over the suite; the fastest time across them is compared (default 3)")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown, relative to the suite as a whole, before a benchmark "
+                             "counts as a regression (default 0.5)")
+    return parser
+
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    home_dir = prepare_environment()
+    try:
+        return run(args)
+    finally:
+        home_dir.cleanup()
+
+
+def run(args):
+    from benchmarks import suite  # noqa: F401 - registers the benchmarks
+    from benchmarks.harness import BENCHMARKS, compare, merge_runs, run_benchmark
+
+    profile = args.profile or detect_profile()
+    baseline_file = args.baseline or BASELINE_DIR / f"{profile}.json"
+
+    # Passes over the whole suite rather than back-to-back repeats, so a
+    # noisy moment is spread over many benchmarks instead of hitting one
+    names = [name for name in BENCHMARKS if args.filter in name]
+    runs = {name: [] for name in names}
+    for _ in range(max(1, args.runs)):
+        for name in names:
+            # Skipped or failed once is enough
+            if not runs[name] or runs[name][-1]["status"] == "ok":
+                runs[name].append(run_benchmark(name))
+    results = []
+    for name in names:
+        result = merge_runs(runs[name])
+        results.append(result)
+        if result["status"] == "ok":
+            print(f"{name:<40} {format_seconds(result['min']):>10}  (median {format_seconds(result['median'])})")
+        else:
+            print(f"{name:<40} {result['status']:>10}  {result['reason']}")
+
+    report = {
+        "profile": profile,
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "processor": platform.machine()},
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.save_baseline or args.replace_baseline:
+        # Skipped and failed benchmarks are left out rather than recorded as zero
+        measured = [result for result in results if result["status"] == "ok"]
+        if args.replace_baseline or not baseline_file.exists():
+            report["results"] = measured
+        else:
+            report = json.loads(baseline_file.read_text())
+            known = {entry["name"] for entry in report["results"]}
+            added = [result for result in measured if result["name"] not in known]
+            report["results"].extend(added)
+            print(f"Added {len(added)} benchmarks to the baseline; existing entries kept")
+        baseline_file.parent.mkdir(parents=True, exist_ok=True)
+        baseline_file.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {baseline_file}")
+        return 0
+
+    if not baseline_file.exists():
+        print(f"No baseline at {baseline_file}; run with --save-baseline to record one")
+        return 0
+
+    rows, regressions, scale = compare(results, json.loads(baseline_file.read_text()), args.tolerance)
+    print(f"\nCompared {len(rows)} benchmarks with {baseline_file.name}; "
+          f"factoring out an overall slowdown of {scale:.2f}x")
+    compared = {row[0] for row in rows}
+    missing = [result["name"] for result in results if result["status"] == "ok" and result["name"] not in compared]
+    if missing:
+        print(f"Not in the baseline (add with --save-baseline): {', '.join(missing)}")
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {format_seconds(before)} -> {format_seconds(after)} "
+              f"({ratio:.2f}x, {ratio / scale:.2f}x relative)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
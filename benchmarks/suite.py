@@ -0,0 +1,317 @@
+"""
+Benchmark Suite
+Hot paths of the tracker; toolkit-bound benchmarks skip when PySide6/Kivy is missing
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import Skip, benchmark, on_cleanup, temporary_directory
+from core.character import CharacterSheet, CharacterState
+from core.combat import CombatTracker
+from core.dice import ROLL_TYPES, roll_ability, roll_custom, roll_dice, roll_tally
+from core.expression import compile_expression
+from core.history import RollHistory
+from core.rng import derive
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CUSTOM_DICE_COUNTS = (100, 10_000, 1_000_000)
+
+DICE_EXPRESSIONS = ("1d8+2", "2d8+1d6+3", "4d6kh3", "3d6!")
+
+# Window sizes covering every breakpoint, Raspberry Pi screens included
+RESPONSIVE_SIZES = ((480, 320), (800, 480), (360, 640), (768, 1024), (1024, 768), (1920, 1080))
+
+_qt_app = None
+
+
+def require(module):
+    """Skip the calling benchmark unless module can be imported"""
+    if importlib.util.find_spec(module) is None:
+        raise Skip(f"{module} not installed")
+
+
+def qt_app():
+    """Shared offscreen QCoreApplication for the Qt model benchmarks"""
+    global _qt_app
+    require("PySide6")
+    from PySide6.QtCore import QCoreApplication
+    if _qt_app is None:
+        _qt_app = QCoreApplication.instance() or QCoreApplication([])
+    return _qt_app
+
+
+# Dice
+for _roll_type in ROLL_TYPES:
+    @benchmark(f"dice.calculate_roll[{_roll_type}]")
+    def _bench_calculate_roll(roll_type=_roll_type):
+        qt_app()
+        from qt_models.dice_roller import DiceRoller
+        roller = DiceRoller()
+        return lambda: roller._calculate_dice_roll(roll_type)
+
+    @benchmark(f"core.roll_dice[{_roll_type}]")
+    def _bench_core_roll(roll_type=_roll_type):
+        rng = derive(0, "bench")
+        return lambda: roll_dice(roll_type, rng)
+
+for _count in CUSTOM_DICE_COUNTS:
+    @benchmark(f"dice.rollCustomDice[{_count}d6]", repeat=3)
+    def _bench_custom_dice(count=_count):
+        qt_app()
+        from qt_models.dice_roller import DiceRoller
+        roller = DiceRoller()
+        return lambda: roller.rollCustomDice(count, 6)
+
+    @benchmark(f"core.roll_custom[{_count}d6]", repeat=3)
+    def _bench_core_custom(count=_count):
+        rng = derive(0, "bench")
+        return lambda: roll_custom(count, 6, rng)
+
+    @benchmark(f"core.roll_tally[{_count}d6]")
+    def _bench_core_tally(count=_count):
+        rng = derive(0, "bench")
+        return lambda: roll_tally(count, 6, rng)
+
+for _text in DICE_EXPRESSIONS:
+    @benchmark(f"expression.roll[{_text}]")
+    def _bench_expression_roll(text=_text):
+        rng = derive(0, "bench")
+        return lambda: compile_expression(text).roll(rng)
+
+    @benchmark(f"expression.sample[{_text}x10000]", repeat=3)
+    def _bench_expression_sample(text=_text):
+        rng = derive(0, "bench")
+        return lambda: compile_expression(text).sample(10_000, rng)
+
+
+# Combat
+@benchmark("combat.damage_all[41]")
+def _bench_combat_damage_all():
+    """An area attack on a boss and 40 minions, healed back between runs"""
+    tracker = CombatTracker()
+    tracker.add("Boss", 30, (8, 15, 25))
+    tracker.add_many("Minion", 40, 1, (20, 20, 20))
+    rows = range(len(tracker))
+
+    def area_attack():
+        tracker.apply_damage(rows, 9)
+        tracker.heal(rows, 3)
+    return area_attack
+
+
+# Character record
+@benchmark("character.snapshot[binary]")
+def _bench_snapshot_binary():
+    """Round trip of a sheet through its binary snapshot"""
+    state = CharacterState()
+    return lambda: CharacterState.from_bytes(state.to_bytes())
+
+
+@benchmark("character.snapshot[json]")
+def _bench_snapshot_json():
+    """The same round trip through JSON, for comparison"""
+    sheet = CharacterSheet()
+    return lambda: json.loads(json.dumps(sheet.to_dict()))
+
+
+@benchmark("character.copy")
+def _bench_character_copy():
+    return CharacterState().copy
+
+
+# Character model
+@benchmark("character.update_storm[1000]")
+def _bench_update_storm():
+    """1000 property writes with a listener on every change signal"""
+    qt_app()
+    from qt_models.character_model import CharacterModel
+    character = CharacterModel()
+    received = []
+    for key in CharacterModel.PERSISTED_PROPERTIES:
+        getattr(character, key + "Changed").connect(lambda: received.append(None))
+    character.abilitiesChanged.connect(lambda: received.append(None))
+
+    def storm():
+        for i in range(200):
+            character.hpCurrent = i % 30
+            character.hope = i % 6
+            character.fear = i % 12
+            character.armor = i % 3
+            character.setAbility("Fuerza", i % 4)
+        received.clear()
+    storm.character = character
+    return storm
+
+
+# Roll history
+ABILITIES = ("Fuerza", "Destreza", "Carisma", "Constitución", "Sabiduría", "Inteligencia")
+
+
+def _filled_history(rolls=20_000):
+    """On-disk history holding rolls ability checks spread over every ability"""
+    history = RollHistory(temporary_directory())
+    on_cleanup(history.close)
+    rng = derive(0, "bench")
+    for i in range(rolls):
+        dice, total, result_type = roll_ability("Normal", 1, rng)
+        history.record("ability", "Normal", dice, 1, total, result_type, ABILITIES[i % len(ABILITIES)])
+    return history
+
+
+@benchmark("history.record")
+def _bench_history_record():
+    history = RollHistory(temporary_directory())
+    on_cleanup(history.close)
+    return lambda: history.record("ability", "Normal", [7, 5], 2, 14, "minor_success", "Fuerza")
+
+
+@benchmark("history.last[10 critical Fuerza]")
+def _bench_history_query():
+    history = _filled_history()
+    return lambda: history.last(10, "critical_success", "Fuerza")
+
+
+@benchmark("history.read[page from disk]", tolerance=1.0)
+def _bench_history_page():
+    history = _filled_history()
+    return lambda: history.read(1000, 50)
+
+
+@benchmark("character.update_storm[1000, batched]")
+def _bench_update_storm_batched():
+    """The same 1000 writes inside one update batch"""
+    storm = _bench_update_storm()
+    character = storm.character
+
+    def batched():
+        with character.updates():
+            storm()
+    return batched
+
+
+# Settings
+@benchmark("settings.qt.saveSettings", tolerance=1.0)
+def _bench_qt_save_settings():
+    """Queue a save and wait for the write-behind thread to write it"""
+    qt_app()
+    from qt_models.settings_manager import SettingsManager
+    manager = SettingsManager(save_delay=0, settings_file=temporary_directory() / "settings.json")
+
+    def save():
+        manager.saveSettings()
+        manager.flushSettings()
+    return save
+
+
+@benchmark("settings.qt.loadSettings", tolerance=1.0)
+def _bench_qt_load_settings():
+    qt_app()
+    from qt_models.settings_manager import SettingsManager
+    manager = SettingsManager(save_delay=0, settings_file=temporary_directory() / "settings.json")
+    manager.saveSettings()
+    manager.flushSettings()
+    return manager.loadSettings
+
+
+@benchmark("settings.kivy.save", tolerance=1.0)
+def _bench_kivy_save_settings():
+    from utils.settings import SettingsManager
+    manager = SettingsManager(temporary_directory() / "settings.json", save_delay=0)
+    manager.store.update({"dark_theme": False, "dice_speed": 70, "volume": 0.8})
+    return manager.save
+
+
+@benchmark("settings.kivy.load", tolerance=1.0)
+def _bench_kivy_load_settings():
+    from utils.settings import SettingsManager
+    manager = SettingsManager(temporary_directory() / "settings.json", save_delay=0)
+    manager.store.update({"dark_theme": False, "dice_speed": 70, "volume": 0.8})
+    manager.save()
+    return manager.load
+
+
+@benchmark("settings.store.set_burst[100]", tolerance=1.0)
+def _bench_store_burst():
+    """100 changes to one key, then wait for their single coalesced write"""
+    from core.settings import SettingsStore
+    store = SettingsStore(temporary_directory() / "settings.json", save_delay=0.01)
+    store.subscribe("dice_speed", lambda key, value: None)
+
+    def burst():
+        for speed in range(10, 110):
+            store.set("dice_speed", speed)
+        store.flush()
+    return burst
+
+
+# Platform detection
+@benchmark("platform.get_system_info")
+def _bench_system_info():
+    from components.platform_config import PlatformConfig
+    return PlatformConfig.get_system_info
+
+
+@benchmark("platform.get_system_info[uncached]")
+def _bench_system_info_uncached():
+    from components.platform_config import PlatformConfig
+
+    def probe():
+        PlatformConfig.invalidate_cache()
+        PlatformConfig.get_system_info()
+    return probe
+
+
+# Responsive layout
+@benchmark("responsive.get_metrics")
+def _bench_get_metrics():
+    """Metric lookups for every breakpoint size"""
+    require("kivy")
+    from components.responsive_utils import ResponsiveUtils
+
+    def lookups():
+        for width, height in RESPONSIVE_SIZES:
+            ResponsiveUtils.get_metrics(width, height)
+    return lookups
+
+
+@benchmark("responsive.classify_width")
+def _bench_classify_width():
+    require("kivy")
+    from components.responsive_utils import ResponsiveUtils
+
+    def lookups():
+        for width, _ in RESPONSIVE_SIZES:
+            ResponsiveUtils.classify_width(width, False)
+            ResponsiveUtils.classify_width(width, True)
+    return lookups
+
+
+# Cold start
+def _cold_start(script, module):
+    """Launch script until its first frame, offscreen, and wait for it to exit"""
+    require(module)
+    env = dict(os.environ, DAGGERHEART_EXIT_AFTER_START="1")
+
+    def launch():
+        completed = subprocess.run([sys.executable, str(ROOT / script)], cwd=ROOT, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
+        if completed.returncode != 0:
+            tail = completed.stderr.decode(errors="replace").strip().splitlines()[-1:]
+            raise RuntimeError(f"{script} exited with {completed.returncode}: {' '.join(tail)}")
+    return launch
+
+
+@benchmark("startup.kivy", repeat=3, number=1)
+def _bench_startup_kivy():
+    return _cold_start("main.py", "kivy")
+
+
+@benchmark("startup.qt", repeat=3, number=1)
+def _bench_startup_qt():
+    return _cold_start("main_qt.py", "PySide6")
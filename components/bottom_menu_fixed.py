@@ -7,10 +7,15 @@ from kivy.uix.label import Label
 from kivy.graphics import Color, RoundedRectangle
 from kivy.utils import get_color_from_hex
 from kivy.clock import Clock
-from kivy.core.window import Window
 from components.platform_config import PlatformConfig
 from components.responsive_utils import ResponsiveUtils
 
+# Background colors, parsed once
+BUTTON_COLOR = get_color_from_hex('#34495e')
+BUTTON_ACTIVE_COLOR = get_color_from_hex('#3498db')
+BUTTON_PRESSED_COLOR = get_color_from_hex('#2980b9')  # Darker blue for press
+MENU_COLOR = get_color_from_hex('#2c3e50')
+
 class FixedBottomMenuButton(Button):
     def __init__(self, icon, text, screen_name, app, **kwargs):
         super().__init__(**kwargs)
@@ -28,53 +33,34 @@ class FixedBottomMenuButton(Button):
         self.valign = 'middle'
         self.text_size = (None, None)
         
-        # Initialize background rectangle
-        self.bg_rect = None
+        # Background instructions are created once and mutated afterwards
+        self.active = False
+        with self.canvas.before:
+            self.bg_color = Color(rgba=BUTTON_COLOR)
+            self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[10])
         
         # Bind events with proper error handling
         self.bind(pos=self.update_bg, size=self.update_bg)
         self.bind(on_press=self.on_button_press)
         self.bind(on_release=self.on_button_release)
-        Window.bind(on_resize=self.on_window_resize)
         
-        # Schedule responsive update
-        Clock.schedule_once(self.update_responsive_properties, 0.1)
-    
-    def on_window_resize(self, *args):
-        """Called when window is resized"""
-        Clock.schedule_once(self.update_responsive_properties, 0.1)
+        # Re-layout only when the window crosses a breakpoint, while in the widget tree
+        self.unbind_metrics = ResponsiveUtils.bind_metrics(self.update_responsive_properties, widget=self)
+        Clock.schedule_once(lambda dt: self.update_responsive_properties(ResponsiveUtils.get_metrics()), 0.1)
     
-    def update_responsive_properties(self, *args):
-        """Update button properties based on screen size"""
+    def update_responsive_properties(self, metrics):
+        """Update button properties for the current breakpoint"""
         try:
-            screen_type = ResponsiveUtils.get_screen_type()
-            system_info = PlatformConfig.get_system_info()
-            
             # Responsive button height with Raspberry Pi optimizations
-            if screen_type in ['mobile', 'rpi_small']:
-                self.height = 50
-                icon_size = 10
-                text_size = 7
-            elif screen_type in ['tablet', 'rpi_medium']:
-                self.height = 60
-                icon_size = 12
-                text_size = 8
-            elif screen_type == 'rpi_large':
-                self.height = 65
-                icon_size = 13
-                text_size = 9
-            else:
-                self.height = 70
-                icon_size = 14
-                text_size = 10
+            self.height = metrics.menu_button_height
             
             # For Raspberry Pi, ensure minimum touch target size
-            if system_info.get('is_raspberry_pi', False):
-                min_height = ResponsiveUtils.get_touch_target_size()
-                self.height = max(self.height, min_height)
+            if PlatformConfig.get_system_info()['is_raspberry_pi']:
+                self.height = max(self.height, metrics.touch_target_size)
             
             # Update text with responsive sizes
-            self.text = f'[b][size={icon_size}]{self.icon}[/size][/b]\n[size={text_size}]{self.button_text}[/size]'
+            self.text = (f'[b][size={metrics.menu_icon_size}]{self.icon}[/size][/b]\n'
+                         f'[size={metrics.menu_text_size}]{self.button_text}[/size]')
             
             # Update background
             self.update_bg()
@@ -84,11 +70,8 @@ class FixedBottomMenuButton(Button):
     def update_bg(self, *args):
         """Update background rectangle and text size"""
         try:
-            # Clear and recreate the background
-            self.canvas.before.clear()
-            with self.canvas.before:
-                Color(rgba=get_color_from_hex('#34495e'))
-                self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[10])
+            self.bg_rect.pos = self.pos
+            self.bg_rect.size = self.size
             
             # Update text size for proper text centering
             self.text_size = self.size
@@ -99,10 +82,7 @@ class FixedBottomMenuButton(Button):
         """Handle button press - visual feedback"""
         try:
             # Change color to show press
-            self.canvas.before.clear()
-            with self.canvas.before:
-                Color(rgba=get_color_from_hex('#2980b9'))  # Darker blue for press
-                self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[10])
+            self.bg_color.rgba = BUTTON_PRESSED_COLOR
             print(f"Button pressed: {self.screen_name}")
         except Exception as e:
             print(f"Error in button press: {e}")
@@ -118,18 +98,13 @@ class FixedBottomMenuButton(Button):
             print(f"Error switching screen: {e}")
         finally:
             # Reset button color
-            Clock.schedule_once(lambda dt: self.update_bg(), 0.1)
+            Clock.schedule_once(lambda dt: self.set_active(self.active), 0.1)
     
     def set_active(self, active=True):
         """Set button as active/inactive"""
         try:
-            self.canvas.before.clear()
-            with self.canvas.before:
-                if active:
-                    Color(rgba=get_color_from_hex('#3498db'))
-                else:
-                    Color(rgba=get_color_from_hex('#34495e'))
-                self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[10])
+            self.active = active
+            self.bg_color.rgba = BUTTON_ACTIVE_COLOR if active else BUTTON_COLOR
         except Exception as e:
             print(f"Error setting button active state: {e}")
 
@@ -143,12 +118,13 @@ class FixedBottomMenu(BoxLayout):
         self.spacing = 6   # Reduced spacing to fit better
         self.padding = [12, 12, 12, 12]  # Reduced padding
         
-        # Initialize background rectangle
-        self.bg_rect = None
+        # Background instructions are created once and mutated afterwards
+        with self.canvas.before:
+            Color(rgba=MENU_COLOR)
+            self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[20, 20, 0, 0])
         
         # Bind events
         self.bind(pos=self.update_bg, size=self.update_bg)
-        Window.bind(on_resize=self.on_window_resize)
         
         # Menu buttons with dynamic configuration based on platform
         self.buttons = {}
@@ -172,32 +148,17 @@ class FixedBottomMenu(BoxLayout):
                 self.buttons[screen_name] = btn
                 self.add_widget(btn)
         
-        # Schedule responsive update
-        Clock.schedule_once(self.update_responsive_properties, 0.1)
+        # Re-layout only when the window crosses a breakpoint, while in the widget tree
+        self.unbind_metrics = ResponsiveUtils.bind_metrics(self.update_responsive_properties, widget=self)
+        Clock.schedule_once(lambda dt: self.update_responsive_properties(ResponsiveUtils.get_metrics()), 0.1)
     
-    def on_window_resize(self, *args):
-        """Called when window is resized"""
-        Clock.schedule_once(self.update_responsive_properties, 0.1)
-    
-    def update_responsive_properties(self, *args):
-        """Update menu properties based on screen size"""
+    def update_responsive_properties(self, metrics):
+        """Update menu properties for the current breakpoint"""
         try:
             # Responsive height and spacing with Raspberry Pi support
-            self.height = ResponsiveUtils.get_bottom_menu_height()
-            
-            screen_type = ResponsiveUtils.get_screen_type()
-            if screen_type in ['mobile', 'rpi_small']:
-                self.spacing = 3
-                self.padding = [6, 6, 6, 6]
-            elif screen_type in ['tablet', 'rpi_medium']:
-                self.spacing = 4
-                self.padding = [8, 8, 8, 8]
-            elif screen_type == 'rpi_large':
-                self.spacing = 5
-                self.padding = [10, 10, 10, 10]
-            else:
-                self.spacing = 6
-                self.padding = [12, 12, 12, 12]
+            self.height = metrics.bottom_menu_height
+            self.spacing = metrics.menu_spacing
+            self.padding = metrics.menu_padding
             
             # Update background
             self.update_bg()
@@ -207,10 +168,8 @@ class FixedBottomMenu(BoxLayout):
     def update_bg(self, *args):
         """Update background rectangle"""
         try:
-            self.canvas.before.clear()
-            with self.canvas.before:
-                Color(rgba=get_color_from_hex('#2c3e50'))
-                self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[20, 20, 0, 0])
+            self.bg_rect.pos = self.pos
+            self.bg_rect.size = self.size
         except Exception as e:
             print(f"Error updating menu background: {e}")
     
@@ -3,26 +3,88 @@
 
 import platform
 import os
+from types import MappingProxyType
+
+def _freeze(table):
+    """Read-only view of a nested dict, shared by every caller"""
+    return MappingProxyType({key: MappingProxyType(value) if isinstance(value, dict) else value
+                             for key, value in table.items()})
+
+# Unicode dice and symbols for Raspberry Pi
+_RPI_BUTTON_CONFIG = _freeze({
+    'rolls': {'icon': '⚀⚁', 'text': 'Dados'},
+    'ability_checks': {'icon': '�', 'text': 'Chequeos'},
+    'characteristics': {'icon': '⚔', 'text': 'Personaje'},
+    'combat': {'icon': '⚡', 'text': 'Combate'},
+    'settings': {'icon': '⚙', 'text': 'Ajustes'},
+    'simple_menu': {'icon': '☰', 'text': 'Menú'}
+})
+
+# Standard emoji for other platforms
+_EMOJI_BUTTON_CONFIG = _freeze({
+    'rolls': {'icon': '�🎲', 'text': 'Dados'},
+    'ability_checks': {'icon': '🎯', 'text': 'Chequeos'},
+    'characteristics': {'icon': '⚔️', 'text': 'Personaje'},
+    'combat': {'icon': '⚡', 'text': 'Combate'},
+    'settings': {'icon': '⚙️', 'text': 'Ajustes'},
+    'simple_menu': {'icon': '☰', 'text': 'Menú'}
+})
+
+# Text-only labels where emoji support is unreliable
+_TEXT_BUTTON_CONFIG = _freeze({
+    'rolls': {'icon': 'DICE', 'text': 'Dados'},
+    'ability_checks': {'icon': 'CHECK', 'text': 'Chequeos'},
+    'characteristics': {'icon': 'CHAR', 'text': 'Personaje'},
+    'combat': {'icon': 'FIGHT', 'text': 'Combate'},
+    'settings': {'icon': 'GEAR', 'text': 'Ajustes'},
+    'simple_menu': {'icon': 'MENU', 'text': 'Menú'}
+})
+
+# Raspberry Pi display and performance tuning
+_RPI_OPTIMIZATIONS = MappingProxyType({
+    'window_size': (800, 480),  # Common RPi touchscreen size
+    'font_scale': 0.9,          # Slightly smaller fonts for small screens
+    'touch_target_size': 60,    # Minimum touch target size
+    'animation_duration': 0.15, # Faster animations for better performance
+    'use_hardware_acceleration': True,
+    'enable_touch_mode': True
+})
 
 class PlatformConfig:
     """Platform-specific configuration for optimal display"""
     
+    # System probe, computed once per process
+    _system_info = None
+    
     @staticmethod
     def get_system_info():
-        """Get system information for optimal configuration"""
-        return {
-            'platform': platform.system(),
-            'machine': platform.machine(),
-            'python_version': platform.python_version(),
-            'is_windows': platform.system() == 'Windows',
-            'is_mac': platform.system() == 'Darwin',
-            'is_linux': platform.system() == 'Linux',
-            'is_raspberry_pi': PlatformConfig.is_raspberry_pi()
-        }
+        """Get system information for optimal configuration (read-only, cached)"""
+        if PlatformConfig._system_info is None:
+            system = platform.system()
+            PlatformConfig._system_info = MappingProxyType({
+                'platform': system,
+                'machine': platform.machine(),
+                'python_version': platform.python_version(),
+                'is_windows': system == 'Windows',
+                'is_mac': system == 'Darwin',
+                'is_linux': system == 'Linux',
+                'is_raspberry_pi': PlatformConfig._probe_raspberry_pi()
+            })
+        return PlatformConfig._system_info
+    
+    @staticmethod
+    def invalidate_cache():
+        """Forget the cached system probe so the next call probes again"""
+        PlatformConfig._system_info = None
     
     @staticmethod
     def is_raspberry_pi():
         """Detect if running on Raspberry Pi"""
+        return PlatformConfig.get_system_info()['is_raspberry_pi']
+    
+    @staticmethod
+    def _probe_raspberry_pi():
+        """Scan /proc/cpuinfo for Raspberry Pi hardware"""
         try:
             # Check for Raspberry Pi hardware
             with open('/proc/cpuinfo', 'r') as f:
@@ -61,47 +123,13 @@ class PlatformConfig:
     @staticmethod
     def get_button_config():
         """Get optimal button configuration for current platform"""
-        system_info = PlatformConfig.get_system_info()
-        
         if PlatformConfig.use_emoji_buttons():
-            if system_info['is_raspberry_pi']:
-                # Use Unicode dice and symbols for Raspberry Pi
-                return {
-                    'rolls': {'icon': '⚀⚁', 'text': 'Dados'},
-                    'ability_checks': {'icon': '�', 'text': 'Chequeos'},
-                    'characteristics': {'icon': '⚔', 'text': 'Personaje'},
-                    'combat': {'icon': '⚡', 'text': 'Combate'},
-                    'settings': {'icon': '⚙', 'text': 'Ajustes'},
-                    'simple_menu': {'icon': '☰', 'text': 'Menú'}
-                }
-            else:
-                # Standard emoji for other platforms
-                return {
-                    'rolls': {'icon': '�🎲', 'text': 'Dados'},
-                    'ability_checks': {'icon': '🎯', 'text': 'Chequeos'},
-                    'characteristics': {'icon': '⚔️', 'text': 'Personaje'},
-                    'combat': {'icon': '⚡', 'text': 'Combate'},
-                    'settings': {'icon': '⚙️', 'text': 'Ajustes'},
-                    'simple_menu': {'icon': '☰', 'text': 'Menú'}
-                }
-        else:
-            return {
-                'rolls': {'icon': 'DICE', 'text': 'Dados'},
-                'ability_checks': {'icon': 'CHECK', 'text': 'Chequeos'},
-                'characteristics': {'icon': 'CHAR', 'text': 'Personaje'},
-                'combat': {'icon': 'FIGHT', 'text': 'Combate'},
-                'settings': {'icon': 'GEAR', 'text': 'Ajustes'},
-                'simple_menu': {'icon': 'MENU', 'text': 'Menú'}
-            }
+            if PlatformConfig.get_system_info()['is_raspberry_pi']:
+                return _RPI_BUTTON_CONFIG
+            return _EMOJI_BUTTON_CONFIG
+        return _TEXT_BUTTON_CONFIG
     
     @staticmethod
     def get_raspberry_pi_optimizations():
         """Get Raspberry Pi specific optimizations"""
-        return {
-            'window_size': (800, 480),  # Common RPi touchscreen size
-            'font_scale': 0.9,          # Slightly smaller fonts for small screens
-            'touch_target_size': 60,    # Minimum touch target size
-            'animation_duration': 0.15, # Faster animations for better performance
-            'use_hardware_acceleration': True,
-            'enable_touch_mode': True
-        }
+        return _RPI_OPTIMIZATIONS
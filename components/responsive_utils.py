@@ -4,11 +4,98 @@ Responsive utility functions for adapting UI to different screen sizes
 Includes Raspberry Pi optimizations
 """
 
+import weakref
+
 from kivy.core.window import Window
 from kivy.metrics import dp, sp
 from kivy.clock import Clock
+from kivy.event import EventDispatcher
 from components.platform_config import PlatformConfig
 
+class LayoutMetrics:
+    """Layout values for one breakpoint, computed once and shared by all widgets"""
+    
+    __slots__ = ('screen_type', 'is_portrait', 'padding', 'spacing', 'font_scale',
+                 'button_height', 'card_padding', 'grid_cols', 'bottom_menu_height',
+                 'touch_target_size', 'menu_button_height', 'menu_icon_size',
+                 'menu_text_size', 'menu_spacing', 'menu_padding')
+    
+    def __init__(self, screen_type, is_portrait, is_raspberry_pi):
+        self.screen_type = screen_type
+        self.is_portrait = is_portrait
+        
+        if screen_type in ('mobile', 'rpi_small'):
+            self.padding = (dp(10), dp(15), dp(10), dp(100))
+            self.spacing = dp(10)
+            self.font_scale = 0.7
+            self.button_height = dp(50)
+            self.bottom_menu_height = dp(80)
+            self.menu_button_height, self.menu_icon_size, self.menu_text_size = 50, 10, 7
+            self.menu_spacing, self.menu_padding = 3, (6, 6, 6, 6)
+        elif screen_type in ('tablet', 'rpi_medium'):
+            self.padding = (dp(20), dp(25), dp(20), dp(110))
+            self.spacing = dp(15)
+            self.font_scale = 0.8
+            self.button_height = dp(60)
+            self.bottom_menu_height = dp(85)
+            self.menu_button_height, self.menu_icon_size, self.menu_text_size = 60, 12, 8
+            self.menu_spacing, self.menu_padding = 4, (8, 8, 8, 8)
+        elif screen_type == 'rpi_large':
+            self.padding = (dp(25), dp(30), dp(25), dp(120))
+            self.spacing = dp(18)
+            self.font_scale = 0.85
+            self.button_height = dp(65)
+            self.bottom_menu_height = dp(90)
+            self.menu_button_height, self.menu_icon_size, self.menu_text_size = 65, 13, 9
+            self.menu_spacing, self.menu_padding = 5, (10, 10, 10, 10)
+        else:
+            self.padding = (dp(30), dp(40), dp(30), dp(140))
+            self.spacing = dp(25)
+            self.font_scale = 1.0
+            self.button_height = dp(80)
+            self.bottom_menu_height = dp(100)
+            self.menu_button_height, self.menu_icon_size, self.menu_text_size = 70, 14, 10
+            self.menu_spacing, self.menu_padding = 6, (12, 12, 12, 12)
+        
+        if screen_type == 'mobile':
+            self.card_padding = dp(15)
+            self.grid_cols = 1 if is_portrait else 2
+        elif screen_type == 'tablet':
+            self.card_padding = dp(18)
+            self.grid_cols = 2 if is_portrait else 3
+        else:
+            self.card_padding = dp(20)
+            self.grid_cols = 2 if is_portrait else 3
+        
+        if is_raspberry_pi:
+            # Raspberry Pi touchscreens need larger touch targets
+            self.touch_target_size = dp(60)
+        elif screen_type in ('mobile', 'rpi_small'):
+            self.touch_target_size = dp(44)  # iOS/Android standard
+        else:
+            self.touch_target_size = dp(40)
+
+class LayoutMetricsDispatcher(EventDispatcher):
+    """Single resize coordinator: publishes on_metrics only when a resize crosses a breakpoint"""
+    
+    __events__ = ('on_metrics',)
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = ResponsiveUtils.get_metrics()
+        # A burst of resize events within one frame collapses into one pass
+        self._trigger_update = Clock.create_trigger(self._update_metrics)
+        Window.bind(on_resize=self._trigger_update)
+    
+    def _update_metrics(self, *args):
+        metrics = ResponsiveUtils.get_metrics()
+        if metrics is not self.metrics:
+            self.metrics = metrics
+            self.dispatch('on_metrics', metrics)
+    
+    def on_metrics(self, metrics):
+        pass
+
 class ResponsiveUtils:
     """Utility class for responsive design calculations"""
     
@@ -24,19 +111,20 @@ class ResponsiveUtils:
         'rpi_5inch': (800, 480),    # 5" HDMI display
     }
     
+    # LayoutMetrics per (screen_type, is_portrait, is_raspberry_pi)
+    _metrics_cache = {}
+    _dispatcher = None
+    
     @staticmethod
     def get_screen_size():
         """Get current window size"""
         return Window.width, Window.height
     
     @staticmethod
-    def get_screen_type():
-        """Determine screen type based on width, with Raspberry Pi detection"""
-        width = Window.width
-        system_info = PlatformConfig.get_system_info()
-        
+    def classify_width(width, is_raspberry_pi):
+        """Screen type for a window width"""
         # Special handling for Raspberry Pi
-        if system_info.get('is_raspberry_pi', False):
+        if is_raspberry_pi:
             if width <= 480:
                 return 'rpi_small'
             elif width <= 800:
@@ -54,6 +142,69 @@ class ResponsiveUtils:
         else:
             return 'large_desktop'
     
+    @staticmethod
+    def get_metrics(width=None, height=None):
+        """Get the shared LayoutMetrics for a window size (current window by default)"""
+        if width is None:
+            width, height = Window.width, Window.height
+        is_raspberry_pi = PlatformConfig.get_system_info()['is_raspberry_pi']
+        key = (ResponsiveUtils.classify_width(width, is_raspberry_pi), height > width, is_raspberry_pi)
+        metrics = ResponsiveUtils._metrics_cache.get(key)
+        if metrics is None:
+            metrics = ResponsiveUtils._metrics_cache[key] = LayoutMetrics(*key)
+        return metrics
+    
+    @staticmethod
+    def bind_metrics(callback, widget=None):
+        """Call callback(metrics) whenever the window crosses a breakpoint; returns an unbind function
+        
+        A bound method is held by weak reference, so the shared dispatcher
+        never keeps its widget alive.  With a widget, the binding is dropped
+        when the widget leaves the tree and made again when it is re-added.
+        """
+        if ResponsiveUtils._dispatcher is None:
+            ResponsiveUtils._dispatcher = LayoutMetricsDispatcher()
+        dispatcher = ResponsiveUtils._dispatcher
+        
+        def bind():
+            target = weakref.WeakMethod(callback) if hasattr(callback, '__self__') else (lambda: callback)
+            uid = None
+            
+            def on_metrics(dispatcher, metrics):
+                function = target()
+                if function is None:
+                    dispatcher.unbind_uid('on_metrics', uid)
+                else:
+                    function(metrics)
+            uid = dispatcher.fbind('on_metrics', on_metrics)
+            return lambda: dispatcher.unbind_uid('on_metrics', uid)
+        
+        unbind = bind()
+        if widget is None:
+            return unbind
+        
+        state = {'unbind': unbind}
+        
+        def on_parent(widget, parent):
+            if parent is None and state['unbind'] is not None:
+                state['unbind']()
+                state['unbind'] = None
+            elif parent is not None and state['unbind'] is None:
+                state['unbind'] = bind()
+        parent_uid = widget.fbind('parent', on_parent)
+        
+        def unbind_all():
+            widget.unbind_uid('parent', parent_uid)
+            if state['unbind'] is not None:
+                state['unbind']()
+                state['unbind'] = None
+        return unbind_all
+    
+    @staticmethod
+    def get_screen_type():
+        """Determine screen type based on width, with Raspberry Pi detection"""
+        return ResponsiveUtils.get_metrics().screen_type
+    
     @staticmethod
     def is_landscape():
         """Check if screen is in landscape orientation"""
@@ -67,105 +218,42 @@ class ResponsiveUtils:
     @staticmethod
     def get_responsive_padding():
         """Get responsive padding based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type in ['mobile', 'rpi_small']:
-            return [dp(10), dp(15), dp(10), dp(100)]
-        elif screen_type in ['tablet', 'rpi_medium']:
-            return [dp(20), dp(25), dp(20), dp(110)]
-        elif screen_type == 'rpi_large':
-            return [dp(25), dp(30), dp(25), dp(120)]
-        else:
-            return [dp(30), dp(40), dp(30), dp(140)]
+        return ResponsiveUtils.get_metrics().padding
     
     @staticmethod
     def get_responsive_spacing():
         """Get responsive spacing based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type in ['mobile', 'rpi_small']:
-            return dp(10)
-        elif screen_type in ['tablet', 'rpi_medium']:
-            return dp(15)
-        elif screen_type == 'rpi_large':
-            return dp(18)
-        else:
-            return dp(25)
+        return ResponsiveUtils.get_metrics().spacing
     
     @staticmethod
     def get_responsive_font_size(base_size):
         """Get responsive font size based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type in ['mobile', 'rpi_small']:
-            return sp(base_size * 0.7)
-        elif screen_type in ['tablet', 'rpi_medium']:
-            return sp(base_size * 0.8)
-        elif screen_type == 'rpi_large':
-            return sp(base_size * 0.85)
-        else:
-            return sp(base_size)
+        return sp(base_size * ResponsiveUtils.get_metrics().font_scale)
     
     @staticmethod
     def get_responsive_button_height():
         """Get responsive button height based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type in ['mobile', 'rpi_small']:
-            return dp(50)
-        elif screen_type in ['tablet', 'rpi_medium']:
-            return dp(60)
-        elif screen_type == 'rpi_large':
-            return dp(65)
-        else:
-            return dp(80)
+        return ResponsiveUtils.get_metrics().button_height
     
     @staticmethod
     def get_responsive_card_padding():
         """Get responsive card padding based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type == 'mobile':
-            return dp(15)
-        elif screen_type == 'tablet':
-            return dp(18)
-        else:
-            return dp(20)
+        return ResponsiveUtils.get_metrics().card_padding
     
     @staticmethod
     def get_grid_cols():
         """Get responsive grid columns based on screen size"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        width = Window.width
-        
-        if screen_type == 'mobile':
-            return 1 if ResponsiveUtils.is_portrait() else 2
-        elif screen_type == 'tablet':
-            return 2 if ResponsiveUtils.is_portrait() else 3
-        else:
-            return 2 if ResponsiveUtils.is_portrait() else 3
+        return ResponsiveUtils.get_metrics().grid_cols
     
     @staticmethod
     def get_bottom_menu_height():
         """Get responsive bottom menu height"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        if screen_type in ['mobile', 'rpi_small']:
-            return dp(80)
-        elif screen_type in ['tablet', 'rpi_medium']:
-            return dp(85)
-        elif screen_type == 'rpi_large':
-            return dp(90)
-        else:
-            return dp(100)
+        return ResponsiveUtils.get_metrics().bottom_menu_height
     
     @staticmethod
     def get_touch_target_size():
         """Get minimum touch target size for different platforms"""
-        screen_type = ResponsiveUtils.get_screen_type()
-        system_info = PlatformConfig.get_system_info()
-        
-        if system_info.get('is_raspberry_pi', False):
-            # Raspberry Pi touchscreens need larger touch targets
-            return dp(60)
-        elif screen_type in ['mobile', 'rpi_small']:
-            return dp(44)  # iOS/Android standard
-        else:
-            return dp(40)
+        return ResponsiveUtils.get_metrics().touch_target_size
     
     @staticmethod
     def is_raspberry_pi_optimized():
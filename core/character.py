@@ -0,0 +1,356 @@
+"""
+Character State
+Pure-Python character sheet and its rules, shared by the Kivy app and the Qt CharacterModel
+
+Abilities and damage thresholds are fixed-index array vectors rather than
+dicts, and a sheet serialises to a small versioned binary snapshot.
+"""
+
+import struct
+from array import array
+from collections.abc import MutableMapping
+
+DEFAULT_ABILITIES = {
+    "Fuerza": 2,
+    "Destreza": 1,
+    "Carisma": 0,
+    "Constitución": 1,
+    "Sabiduría": 0,
+    "Inteligencia": -1
+}
+
+DEFAULT_THRESHOLDS = {
+    "minor": 10,
+    "major": 16,
+    "severe": 22
+}
+
+# Fixed vector index of every ability and threshold
+ABILITY_NAMES = tuple(DEFAULT_ABILITIES)
+THRESHOLD_NAMES = tuple(DEFAULT_THRESHOLDS)
+
+# Every numeric field is stored as a 32-bit signed int; setters reject
+# values outside this range with ValueError
+SCORE_MIN = -2**31
+SCORE_MAX = 2**31 - 1
+
+# Binary snapshot: magic, version, level, experience, hp current/max,
+# armor, hope, fear, abilities, thresholds, then name and class as
+# length-prefixed UTF-8
+SNAPSHOT_MAGIC = b'DHC'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct(f'<3sB7i{len(ABILITY_NAMES)}i{len(THRESHOLD_NAMES)}iII')
+
+# CharacterState fields holding a number
+_NUMERIC_FIELDS = frozenset(('level', 'experience', 'hp_current', 'hp_max', 'armor', 'hope', 'fear'))
+
+
+def _checked(field, value):
+    """value, if it fits a 32-bit score field; ValueError otherwise"""
+    if not SCORE_MIN <= value <= SCORE_MAX:
+        raise ValueError(f"{field} must be between {SCORE_MIN} and {SCORE_MAX}, not {value}")
+    return value
+
+
+def hp_marked(damage, minor, major, severe):
+    """HP marked by a hit: 3 at severe, 2 at major, 1 at minor, 0 below minor"""
+    if damage >= severe:
+        return 3
+    elif damage >= major:
+        return 2
+    elif damage >= minor:
+        return 1
+    else:
+        return 0
+
+
+class ScoreVector(MutableMapping):
+    """Name -> int mapping over a fixed name index, stored as one array
+
+    Reads like the dicts it replaces (v["Fuerza"], dict(v), v == {...})
+    but copies and comparisons are array operations, and unknown names
+    cannot be added.
+    """
+
+    __slots__ = ('names', '_index', 'values')
+
+    def __init__(self, names, typecode, values):
+        self.names = names
+        self._index = _name_index(names)
+        self.values = array(typecode, values)
+
+    def __getitem__(self, name):
+        return self.values[self._index[name]]
+
+    def __setitem__(self, name, value):
+        self.values[self._index[name]] = _checked(name, value)
+
+    def __delitem__(self, name):
+        raise TypeError("ScoreVector names are fixed")
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __eq__(self, other):
+        if isinstance(other, ScoreVector):
+            return self.names == other.names and self.values == other.values
+        return MutableMapping.__eq__(self, other)
+
+    def __repr__(self):
+        return f"ScoreVector({dict(self)!r})"
+
+    def copy(self):
+        vector = ScoreVector.__new__(ScoreVector)
+        vector.names = self.names
+        vector._index = self._index
+        vector.values = array(self.values.typecode, self.values)
+        return vector
+
+
+_name_indexes = {}
+
+
+def _name_index(names):
+    """Shared name -> position dict per name tuple"""
+    index = _name_indexes.get(names)
+    if index is None:
+        index = _name_indexes[names] = {name: i for i, name in enumerate(names)}
+    return index
+
+
+class CharacterState:
+    """Character sheet with clamping rules
+
+    Every setter returns True only when the stored value actually changed,
+    so wrappers can emit change notifications without echoes.  The Kivy
+    app reads it through CharacterSheet.
+    """
+
+    __slots__ = ('name', 'class_name', 'level', 'experience', 'hp_current', 'hp_max',
+                 'armor', 'hope', 'fear', 'abilities', 'thresholds')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset to the default character"""
+        self.name = "Mi Personaje"
+        self.class_name = "Guerrero"
+        self.level = 1
+        self.experience = 0
+        self.hp_current = 30
+        self.hp_max = 30
+        self.armor = 2
+        self.hope = 1
+        self.fear = 0
+        self.abilities = ScoreVector(ABILITY_NAMES, 'i', DEFAULT_ABILITIES.values())
+        self.thresholds = ScoreVector(THRESHOLD_NAMES, 'i', DEFAULT_THRESHOLDS.values())
+
+    def copy(self):
+        """Independent copy of this state"""
+        other = CharacterState.__new__(CharacterState)
+        for field in self.__slots__:
+            setattr(other, field, getattr(self, field))
+        other.abilities = self.abilities.copy()
+        other.thresholds = self.thresholds.copy()
+        return other
+
+    def __eq__(self, other):
+        if not isinstance(other, CharacterState):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def _assign(self, field, value):
+        if field in _NUMERIC_FIELDS:
+            _checked(field, value)
+        if getattr(self, field) == value:
+            return False
+        setattr(self, field, value)
+        return True
+
+    def restore(self, field, value):
+        """Store a value exactly as previously held, bypassing clamps (for undo)"""
+        return self._assign(field, value)
+
+    def set_name(self, value):
+        return self._assign('name', value)
+
+    def set_class_name(self, value):
+        return self._assign('class_name', value)
+
+    def set_level(self, value):
+        return self._assign('level', value)
+
+    def clamped(self, field, value):
+        """Value a setter would actually store for field"""
+        if field == 'hp_current':
+            return max(0, min(self.hp_max, value))
+        if field in ('hope', 'fear'):
+            return max(0, value)
+        return value
+
+    def set_hp_current(self, value):
+        return self._assign('hp_current', self.clamped('hp_current', value))
+
+    def set_hp_max(self, value):
+        return self._assign('hp_max', value)
+
+    def set_armor(self, value):
+        return self._assign('armor', value)
+
+    def set_hope(self, value):
+        return self._assign('hope', self.clamped('hope', value))
+
+    def set_fear(self, value):
+        return self._assign('fear', self.clamped('fear', value))
+
+    def set_ability(self, ability_name, value):
+        if ability_name not in self.abilities or self.abilities[ability_name] == _checked(ability_name, value):
+            return False
+        self.abilities[ability_name] = value
+        return True
+
+    def get_ability(self, ability_name):
+        return self.abilities.get(ability_name, 0)
+
+    def get_threshold(self, threshold_type):
+        return self.thresholds.get(threshold_type, 0)
+
+    def take_damage(self, damage, use_armor=True):
+        """Mark HP for a hit against the thresholds, spending armor to reduce it by one step
+
+        Returns the HP actually marked.
+        """
+        marked = hp_marked(damage, *self.thresholds.values)
+        if use_armor and marked and self.armor > 0:
+            self.armor -= 1
+            marked -= 1
+        before = self.hp_current
+        self.set_hp_current(self.hp_current - marked)
+        return before - self.hp_current
+
+    @property
+    def is_down(self):
+        return self.hp_current <= 0
+
+    # Binary snapshot
+    def to_bytes(self):
+        """Versioned binary snapshot of the sheet"""
+        name = self.name.encode('utf-8')
+        class_name = self.class_name.encode('utf-8')
+        header = _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.level, self.experience, self.hp_current,
+            self.hp_max, self.armor, self.hope, self.fear, *self.abilities.values,
+            *self.thresholds.values, len(name), len(class_name))
+        return header + name + class_name
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a sheet from to_bytes() output"""
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Character snapshot is truncated")
+        fields = _SNAPSHOT_HEADER.unpack_from(data)
+        magic, version = fields[0], fields[1]
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a character snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported character snapshot version {version}")
+
+        state = cls.__new__(cls)
+        (state.level, state.experience, state.hp_current, state.hp_max,
+         state.armor, state.hope, state.fear) = fields[2:9]
+        abilities_end = 9 + len(ABILITY_NAMES)
+        state.abilities = ScoreVector(ABILITY_NAMES, 'i', fields[9:abilities_end])
+        state.thresholds = ScoreVector(THRESHOLD_NAMES, 'i', fields[abilities_end:-2])
+
+        name_length, class_length = fields[-2:]
+        offset = _SNAPSHOT_HEADER.size
+        if len(data) < offset + name_length + class_length:
+            raise ValueError("Character snapshot is truncated")
+        state.name = data[offset:offset + name_length].decode('utf-8')
+        state.class_name = data[offset + name_length:offset + name_length + class_length].decode('utf-8')
+        return state
+
+    def __reduce__(self):
+        # Pickle (e.g. to simulator worker processes) through the compact snapshot
+        return (CharacterState.from_bytes, (self.to_bytes(),))
+
+
+class CharacterSheet(MutableMapping):
+    """The Kivy app's character dict, backed by a CharacterState
+
+    Sheet keys (character['class'], ['abilities'], ...) read and write the
+    state's fields; any other key is kept alongside, as in a plain dict.
+    Sheet fields cannot be deleted.  to_dict() gives plain dicts all the
+    way down, for JSON.
+    """
+
+    __slots__ = ('state', 'extra')
+
+    # Sheet key -> CharacterState field
+    FIELDS = {
+        'name': 'name',
+        'class': 'class_name',
+        'level': 'level',
+        'experience': 'experience',
+        'hp_max': 'hp_max',
+        'hp_current': 'hp_current',
+        'armor': 'armor',
+        'hope': 'hope',
+        'fear': 'fear',
+        'abilities': 'abilities',
+        'thresholds': 'thresholds'
+    }
+
+    def __init__(self, state=None, **extra):
+        self.state = state if state is not None else CharacterState()
+        self.extra = {}
+        self.update(extra)
+
+    def __getitem__(self, key):
+        field = self.FIELDS.get(key)
+        if field is None:
+            return self.extra[key]
+        return getattr(self.state, field)
+
+    def __setitem__(self, key, value):
+        field = self.FIELDS.get(key)
+        if field is None:
+            self.extra[key] = value
+        elif field in ('abilities', 'thresholds'):
+            getattr(self.state, field).update(value)
+        elif field in _NUMERIC_FIELDS:
+            setattr(self.state, field, _checked(key, value))
+        else:
+            setattr(self.state, field, value)
+
+    def __delitem__(self, key):
+        if key in self.FIELDS:
+            raise TypeError(f"Character sheet field {key!r} cannot be deleted")
+        del self.extra[key]
+
+    def __contains__(self, key):
+        return key in self.FIELDS or key in self.extra
+
+    def __iter__(self):
+        yield from self.FIELDS
+        yield from self.extra
+
+    def __len__(self):
+        return len(self.FIELDS) + len(self.extra)
+
+    def __repr__(self):
+        return f"CharacterSheet({self.to_dict()!r})"
+
+    def to_dict(self):
+        """Plain dict copy of the sheet (abilities and thresholds as dicts)"""
+        data = dict(self.items())
+        data['abilities'] = dict(self.state.abilities)
+        data['thresholds'] = dict(self.state.thresholds)
+        return data
@@ -0,0 +1,190 @@
+"""
+Combat Tracker
+Spotlight queue and per-combatant HP, Stress and thresholds for large encounters
+
+Combatant state lives in parallel array columns indexed by row, so a boss
+fight with dozens of minions is a handful of small arrays, and damage
+against many combatants resolves everyone's thresholds in one pass.
+Every mutator returns the rows it actually changed, so views can refresh
+just those rows.
+"""
+
+from array import array
+
+from core.encounter import DEFAULT_ADVERSARY
+
+# Combatant kinds, indexed by kind code
+KINDS = ("pc", "adversary", "minion")
+
+DEFAULT_THRESHOLDS = DEFAULT_ADVERSARY["thresholds"]
+
+# Largest HP, Stress or threshold a column holds (array 'i')
+MAX_VALUE = 2**31 - 1
+
+
+class CombatTracker:
+    """Combatants as array columns plus the spotlight
+
+    hp and stress count what is left, like CharacterState.hp_current.
+    Minions are defeated by any damage that marks HP.
+    """
+
+    _COLUMNS = ('kinds', 'hp', 'hp_max', 'stress', 'stress_max', 'minor', 'major', 'severe')
+
+    def __init__(self):
+        self.names = []
+        self.kinds = array('b')
+        self.hp = array('i')
+        self.hp_max = array('i')
+        self.stress = array('i')
+        self.stress_max = array('i')
+        self.minor = array('i')
+        self.major = array('i')
+        self.severe = array('i')
+        self.spotlight = -1  # row holding the spotlight, -1 before the first turn
+        self.round = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    # Roster
+    @staticmethod
+    def validate(hp, thresholds=DEFAULT_THRESHOLDS, stress=0, kind="adversary"):
+        """Raise ValueError unless a combatant with these stats fits the columns"""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown combatant kind {kind!r}")
+        if len(thresholds) != 3:
+            raise ValueError("Thresholds must be (minor, major, severe)")
+        for value in (hp, stress, *thresholds):
+            if not 0 <= value <= MAX_VALUE:
+                raise ValueError(f"Combat values must be between 0 and {MAX_VALUE}, got {value}")
+
+    def add(self, name, hp, thresholds=DEFAULT_THRESHOLDS, stress=0, kind="adversary"):
+        """Add a combatant at full HP and Stress and return its row"""
+        self.validate(hp, thresholds, stress, kind)
+        minor, major, severe = thresholds
+        self.names.append(name)
+        self.kinds.append(KINDS.index(kind))
+        self.hp.append(hp)
+        self.hp_max.append(hp)
+        self.stress.append(stress)
+        self.stress_max.append(stress)
+        self.minor.append(minor)
+        self.major.append(major)
+        self.severe.append(severe)
+        return len(self.names) - 1
+
+    def add_many(self, name, count, hp, thresholds=DEFAULT_THRESHOLDS, stress=0, kind="minion"):
+        """Add count numbered copies of a combatant and return their rows"""
+        self.validate(hp, thresholds, stress, kind)
+        first = len(self.names)
+        minor, major, severe = thresholds
+        self.names.extend(f"{name} {i}" for i in range(1, count + 1))
+        self.kinds.extend([KINDS.index(kind)] * count)
+        for column, value in ((self.hp, hp), (self.hp_max, hp), (self.stress, stress),
+                              (self.stress_max, stress), (self.minor, minor),
+                              (self.major, major), (self.severe, severe)):
+            column.extend([value] * count)
+        return range(first, first + count)
+
+    def remove(self, row):
+        """Remove one combatant; later rows move up by one"""
+        del self.names[row]
+        for column in self._COLUMNS:
+            del getattr(self, column)[row]
+        if self.spotlight == row:
+            self.spotlight = -1
+        elif self.spotlight > row:
+            self.spotlight -= 1
+
+    def clear(self):
+        self.__init__()
+
+    def row(self, row):
+        """One combatant as a plain dict"""
+        return {
+            "name": self.names[row],
+            "kind": KINDS[self.kinds[row]],
+            "hp": self.hp[row],
+            "hpMax": self.hp_max[row],
+            "stress": self.stress[row],
+            "stressMax": self.stress_max[row],
+            "thresholds": [self.minor[row], self.major[row], self.severe[row]],
+            "defeated": self.hp[row] <= 0,
+            "spotlight": row == self.spotlight,
+        }
+
+    def defeated(self, row):
+        return self.hp[row] <= 0
+
+    # Damage
+    def resolve(self, rows, damage):
+        """HP each row would mark for damage (one value, or one per row), without applying it"""
+        if isinstance(damage, int):
+            damage = [damage] * len(rows)
+        minor, major, severe, kinds, hp = self.minor, self.major, self.severe, self.kinds, self.hp
+        minion = KINDS.index("minion")
+        marked = array('i', bytes(4 * len(rows)))
+        for i, row in enumerate(rows):
+            amount = damage[i]
+            if amount >= severe[row]:
+                marks = 3
+            elif amount >= major[row]:
+                marks = 2
+            elif amount >= minor[row]:
+                marks = 1
+            else:
+                continue
+            marked[i] = hp[row] if kinds[row] == minion else marks
+        return marked
+
+    def apply_damage(self, rows, damage):
+        """Mark HP on every row for damage (one value, or one per row); returns the rows changed"""
+        rows = list(rows)
+        hp = self.hp
+        changed = []
+        for row, marks in zip(rows, self.resolve(rows, damage)):
+            if marks and hp[row] > 0:
+                hp[row] = max(0, hp[row] - marks)
+                changed.append(row)
+        return changed
+
+    def heal(self, rows, amount=1):
+        """Clear up to amount marked HP on each row; returns the rows changed"""
+        return self._adjust(self.hp, self.hp_max, rows, amount)
+
+    def mark_stress(self, rows, amount=1):
+        """Mark amount Stress (negative clears it) on each row; returns the rows changed"""
+        return self._adjust(self.stress, self.stress_max, rows, -amount)
+
+    def _adjust(self, column, maximum, rows, delta):
+        changed = []
+        for row in rows:
+            value = max(0, min(maximum[row], column[row] + delta))
+            if value != column[row]:
+                column[row] = value
+                changed.append(row)
+        return changed
+
+    # Spotlight
+    def set_spotlight(self, row):
+        """Give the spotlight to row (-1 for nobody); returns (previous row, row)"""
+        previous = self.spotlight
+        self.spotlight = row if 0 <= row < len(self.names) else -1
+        return previous, self.spotlight
+
+    def next_turn(self):
+        """Pass the spotlight to the next combatant still standing, counting rounds
+
+        Returns (previous row, new row); the new row is -1 when everyone is
+        defeated.
+        """
+        n = len(self.names)
+        start = self.spotlight
+        for step in range(1, n + 1):
+            row = (start + step) % n
+            if self.hp[row] > 0:
+                if start < 0 or row <= start:
+                    self.round += 1
+                return self.set_spotlight(row)
+        return self.set_spotlight(-1)
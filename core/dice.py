@@ -0,0 +1,367 @@
+"""
+Dice Engine
+Pure-Python dice mechanics shared by the Qt models and batch tools
+"""
+
+import operator
+import random
+from array import array
+from collections import namedtuple
+from math import floor, lgamma, log, sqrt
+
+# Dice rolled per roll type and whether the two highest (True) or the
+# two lowest (False) are kept
+ROLL_TYPES = {
+    "Normal": (2, True),
+    "Ventaja": (3, True),
+    "Desventaja": (3, False),
+    "Doble Ventaja": (4, True),
+    "Triple Ventaja": (5, True),
+}
+
+# Result categories, indexed by result code
+RESULT_TYPES = ("failure", "minor_success", "major_success", "critical_success")
+
+# Minimum total for minor, major and critical success
+RESULT_THRESHOLDS = (10, 16, 22)
+
+DIE_FACES = range(1, 13)
+
+# Custom rolls of more dice than this many per face are tallied, not rolled
+AGGREGATE_DICE_PER_FACE = 8
+
+
+def roll_spec(roll_type):
+    """Get (dice rolled, keep highest) for a roll type, Normal if unknown"""
+    return ROLL_TYPES.get(roll_type, ROLL_TYPES["Normal"])
+
+
+def result_code(total):
+    """Index into RESULT_TYPES for a roll total"""
+    minor, major, critical = RESULT_THRESHOLDS
+    if total >= critical:
+        return 3
+    elif total >= major:
+        return 2
+    elif total >= minor:
+        return 1
+    else:
+        return 0
+
+
+def determine_result_type(total):
+    """Determine the type of result based on total"""
+    return RESULT_TYPES[result_code(total)]
+
+
+def draw_dice(rng, die_size, k):
+    """k rolls of a die_size-sided die, in bulk when rng is a core.rng.DiceStream"""
+    # A missed attribute lookup on the random module itself costs more than the roll
+    bulk = None if rng is random else getattr(rng, 'dice', None)
+    if bulk is not None:
+        return bulk(die_size, k)
+    return rng.choices(DIE_FACES if die_size == 12 else range(1, die_size + 1), k=k)
+
+
+def keep_two(rolls, keep_highest):
+    """Kept pair of a roll by partial selection: highest first, or lowest first"""
+    if keep_highest:
+        first = second = 0
+        for value in rolls:
+            if value > first:
+                first, second = value, first
+            elif value > second:
+                second = value
+    else:
+        first = second = 13
+        for value in rolls:
+            if value < first:
+                first, second = value, first
+            elif value < second:
+                second = value
+    return [first, second]
+
+
+def roll_dice(roll_type, rng=random):
+    """Calculate dice results based on roll type"""
+    num_dice, keep_highest = roll_spec(roll_type)
+    rolls = draw_dice(rng, 12, num_dice)
+    if num_dice == 2:
+        return rolls
+    return keep_two(rolls, keep_highest)
+
+
+def roll_ability(roll_type, modifier, rng=random):
+    """Roll an ability check, returning (dice, total, result_type)"""
+    dice = roll_dice(roll_type, rng)
+    total = dice[0] + dice[1] + modifier
+    return dice, total, determine_result_type(total)
+
+
+def roll_custom(num_dice, die_size, rng=random):
+    """Roll num_dice dice of die_size sides, returning (dice, total)"""
+    results = draw_dice(rng, die_size, max(0, num_dice))
+    return results, sum(results)
+
+
+def binomial(rng, n, p):
+    """Successes in n trials of probability p, in O(1) expected time
+
+    Small means use geometric skips; larger ones use Hormann's BTRS
+    transformed rejection sampler.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(rng, n, 1.0 - p)
+
+    if n * p < 10.0:
+        c = log(1.0 - p)
+        x = y = 0
+        while True:
+            y += floor(log(1.0 - rng.random()) / c) + 1
+            if y > n:
+                return x
+            x += 1
+
+    spq = sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    vr = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = log(p / (1.0 - p))
+    m = floor((n + 1) * p)
+    h = lgamma(m + 1) + lgamma(n - m + 1)
+    while True:
+        u = rng.random() - 0.5
+        us = 0.5 - abs(u)
+        if us <= 0.0:
+            continue
+        v = rng.random()
+        k = floor((2.0 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+        if us >= 0.07 and v <= vr:
+            return k
+        if log(v * alpha / (a / (us * us) + b)) <= h - lgamma(k + 1) - lgamma(n - k + 1) + (k - m) * lpq:
+            return k
+
+
+def tally_dice(rng, die_size, n):
+    """How many of n fair die_size-sided dice show each face, in O(die_size)
+
+    Draws the multinomial as a chain of conditional binomials.
+    """
+    counts = array('q', bytes(8 * die_size))
+    remaining = n
+    for face in range(die_size - 1):
+        if not remaining:
+            break
+        counts[face] = binomial(rng, remaining, 1.0 / (die_size - face))
+        remaining -= counts[face]
+    counts[die_size - 1] += remaining
+    return counts
+
+
+class DiceTally(namedtuple("DiceTally", "die_size counts seed rolled")):
+    """Aggregate result of a custom roll
+
+    counts[f - 1] is the number of dice showing f.  Large rolls are only
+    tallied (rolled is None); their individual dice are materialised on
+    request from seed, as a random order of exactly these counts.
+    """
+
+    __slots__ = ()
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def total(self):
+        return sum(face * count for face, count in enumerate(self.counts, 1))
+
+    def mean(self):
+        """Average die, 0.0 for no dice"""
+        n = len(self)
+        return self.total() / n if n else 0.0
+
+    def stdev(self):
+        """Population standard deviation of the dice"""
+        n = len(self)
+        if not n:
+            return 0.0
+        mean = self.total() / n
+        return sqrt(sum(count * (face - mean) ** 2 for face, count in enumerate(self.counts, 1)) / n)
+
+    def minimum(self):
+        return next((face for face, count in enumerate(self.counts, 1) if count), 0)
+
+    def maximum(self):
+        return next((self.die_size - i for i, count in enumerate(reversed(self.counts)) if count), 0)
+
+    def dice(self, limit=None):
+        """The first limit dice (all when None); the same prefix on every call"""
+        n = len(self)
+        k = n if limit is None else max(0, min(int(limit), n))
+        if self.rolled is not None:
+            return list(self.rolled[:k])
+
+        # Draw without replacement from the tally
+        rng = random.Random(self.seed)
+        remaining = list(self.counts)
+        left = n
+        dice = []
+        for _ in range(k):
+            r = rng.randrange(left)
+            face = 0
+            while r >= remaining[face]:
+                r -= remaining[face]
+                face += 1
+            remaining[face] -= 1
+            left -= 1
+            dice.append(face + 1)
+        return dice
+
+    def summary(self):
+        """Plain dict summary suitable for QML"""
+        return {
+            "dieSize": self.die_size,
+            "count": len(self),
+            "total": self.total(),
+            "mean": self.mean(),
+            "stdev": self.stdev(),
+            "min": self.minimum(),
+            "max": self.maximum(),
+            "histogram": list(self.counts),
+        }
+
+
+def roll_tally(num_dice, die_size, rng=random):
+    """Roll num_dice dice of die_size sides as a DiceTally
+
+    Time and memory depend only on die_size once there are more than
+    AGGREGATE_DICE_PER_FACE dice per face.
+    """
+    if die_size < 1:
+        raise ValueError(f"Invalid die size: {die_size}")
+    n = max(0, int(num_dice))
+    if n <= AGGREGATE_DICE_PER_FACE * die_size:
+        rolled = draw_dice(rng, die_size, n)
+        counts = array('q', bytes(8 * die_size))
+        for value in rolled:
+            counts[value - 1] += 1
+        return DiceTally(die_size, counts, None, rolled)
+    counts = tally_dice(rng, die_size, n)
+    return DiceTally(die_size, counts, rng.getrandbits(64), None)
+
+
+class BatchResult(namedtuple("BatchResult", "roll_type modifier high low totals codes")):
+    """Columnar result of a batch roll
+
+    high/low hold the two kept dice, totals include the modifier and
+    codes index RESULT_TYPES.  All four are compact array.array columns.
+    """
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.totals)
+
+    def result_types(self):
+        """Result type name for every roll in the batch"""
+        return [RESULT_TYPES[code] for code in self.codes]
+
+    def counts(self):
+        """Number of rolls per result type"""
+        tally = [0] * len(RESULT_TYPES)
+        for code in self.codes:
+            tally[code] += 1
+        return dict(zip(RESULT_TYPES, tally))
+
+    def mean(self):
+        """Average total, 0.0 for an empty batch"""
+        return sum(self.totals) / len(self.totals) if self.totals else 0.0
+
+    def summary(self):
+        """Plain dict summary suitable for QML"""
+        return {
+            "rollType": self.roll_type,
+            "modifier": self.modifier,
+            "count": len(self.totals),
+            "mean": self.mean(),
+            "counts": self.counts(),
+        }
+
+
+# Modifiers whose totals (2..24 plus the modifier) fit a batch's 'i' column
+MIN_BATCH_MODIFIER = -2**31 - 2
+MAX_BATCH_MODIFIER = 2**31 - 1 - 24
+
+
+def batch_modifier(modifier):
+    """modifier as an int, if every batch total with it fits the totals column
+
+    Raises TypeError for a non-integer and ValueError when out of range.
+    """
+    modifier = operator.index(modifier)
+    if not MIN_BATCH_MODIFIER <= modifier <= MAX_BATCH_MODIFIER:
+        raise ValueError(f"Batch modifier {modifier} does not fit a 32-bit total")
+    return modifier
+
+
+def roll_batch(roll_type, modifier, n, rng=random):
+    """Roll n ability checks of the same roll type at once
+
+    All d12s for the batch are drawn in a single bulk call and the kept pair is
+    found with a single pass over each group instead of sorting it.  The
+    columns are array.array rather than NumPy arrays, which keeps the
+    tracker free of third-party dependencies; totals are 32-bit, so the
+    modifier must be an integer from MIN_BATCH_MODIFIER to MAX_BATCH_MODIFIER.
+    """
+    modifier = batch_modifier(modifier)
+    num_dice, keep_highest = roll_spec(roll_type)
+    n = max(0, int(n))
+    rolls = draw_dice(rng, 12, n * num_dice)
+
+    high = array('b', bytes(n))
+    low = array('b', bytes(n))
+
+    if num_dice == 2:
+        for i in range(n):
+            a = rolls[2 * i]
+            b = rolls[2 * i + 1]
+            if a >= b:
+                high[i], low[i] = a, b
+            else:
+                high[i], low[i] = b, a
+    elif keep_highest:
+        for i in range(n):
+            first = second = 0
+            for value in rolls[i * num_dice:(i + 1) * num_dice]:
+                if value > first:
+                    first, second = value, first
+                elif value > second:
+                    second = value
+            high[i], low[i] = first, second
+    else:
+        for i in range(n):
+            first = second = 13
+            for value in rolls[i * num_dice:(i + 1) * num_dice]:
+                if value < first:
+                    first, second = value, first
+                elif value < second:
+                    second = value
+            high[i], low[i] = second, first
+
+    # Dice sums only span 2..24, so classify through a lookup table
+    code_by_sum = [result_code(s + modifier) for s in range(25)]
+    totals = array('i', bytes(4 * n))
+    codes = array('b', bytes(n))
+    for i in range(n):
+        dice_sum = high[i] + low[i]
+        totals[i] = dice_sum + modifier
+        codes[i] = code_by_sum[dice_sum]
+
+    return BatchResult(roll_type, modifier, high, low, totals, codes)
@@ -0,0 +1,106 @@
+"""
+Encounter Simulation
+Headless one-on-one combat between a character and an adversary
+
+Each round the character makes an ability roll against the adversary's
+difficulty; any success hits and gains 1 Hope, a failure gives the GM
+1 Fear.  With Hope to spare the character spends 1 Hope to attack with
+Ventaja.  The adversary then attacks with d20 + attack against the
+character's evasion, spending 3 Fear for an extra attack when it can.
+Damage marks HP against the target's minor/major/severe thresholds.
+"""
+
+import random
+
+from core.character import CharacterState, hp_marked
+from core.dice import draw_dice, roll_ability
+from core.expression import compile_expression
+
+DEFAULT_ADVERSARY = {
+    "name": "Adversario",
+    "hp": 10,
+    "difficulty": 14,
+    "attack": 3,
+    "damage": "3d8+4",
+    "thresholds": (1, 8, 15),
+}
+
+DEFAULT_WEAPON = "1d8+2"
+
+EXTRA_ATTACK_FEAR = 3
+
+
+def run_encounter(character=None, adversary=None, ability="Fuerza", weapon=DEFAULT_WEAPON,
+                  evasion=10, spend_hope=True, max_rounds=100, rng=random):
+    """Fight one encounter to the end and return a result dict
+
+    The character state is copied, so the same sheet can be reused for
+    every trial.
+    """
+    pc = character.copy() if character is not None else CharacterState()
+    foe = dict(DEFAULT_ADVERSARY, **(adversary or {}))
+    foe_hp = foe["hp"]
+    foe_minor, foe_major, foe_severe = foe["thresholds"]
+    foe_damage = compile_expression(foe["damage"])
+    pc_damage = compile_expression(weapon)
+    modifier = pc.get_ability(ability)
+
+    hope_gained = fear_gained = hope_spent = fear_spent = 0
+    hits = attacks = 0
+    rounds = 0
+    while rounds < max_rounds and foe_hp > 0 and not pc.is_down:
+        rounds += 1
+
+        # Character's turn
+        roll_type = "Normal"
+        if spend_hope and pc.hope > 0:
+            pc.set_hope(pc.hope - 1)
+            hope_spent += 1
+            roll_type = "Ventaja"
+        dice, total, result_type = roll_ability(roll_type, modifier, rng)
+        attacks += 1
+        if result_type != "failure":
+            pc.set_hope(pc.hope + 1)
+            hope_gained += 1
+            if total >= foe["difficulty"]:
+                hits += 1
+                damage = pc_damage.total(rng)
+                foe_hp -= hp_marked(damage, foe_minor, foe_major, foe_severe)
+        else:
+            pc.set_fear(pc.fear + 1)
+            fear_gained += 1
+        if foe_hp <= 0:
+            break
+
+        # Adversary's turn, with an extra attack bought with Fear
+        adversary_attacks = 1
+        if pc.fear >= EXTRA_ATTACK_FEAR:
+            pc.set_fear(pc.fear - EXTRA_ATTACK_FEAR)
+            fear_spent += EXTRA_ATTACK_FEAR
+            adversary_attacks += 1
+        for _ in range(adversary_attacks):
+            if draw_dice(rng, 20, 1)[0] + foe["attack"] >= evasion:
+                pc.take_damage(foe_damage.total(rng))
+
+    if foe_hp <= 0:
+        winner = "character"
+    elif pc.is_down:
+        winner = "adversary"
+    else:
+        winner = "timeout"
+
+    return {
+        "winner": winner,
+        "rounds": rounds,
+        "hp_left": pc.hp_current,
+        "armor_left": pc.armor,
+        "adversary_hp_left": max(0, foe_hp),
+        "hits": hits,
+        "attacks": attacks,
+        "hope": pc.hope,
+        "fear": pc.fear,
+        "hope_gained": hope_gained,
+        "hope_spent": hope_spent,
+        "fear_gained": fear_gained,
+        "fear_spent": fear_spent,
+    }
@@ -0,0 +1,307 @@
+"""
+Dice Expressions
+Parse-once, cached evaluators for dice expressions such as "2d8+1d6+3"
+
+Grammar (case and spaces ignored), terms joined by + or -:
+
+    NdS      N dice of S sides (N defaults to 1, d% is d100)
+    NdS!     exploding: a die showing S is rolled again and added
+    NdSkhK   keep the K highest (k is short for kh, K defaults to 1)
+    NdSklK   keep the K lowest
+    adv/dis  Daggerheart advantage/disadvantage die (+1d6 / -1d6)
+    K        flat modifier
+
+compile_expression() caches one DiceExpression per string, which rolls
+single results, samples totals in bulk and computes the exact total
+distribution.
+"""
+
+import random
+import re
+from array import array
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import comb, prod
+
+from core.dice import draw_dice
+from core.probability import multiset_weight
+
+# Extra dice one exploding die may add; bounds rolls and distributions alike
+EXPLODE_LIMIT = 20
+
+# Sorted outcomes enumerated for one keep-highest/lowest term's distribution
+MAX_KEEP_OUTCOMES = 1_000_000
+
+# Weight pairs multiplied while convolving an exact distribution (a few
+# tenths of a second at most); larger expressions have to be sampled
+MAX_CONVOLUTION_PAIRS = 250_000
+
+_TERM = re.compile(r"""\s*(?P<sign>[+-])?\s*(?:
+    (?P<count>\d*)d(?P<sides>\d+|%)(?P<explode>!)?(?:(?P<keep>kh|kl|k)(?P<keep_n>\d*))?
+    |(?P<advantage>adv|dis)
+    |(?P<number>\d+)
+)\s*""", re.IGNORECASE | re.VERBOSE)
+
+
+class DiceTerm(namedtuple("DiceTerm", "sign count sides keep keep_highest explode")):
+    """One group of dice: sign is +1/-1, keep is None to keep every die"""
+
+    __slots__ = ()
+
+    @property
+    def plain(self):
+        return self.keep is None and not self.explode
+
+
+def parse_expression(text):
+    """Parse an expression into (terms, constant); raises ValueError if invalid"""
+    terms = []
+    constant = 0
+    pos = 0
+    while pos == 0 or pos < len(text):
+        match = _TERM.match(text, pos)
+        if not match or match.end() == pos or (pos and match['sign'] is None):
+            raise ValueError(f"Invalid dice expression: {text!r}")
+        pos = match.end()
+        sign = -1 if match['sign'] == '-' else 1
+
+        if match['number'] is not None:
+            constant += sign * int(match['number'])
+            continue
+        if match['advantage'] is not None:
+            if match['advantage'].lower() == 'dis':
+                sign = -sign
+            terms.append(DiceTerm(sign, 1, 6, None, True, False))
+            continue
+
+        count = int(match['count'] or 1)
+        sides = 100 if match['sides'] == '%' else int(match['sides'])
+        explode = match['explode'] is not None
+        keep = None
+        keep_highest = True
+        if match['keep']:
+            keep = int(match['keep_n'] or 1)
+            keep_highest = match['keep'].lower() != 'kl'
+            if not 1 <= keep <= count:
+                raise ValueError(f"Cannot keep {keep} of {count} dice in {text!r}")
+            if keep == count:
+                keep = None
+        if count < 1 or sides < 1:
+            raise ValueError(f"Invalid dice group in {text!r}")
+        if explode and sides < 2:
+            raise ValueError(f"A d{sides} cannot explode in {text!r}")
+        terms.append(DiceTerm(sign, count, sides, keep, keep_highest, explode))
+    return tuple(terms), constant
+
+
+def _explode(rng, sides, value):
+    """Total of one exploding die that first showed value"""
+    total = value
+    extra = 0
+    while value == sides and extra < EXPLODE_LIMIT:
+        value = draw_dice(rng, sides, 1)[0]
+        total += value
+        extra += 1
+    return total
+
+
+def _roll_term(term, rng):
+    """Dice a term keeps, each exploded die as one value"""
+    dice = draw_dice(rng, term.sides, term.count)
+    if term.explode:
+        dice = [_explode(rng, term.sides, value) for value in dice]
+    if term.keep is not None:
+        dice = sorted(dice, reverse=term.keep_highest)[:term.keep]
+    return dice
+
+
+def _die_weights(sides, explode):
+    """Integer weight of every value one die can show, and the weights' total"""
+    if not explode:
+        return dict.fromkeys(range(1, sides + 1), 1), sides
+    # A chain ending after k < EXPLODE_LIMIT extra dice on a non-maximum face
+    # has probability sides ** -(k + 1); at the limit every face ends it
+    weights = {}
+    for extra in range(EXPLODE_LIMIT):
+        weight = sides ** (EXPLODE_LIMIT - extra)
+        for face in range(1, sides):
+            weights[extra * sides + face] = weight
+    for face in range(1, sides + 1):
+        weights[EXPLODE_LIMIT * sides + face] = 1
+    return weights, sides ** (EXPLODE_LIMIT + 1)
+
+
+def _convolve(a, b):
+    """Weights of the sum of two independent weighted values"""
+    out = {}
+    for x, wx in a.items():
+        for y, wy in b.items():
+            out[x + y] = out.get(x + y, 0) + wx * wy
+    return out
+
+
+def _span(weights):
+    """Number of integer totals from the lowest weighted value to the highest"""
+    return max(weights) - min(weights) + 1
+
+
+def _term_pairs(term, die):
+    """Weight pairs the count - 1 convolutions of a term's dice multiply
+
+    After k dice the weights span at most k * (span - 1) + 1 totals, each
+    convolved with every value of the next die.
+    """
+    n = term.count - 1
+    return len(die) * (n + (_span(die) - 1) * n * (n + 1) // 2)
+
+
+def _term_weights(term):
+    die, die_total = _die_weights(term.sides, term.explode)
+    if term.keep is None:
+        weights = {0: 1}
+        for _ in range(term.count):
+            weights = _convolve(weights, die)
+    else:
+        if comb(len(die) + term.count - 1, term.count) > MAX_KEEP_OUTCOMES:
+            raise ValueError(f"Too many outcomes to enumerate {term.count}d{term.sides}")
+        # Sorted multisets with their multinomial weight, as in core.probability
+        weights = {}
+        for faces in combinations_with_replacement(sorted(die), term.count):
+            kept = faces[-term.keep:] if term.keep_highest else faces[:term.keep]
+            weight = multiset_weight(faces) * prod(die[face] for face in faces)
+            weights[sum(kept)] = weights.get(sum(kept), 0) + weight
+    if term.sign < 0:
+        weights = {-value: weight for value, weight in weights.items()}
+    return weights, die_total ** term.count
+
+
+class DiceExpression:
+    """A parsed dice expression, rolled through an evaluator chosen once
+
+    roll() returns (dice, total) where dice lists every kept die in term
+    order, sample() draws many totals in bulk, distribution() is exact.
+    """
+
+    __slots__ = ('text', 'terms', 'constant', 'roll', '_weights')
+
+    def __init__(self, text, terms, constant):
+        self.text = text
+        self.terms = terms
+        self.constant = constant
+        self.roll = self._compile()
+        self._weights = None
+
+    def __repr__(self):
+        return f"DiceExpression({self.text!r})"
+
+    def _compile(self):
+        constant = self.constant
+        if len(self.terms) == 1 and self.terms[0].plain and self.terms[0].sign > 0:
+            # The common weapon shape, "NdS+K"
+            sides, count = self.terms[0].sides, self.terms[0].count
+
+            def roll(rng=random):
+                dice = draw_dice(rng, sides, count)
+                return dice, sum(dice) + constant
+            return roll
+
+        terms = self.terms
+
+        def roll(rng=random):
+            dice = []
+            total = constant
+            for term in terms:
+                kept = _roll_term(term, rng)
+                dice.extend(kept)
+                total += term.sign * sum(kept)
+            return dice, total
+        return roll
+
+    @property
+    def dice_count(self):
+        """Dice rolled before any are kept or explode"""
+        return sum(term.count for term in self.terms)
+
+    def total(self, rng=random):
+        """Roll once and return only the total"""
+        return self.roll(rng)[1]
+
+    def sample(self, n, rng=random):
+        """Totals of n independent rolls as an array
+
+        Plain dice groups are drawn for the whole batch in one bulk call,
+        so the stream is consumed differently than by n roll() calls.
+        """
+        n = max(0, int(n))
+        totals = [self.constant] * n
+        for term in self.terms:
+            sign, count = term.sign, term.count
+            if term.plain:
+                faces = draw_dice(rng, term.sides, count * n)
+                if count == 1:
+                    sums = faces
+                else:
+                    sums = [sum(faces[i:i + count]) for i in range(0, count * n, count)]
+            else:
+                sums = [sum(_roll_term(term, rng)) for _ in range(n)]
+            for i, value in enumerate(sums):
+                totals[i] += sign * value
+        return array('q', totals)
+
+    def _total_weights(self):
+        if self._weights is None:
+            self._check_size()
+            weights, outcomes = {self.constant: 1}, 1
+            for term in self.terms:
+                term_weights, term_outcomes = _term_weights(term)
+                weights = _convolve(weights, term_weights)
+                outcomes *= term_outcomes
+            self._weights = dict(sorted(weights.items())), outcomes
+        return self._weights
+
+    def _check_size(self):
+        """Raise ValueError before a distribution too large to compute exactly"""
+        pairs = 0
+        span = 1  # totals the running distribution spans
+        for term in self.terms:
+            die, _ = _die_weights(term.sides, term.explode)
+            if term.keep is None:
+                pairs += _term_pairs(term, die)
+                term_span = term.count * (_span(die) - 1) + 1
+            else:
+                term_span = term.keep * (_span(die) - 1) + 1
+            pairs += span * term_span
+            span += term_span - 1
+            if pairs > MAX_CONVOLUTION_PAIRS:
+                raise ValueError(f"Too many outcomes to compute the odds of {self.text!r} exactly")
+
+    def distribution(self, exact=False):
+        """Probability of every reachable total, in ascending order of total
+
+        Raises ValueError when the expression has too many outcomes to
+        enumerate or convolve; sample() estimates those instead.
+        """
+        weights, outcomes = self._total_weights()
+        if exact:
+            return {total: Fraction(w, outcomes) for total, w in weights.items()}
+        return {total: w / outcomes for total, w in weights.items()}
+
+    def mean(self):
+        """Expected total"""
+        weights, outcomes = self._total_weights()
+        return sum(total * w for total, w in weights.items()) / outcomes
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text):
+    """Cached DiceExpression for an expression string; raises ValueError if invalid"""
+    terms, constant = parse_expression(text)
+    return DiceExpression(text, terms, constant)
+
+
+def roll_expression(text, modifier=0, rng=random):
+    """Roll an expression plus a flat modifier, returning (dice, total)"""
+    dice, total = compile_expression(text).roll(rng)
+    return dice, total + modifier
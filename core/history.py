@@ -0,0 +1,316 @@
+"""
+Roll History
+Fixed-memory ring buffer of recent rolls with indexed queries and an on-disk log
+
+Every roll is appended to the log as one fixed-size binary record, so
+roll seq lives at offset seq * RECORD_SIZE and any roll can be paged back
+from disk.  The log file name carries RECORD_VERSION.  The newest
+`capacity` rolls are also kept in memory as compact array.array columns,
+with per (ability, result) indexes of their seqs.
+
+Ability and roll type names are interned once into names.json.  The
+free-form labels of damage and custom rolls ("37d6", "4d6kh3+2", ...)
+would grow that table without bound, so they live in a side table of
+MAX_LABELS slots, reused least recently used first; a roll whose slot
+was reused since reads back with its kind as its label.  Both tables are
+saved by a write-behind writer, off the roll path.
+"""
+
+import json
+import struct
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+
+from core.dice import RESULT_TYPES
+from core.storage import WriteBehindWriter
+
+KINDS = ("ability", "damage", "custom")
+
+# timestamp, kind, roll type name, ability name, result code (-1 none),
+# modifier, first die, second die, dice rolled, total
+RECORD = struct.Struct('<dBHHbiIIQq')
+RECORD_SIZE = RECORD.size
+RECORD_VERSION = 2
+
+DEFAULT_CAPACITY = 4096
+
+# Roll type codes from LABEL_CODE up are slots of the free-form label table
+LABEL_CODE = 0x8000
+MAX_LABELS = 1024
+
+# Index keys use None as "any ability" / "any result"
+_ANY = None
+
+
+class RollHistory:
+    """Every roll of a session, newest `capacity` in memory and all of them on disk
+
+    Sessions are counted from construction or start_session(): ability
+    successes generate 1 Hope and failures 1 Fear, as at the table.
+    """
+
+    def __init__(self, directory=None, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._kinds = array('B', bytes(capacity))
+        self._roll_types = array('H', bytes(2 * capacity))
+        self._abilities = array('H', bytes(2 * capacity))
+        self._results = array('b', bytes(capacity))
+        self._modifiers = array('i', bytes(4 * capacity))
+        self._die1 = array('I', bytes(4 * capacity))
+        self._die2 = array('I', bytes(4 * capacity))
+        self._counts = array('Q', bytes(8 * capacity))
+        self._totals = array('q', bytes(8 * capacity))
+
+        self._names = [""]
+        self._name_codes = {"": 0}
+        self._labels = []        # slot -> [label, seq of its first roll in that slot]
+        self._label_slots = {}   # label -> slot, least recently used first
+        self._writer = WriteBehindWriter()
+        self._index = {}  # (ability code | None, result code | None) -> deque of seqs
+        self._seq = 0     # seq of the next roll
+        self._hope = self._fear = 0
+        self._session_hope = self._session_fear = 0
+
+        self._directory = Path(directory) if directory is not None else None
+        self._log = None
+        self._reader = None
+        if self._directory is not None:
+            self._open_log()
+
+    # Recording
+    def record(self, kind, roll_type, dice, modifier, total, result_type=None, ability="", timestamp=None,
+               dice_count=None):
+        """Append one roll and return its seq
+
+        dice may hold only the first dice of a larger roll, with the number
+        actually rolled in dice_count.
+        """
+        seq = self._seq
+        result = RESULT_TYPES.index(result_type) if result_type in RESULT_TYPES else -1
+        values = [
+            time.time() if timestamp is None else timestamp,
+            KINDS.index(kind),
+            0,
+            0,
+            result,
+            modifier,
+            dice[0] if len(dice) > 0 else 0,
+            dice[1] if len(dice) > 1 else 0,
+            len(dice) if dice_count is None else dice_count,
+            total,
+        ]
+        # Packed before any table, index or column changes, so a value that
+        # does not fit raises struct.error with the history untouched
+        RECORD.pack(*values)
+        values[3] = self._intern(ability or "")
+        values[2] = self._intern(roll_type) if kind == "ability" else self._label(roll_type, seq)
+        values = tuple(values)
+        packed = RECORD.pack(*values)
+        self._store(seq, values)
+        if self._log is not None:
+            self._log.write(packed)
+            self._log.flush()
+        self._seq = seq + 1
+
+        if kind == "ability":
+            if result > 0:
+                self._hope += 1
+            elif result == 0:
+                self._fear += 1
+        return seq
+
+    def _store(self, seq, values):
+        slot = seq % self.capacity
+        if seq >= self.capacity:
+            self._unindex(seq - self.capacity, slot)
+        (self._timestamps[slot], self._kinds[slot], self._roll_types[slot], self._abilities[slot],
+         self._results[slot], self._modifiers[slot], self._die1[slot], self._die2[slot],
+         self._counts[slot], self._totals[slot]) = values
+        ability, result = values[3], values[4]
+        for key in ((ability, result), (ability, _ANY), (_ANY, result)):
+            seqs = self._index.get(key)
+            if seqs is None:
+                seqs = self._index[key] = deque()
+            seqs.append(seq)
+
+    def _unindex(self, seq, slot):
+        """Drop the roll leaving the ring; it is always the oldest entry of its keys"""
+        ability, result = self._abilities[slot], self._results[slot]
+        for key in ((ability, result), (ability, _ANY), (_ANY, result)):
+            seqs = self._index.get(key)
+            if seqs and seqs[0] == seq:
+                seqs.popleft()
+
+    def _intern(self, name):
+        code = self._name_codes.get(name)
+        if code is None:
+            if len(self._names) >= LABEL_CODE:
+                raise ValueError(f"Too many distinct names to intern {name!r}")
+            code = self._name_codes[name] = len(self._names)
+            self._names.append(name)
+            if self._directory is not None:
+                self._writer.submit(self._directory / "names.json", list(self._names))
+        return code
+
+    def _label(self, label, seq):
+        """Roll type code of a free-form label, taking over the least recently used slot when full"""
+        slot = self._label_slots.pop(label, None)
+        if slot is None:
+            if len(self._labels) < MAX_LABELS:
+                slot = len(self._labels)
+                self._labels.append([label, seq])
+            else:
+                slot = self._label_slots.pop(next(iter(self._label_slots)))
+                self._labels[slot] = [label, seq]
+            if self._directory is not None:
+                self._writer.submit(self._directory / "labels.json", [list(entry) for entry in self._labels])
+        self._label_slots[label] = slot
+        return LABEL_CODE + slot
+
+    def _roll_type(self, seq, kind, code):
+        if code < LABEL_CODE:
+            return self._names[code] if code < len(self._names) else ""
+        slot = code - LABEL_CODE
+        if slot < len(self._labels) and self._labels[slot][1] <= seq:
+            return self._labels[slot][0]
+        return KINDS[kind]
+
+    # Queries
+    def __len__(self):
+        """Rolls recorded in total, on disk included"""
+        return self._seq
+
+    @property
+    def oldest_in_memory(self):
+        return max(0, self._seq - self.capacity)
+
+    def get(self, seq):
+        """Roll seq as a dict, from memory or paged from disk; None if unknown"""
+        if not 0 <= seq < self._seq:
+            return None
+        if seq >= self.oldest_in_memory:
+            slot = seq % self.capacity
+            return self._as_dict(seq, (
+                self._timestamps[slot], self._kinds[slot], self._roll_types[slot], self._abilities[slot],
+                self._results[slot], self._modifiers[slot], self._die1[slot], self._die2[slot],
+                self._counts[slot], self._totals[slot]))
+        return next(iter(self.read(seq, 1)), None)
+
+    def read(self, start, count):
+        """Rolls start .. start + count - 1 straight from the log, oldest first"""
+        if self._log is None or count <= 0:
+            return []
+        if self._reader is None:
+            self._reader = open(self._log_path, 'rb')
+        self._reader.seek(start * RECORD_SIZE)
+        data = self._reader.read(count * RECORD_SIZE)
+        return [
+            self._as_dict(start + i, values)
+            for i, values in enumerate(RECORD.iter_unpack(data[:len(data) - len(data) % RECORD_SIZE]))
+        ]
+
+    def last(self, n, result_type=None, ability=None):
+        """Newest n rolls held in memory, optionally for one result type and/or ability
+
+        last(10, "critical_success", "Fuerza") is a walk over an index
+        that holds only matching seqs, so it costs O(n).
+        """
+        if ability is None and result_type is None:
+            first = max(self.oldest_in_memory, self._seq - n)
+            return [self.get(seq) for seq in range(self._seq - 1, first - 1, -1)]
+        ability_code = _ANY if ability is None else self._name_codes.get(ability)
+        result = _ANY if result_type is None else RESULT_TYPES.index(result_type)
+        if ability is not None and ability_code is None:
+            return []
+        seqs = self._index.get((ability_code, result), ())
+        rolls = []
+        for seq in reversed(seqs):
+            if len(rolls) >= n:
+                break
+            rolls.append(self.get(seq))
+        return rolls
+
+    def count(self, result_type=None, ability=None):
+        """Rolls in memory matching a result type and/or ability"""
+        if ability is None and result_type is None:
+            return self._seq - self.oldest_in_memory
+        ability_code = _ANY if ability is None else self._name_codes.get(ability)
+        result = _ANY if result_type is None else RESULT_TYPES.index(result_type)
+        if ability is not None and ability_code is None:
+            return 0
+        return len(self._index.get((ability_code, result), ()))
+
+    def start_session(self):
+        """Start counting session Hope/Fear from now"""
+        self._session_hope, self._session_fear = self._hope, self._fear
+
+    @property
+    def session_hope(self):
+        """Hope generated this session"""
+        return self._hope - self._session_hope
+
+    @property
+    def session_fear(self):
+        """Fear generated this session"""
+        return self._fear - self._session_fear
+
+    def _as_dict(self, seq, values):
+        timestamp, kind, roll_type, ability, result, modifier, die1, die2, count, total = values
+        return {
+            "seq": seq,
+            "timestamp": timestamp,
+            "kind": KINDS[kind],
+            "rollType": self._roll_type(seq, kind, roll_type),
+            "ability": self._names[ability] if ability < len(self._names) else "",
+            "resultType": RESULT_TYPES[result] if result >= 0 else KINDS[kind],
+            "modifier": modifier,
+            "dice": [die1, die2][:count],
+            "diceCount": count,
+            "total": total,
+        }
+
+    # Disk log
+    @property
+    def _log_path(self):
+        return self._directory / f"rolls.v{RECORD_VERSION}.log"
+
+    def _open_log(self):
+        """Open the log for appending and reload its newest rolls into memory"""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        names_path = self._directory / "names.json"
+        if names_path.exists():
+            with open(names_path, 'r', encoding='utf-8') as f:
+                self._names = json.load(f)
+            self._name_codes = {name: code for code, name in enumerate(self._names)}
+        labels_path = self._directory / "labels.json"
+        if labels_path.exists():
+            with open(labels_path, 'r', encoding='utf-8') as f:
+                self._labels = json.load(f)
+            # Oldest first, so the least recently claimed slot is reused first
+            order = sorted(range(len(self._labels)), key=lambda slot: self._labels[slot][1])
+            self._label_slots = {self._labels[slot][0]: slot for slot in order}
+
+        size = self._log_path.stat().st_size if self._log_path.exists() else 0
+        total = size // RECORD_SIZE
+        if size % RECORD_SIZE:
+            # Drop a torn trailing record left by a crash mid-write
+            with open(self._log_path, 'r+b') as f:
+                f.truncate(total * RECORD_SIZE)
+        self._log = open(self._log_path, 'ab')
+
+        first = max(0, total - self.capacity)
+        with open(self._log_path, 'rb') as f:
+            f.seek(first * RECORD_SIZE)
+            for seq, values in enumerate(RECORD.iter_unpack(f.read((total - first) * RECORD_SIZE)), first):
+                self._store(seq, values)
+        self._seq = total
+
+    def close(self):
+        self._writer.flush()
+        for f in (self._log, self._reader):
+            if f is not None:
+                f.close()
+        self._log = self._reader = None
@@ -0,0 +1,159 @@
+"""
+Change Journal
+Append-only per-property change log with periodic snapshot compaction
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from core.storage import atomic_write_json
+
+SNAPSHOT_VERSION = 1
+
+
+class ChangeJournal:
+    """Durable key/value state stored as a snapshot plus a change journal
+
+    Each record() appends one compact JSON line and fsyncs it, so saving
+    costs O(change).  After compact_every entries the full state is
+    written as a new snapshot and the journal is truncated.  Call load()
+    before recording.
+
+    With a WriteBehindWriter, record() and compact() only update the state
+    and queue the change; the appends, snapshot and fsync run on the
+    writer's thread, one fsync per batch, and a crash loses at most the
+    writer's delay worth of changes.  close() waits for them.
+    """
+
+    def __init__(self, directory, compact_every=200, durable=True, writer=None):
+        self.directory = Path(directory)
+        self.compact_every = compact_every
+        self.durable = durable
+        self.writer = writer
+        self._snapshot_path = self.directory / 'snapshot.json'
+        self._journal_path = self.directory / 'journal.jsonl'
+        self._state = {}
+        self._seq = 0
+        self._entries = 0  # journal entries since the last snapshot
+        self._file = None
+        self._lock = threading.Lock()
+        self._lines = []        # encoded entries not on disk yet
+        self._snapshot = None   # snapshot to write (and journal to truncate) before them
+
+    @property
+    def state(self):
+        """Copy of the current state"""
+        return dict(self._state)
+
+    def load(self):
+        """Rebuild state from the snapshot and journal, returning a copy"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        state = {}
+        seq = 0
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            state = snapshot.get('state', {})
+            seq = snapshot.get('seq', 0)
+
+        entries = 0
+        if self._journal_path.exists():
+            raw = self._journal_path.read_bytes()
+            pos = 0
+            while True:
+                end = raw.find(b'\n', pos)
+                if end < 0:
+                    break
+                try:
+                    entry = json.loads(raw[pos:end])
+                except ValueError:
+                    break
+                # Entries already folded into the snapshot are skipped
+                if entry['s'] > seq:
+                    state[entry['k']] = entry['v']
+                    seq = entry['s']
+                entries += 1
+                pos = end + 1
+
+            # Drop a torn trailing line so new entries start on a clean line
+            if pos < len(raw):
+                with open(self._journal_path, 'r+b') as f:
+                    f.truncate(pos)
+
+        self._state = state
+        self._seq = seq
+        self._entries = entries
+        return dict(state)
+
+    def record(self, key, value):
+        """Append a single property change"""
+        self._seq += 1
+        self._state[key] = value
+        line = json.dumps({'s': self._seq, 'k': key, 'v': value},
+                          separators=(',', ':'), ensure_ascii=False) + '\n'
+        with self._lock:
+            self._lines.append(line.encode('utf-8'))
+
+        self._entries += 1
+        if self._entries >= self.compact_every:
+            self.compact()
+        else:
+            self._schedule()
+
+    def write_snapshot(self, state):
+        """Replace the whole state and persist it as a snapshot"""
+        self._state = dict(state)
+        self._seq += 1
+        self.compact()
+
+    def compact(self):
+        """Snapshot the current state and truncate the journal"""
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'seq': self._seq,
+            'state': dict(self._state),
+        }
+        with self._lock:
+            # Entries still queued are folded into the snapshot
+            self._snapshot = snapshot
+            self._lines = []
+        self._entries = 0
+        self._schedule()
+
+    def close(self):
+        """Write queued changes and close the journal file"""
+        if self.writer is not None:
+            self.writer.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _schedule(self):
+        if self.writer is None:
+            self._sync()
+        else:
+            self.writer.submit_call(self._journal_path, self._sync)
+
+    def _sync(self):
+        """Write the queued snapshot and entries (on the writer thread, when there is one)"""
+        with self._lock:
+            snapshot, self._snapshot = self._snapshot, None
+            lines, self._lines = self._lines, []
+        if snapshot is None and not lines:
+            return
+        f = self._open()
+        if snapshot is not None:
+            atomic_write_json(self._snapshot_path, snapshot)
+            f.truncate(0)
+        f.write(b''.join(lines))
+        f.flush()
+        if self.durable:
+            os.fsync(f.fileno())
+
+    def _open(self):
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._journal_path, 'ab')
+        return self._file
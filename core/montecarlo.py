@@ -0,0 +1,144 @@
+"""
+Monte-Carlo Encounter Simulation
+Shards encounter trials across a process pool with reproducible RNG streams
+
+Trials are cut into fixed-size shards and shard i always rolls with the
+"sim" substream i of the seed (see core.rng), so a run is reproducible no
+matter how many workers execute it.  Shards are consumed in order, so
+running statistics and an early stop on --precision are deterministic too.
+"""
+
+import math
+import os
+from multiprocessing import Pool
+
+from core.encounter import run_encounter
+from core.rng import derive
+
+WINNERS = ("character", "adversary", "timeout")
+
+# Per-trial values summed for means and confidence intervals
+TRACKED = ("rounds", "hp_left", "adversary_hp_left", "hope_gained", "hope_spent", "fear_gained", "fear_spent")
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959964
+
+
+def run_shard(task):
+    """Run one shard of trials and return its summed statistics
+
+    task is (seed, shard, trials, encounter kwargs) so it pickles for the pool.
+    """
+    seed, shard, trials, options = task
+    rng = derive(seed, "sim", shard)
+    stats = EncounterStats()
+    for _ in range(trials):
+        stats.add(run_encounter(rng=rng, **options))
+    return stats
+
+
+def wilson_interval(successes, trials, z=Z_95):
+    """Wilson score interval for a proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+class EncounterStats:
+    """Running sums over encounter results, mergeable across shards"""
+
+    __slots__ = ('trials', 'wins', 'sums', 'squares')
+
+    def __init__(self):
+        self.trials = 0
+        self.wins = dict.fromkeys(WINNERS, 0)
+        self.sums = dict.fromkeys(TRACKED, 0)
+        self.squares = dict.fromkeys(TRACKED, 0)
+
+    def add(self, result):
+        self.trials += 1
+        self.wins[result["winner"]] += 1
+        for key in TRACKED:
+            value = result[key]
+            self.sums[key] += value
+            self.squares[key] += value * value
+
+    def merge(self, other):
+        self.trials += other.trials
+        for key in WINNERS:
+            self.wins[key] += other.wins[key]
+        for key in TRACKED:
+            self.sums[key] += other.sums[key]
+            self.squares[key] += other.squares[key]
+
+    def mean_interval(self, key, z=Z_95):
+        """(mean, half-width of its confidence interval)"""
+        n = self.trials
+        if n == 0:
+            return 0.0, 0.0
+        mean = self.sums[key] / n
+        if n == 1:
+            return mean, 0.0
+        variance = max(0.0, (self.squares[key] - n * mean * mean) / (n - 1))
+        return mean, z * math.sqrt(variance / n)
+
+    def win_interval(self):
+        return wilson_interval(self.wins["character"], self.trials)
+
+    def summary(self):
+        """Plain dict with win rates, 95% intervals and the tracked means"""
+        low, high = self.win_interval()
+        n = self.trials or 1
+        report = {
+            "trials": self.trials,
+            "win_rate": self.wins["character"] / n,
+            "win_rate_ci": [low, high],
+            "outcomes": {key: count / n for key, count in self.wins.items()},
+        }
+        for key in TRACKED:
+            mean, half = self.mean_interval(key)
+            report[key] = {"mean": mean, "ci": [mean - half, mean + half]}
+        return report
+
+
+def simulate(trials, seed=0, workers=None, shard_size=1000, precision=None, progress=None, **options):
+    """Run trials encounters across a process pool and return the final EncounterStats
+
+    options are passed to run_encounter.  progress(stats) is called after
+    every shard with the running totals.  With precision set, the run
+    stops once the win-rate interval is narrower than +/- precision.
+    """
+    if trials < 1:
+        raise ValueError(f"trials must be at least 1, got {trials}")
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be at least 1, got {shard_size}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    shard_count = max(1, math.ceil(trials / shard_size))
+    tasks = [
+        (seed, shard, min(shard_size, trials - shard * shard_size), options)
+        for shard in range(shard_count)
+    ]
+    workers = workers or os.cpu_count() or 1
+    total = EncounterStats()
+
+    def consume(shards):
+        for stats in shards:
+            total.merge(stats)
+            if progress:
+                progress(total)
+            if precision is not None:
+                low, high = total.win_interval()
+                if (high - low) / 2 <= precision:
+                    return
+
+    if workers == 1:
+        consume(run_shard(task) for task in tasks)
+    else:
+        with Pool(workers) as pool:
+            consume(pool.imap(run_shard, tasks))
+    return total
@@ -0,0 +1,68 @@
+"""
+Dice Probability Engine
+Exact outcome distributions for every roll type, computed by enumeration
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import factorial
+
+from core.dice import DIE_FACES, RESULT_TYPES, result_code, roll_spec
+
+
+def multiset_weight(faces):
+    """Number of ordered rolls that produce this sorted multiset of faces"""
+    weight = factorial(len(faces))
+    run = 1
+    for i in range(1, len(faces)):
+        if faces[i] == faces[i - 1]:
+            run += 1
+            weight //= run
+        else:
+            run = 1
+    return weight
+
+
+@lru_cache(maxsize=None)
+def sum_distribution(roll_type):
+    """Exact distribution of the kept two-dice sum for a roll type
+
+    Returns (counts, outcomes) where counts[s] is the number of the
+    outcomes equally likely rolls whose kept pair sums to s (0..24).
+    Enumerates sorted multisets with their multinomial weight, so
+    Triple Ventaja visits 4368 cases instead of 12**5.
+    """
+    num_dice, keep_highest = roll_spec(roll_type)
+    counts = [0] * 25
+    for faces in combinations_with_replacement(DIE_FACES, num_dice):
+        kept = faces[-2:] if keep_highest else faces[:2]
+        counts[kept[0] + kept[1]] += multiset_weight(faces)
+    return tuple(counts), 12 ** num_dice
+
+
+@lru_cache(maxsize=1024)
+def _result_counts(roll_type, modifier):
+    counts, outcomes = sum_distribution(roll_type)
+    tally = [0] * len(RESULT_TYPES)
+    for dice_sum in range(2, 25):
+        tally[result_code(dice_sum + modifier)] += counts[dice_sum]
+    return tuple(tally), outcomes
+
+
+def total_distribution(roll_type, modifier=0, exact=False):
+    """Probability of every reachable total (dice sum + modifier)"""
+    counts, outcomes = sum_distribution(roll_type)
+    convert = (lambda c: Fraction(c, outcomes)) if exact else (lambda c: c / outcomes)
+    return {s + modifier: convert(c) for s, c in enumerate(counts) if c}
+
+
+def result_odds(roll_type, modifier=0, exact=False):
+    """Probability of each result type for a roll type and modifier
+
+    Cached per (roll_type, modifier); repeated lookups cost a dict build.
+    """
+    tally, outcomes = _result_counts(roll_type, modifier)
+    if exact:
+        return {name: Fraction(c, outcomes) for name, c in zip(RESULT_TYPES, tally)}
+    return {name: c / outcomes for name, c in zip(RESULT_TYPES, tally)}
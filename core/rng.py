@@ -0,0 +1,133 @@
+"""
+Dice RNG Streams
+Seeded, splittable random streams with bulk die generation
+
+A StreamSet owns one root seed.  Every substream is a DiceStream seeded
+from (root seed, name, counter), so game rolls, cosmetic animation draws
+and simulation workers never share state, each worker thread can own its
+generator, and a whole session replays from the root seed alone.
+"""
+
+import random
+import secrets
+import threading
+
+from core.dice import roll_ability, roll_batch, roll_tally
+from core.expression import compile_expression, roll_expression
+
+# Faces generated ahead per die size when a stream refills its buffer
+BUFFER_SIZE = 256
+
+_translate_tables = {}
+
+
+def new_seed():
+    """Fresh 64-bit root seed"""
+    return secrets.randbits(64)
+
+
+def derive(seed, name, counter=0):
+    """Substream counter of name under a root seed (string seeds are hashed with SHA-512)"""
+    return DiceStream(f"{seed}:{name}:{counter}")
+
+
+def _face_table(faces):
+    """bytes.translate table mapping a random byte to a face, or to 0 when rejected"""
+    table = _translate_tables.get(faces)
+    if table is None:
+        limit = 256 - 256 % faces
+        table = _translate_tables[faces] = bytes(
+            byte % faces + 1 if byte < limit else 0 for byte in range(256)
+        )
+    return table
+
+
+class DiceStream(random.Random):
+    """random.Random with buffered bulk rolls for dice up to 255 faces
+
+    dice() turns random bytes into faces with one translate/replace pass
+    (rejecting the biased top bytes), so thousands of d12s cost a couple
+    of C calls instead of one Python call each.
+    """
+
+    def seed(self, *args, **kwargs):
+        super().seed(*args, **kwargs)
+        self._buffers = {}
+
+    def getstate(self):
+        return super().getstate(), dict(self._buffers)
+
+    def setstate(self, state):
+        base, buffers = state
+        super().setstate(base)
+        self._buffers = dict(buffers)
+
+    def _generate(self, faces, k):
+        table = _face_table(faces)
+        accept = (256 - 256 % faces) / 256
+        out = b''
+        while len(out) < k:
+            size = int((k - len(out)) / accept) + 8
+            out += self.getrandbits(8 * size).to_bytes(size, 'little').translate(table).replace(b'\0', b'')
+        return out
+
+    def dice(self, faces, k):
+        """k rolls of a die with the given number of faces"""
+        if k <= 0 or faces <= 0:
+            return []
+        if faces > 255:
+            return self.choices(range(1, faces + 1), k=k)
+        buffer = self._buffers.get(faces, b'')
+        if len(buffer) < k:
+            buffer += self._generate(faces, max(k - len(buffer), BUFFER_SIZE))
+        self._buffers[faces] = buffer[k:]
+        return list(buffer[:k])
+
+
+class StreamSet:
+    """Root seed with named, counter-based substreams"""
+
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else int(seed)
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def stream(self, name, counter=0):
+        """Substream counter of name"""
+        return derive(self.seed, name, counter)
+
+    def spawn(self, name):
+        """Next unused substream of name, e.g. one per worker task"""
+        with self._lock:
+            counter = self._counters.get(name, 0)
+            self._counters[name] = counter + 1
+        return derive(self.seed, name, counter)
+
+
+def replay_session(seed, rolls):
+    """Replay a DiceRoller session log, yielding each roll's result again
+
+    rolls holds the logged entries in order: ("ability", roll_type,
+    modifier), ("damage", expression, modifier), ("custom", num_dice,
+    die_size), ("expression", expression), ("batch", roll_type, modifier,
+    n) or ("sample", expression, n).  Custom rolls come back as
+    core.dice.DiceTally results.
+    """
+    streams = StreamSet(seed)
+    rng = streams.stream("rolls")
+    for kind, *args in rolls:
+        if kind == "ability":
+            yield roll_ability(*args, rng=rng)
+        elif kind == "damage":
+            yield roll_expression(*args, rng=rng)
+        elif kind == "custom":
+            yield roll_tally(*args, rng=rng)
+        elif kind == "expression":
+            yield roll_expression(*args, rng=rng)
+        elif kind == "batch":
+            yield roll_batch(*args, rng=streams.spawn("batch"))
+        elif kind == "sample":
+            expression, n = args
+            yield compile_expression(expression).sample(n, streams.spawn("sample"))
+        else:
+            raise ValueError(f"Unknown roll kind in session log: {kind!r}")
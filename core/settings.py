@@ -0,0 +1,154 @@
+"""
+Settings Store
+Typed, cached application settings with per-key subscriptions, shared by the Kivy and Qt front-ends
+"""
+
+import json
+from collections import namedtuple
+from pathlib import Path
+
+from core.storage import WriteBehindWriter
+
+DEFAULT_SETTINGS_FILE = Path.home() / ".daggerheart_settings.json"
+
+
+class Setting(namedtuple("Setting", "type default minimum maximum", defaults=(None, None))):
+    """Schema entry: value type, default and optional numeric bounds"""
+
+    __slots__ = ()
+
+    def validate(self, value):
+        """Value coerced to this setting's type and clamped to its bounds
+
+        Raises TypeError for values of the wrong type.
+        """
+        if self.type is bool:
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, int) and value in (0, 1):
+                return bool(value)
+        elif self.type in (int, float):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = self.type(value)
+                if self.minimum is not None:
+                    value = max(self.minimum, value)
+                if self.maximum is not None:
+                    value = min(self.maximum, value)
+                return value
+        elif isinstance(value, self.type):
+            return value
+        raise TypeError(f"Expected {self.type.__name__}, got {value!r}")
+
+
+SCHEMA = {
+    "dark_theme": Setting(bool, True),
+    "sounds_enabled": Setting(bool, True),
+    "animations_enabled": Setting(bool, True),
+    "auto_save": Setting(bool, True),
+    "dice_speed": Setting(int, 50, 10, 100),
+}
+
+
+class SettingsStore:
+    """Settings loaded once, validated against a schema and written behind
+
+    get() reads the in-memory cache.  set()/update() validate, notify only
+    the subscribers of keys whose value changed, and queue the whole file
+    on a WriteBehindWriter, so a burst of changes costs one write and one
+    fsync.  Keys outside the schema are kept untyped so nothing in the
+    file is lost.
+    """
+
+    def __init__(self, path=DEFAULT_SETTINGS_FILE, schema=SCHEMA, save_delay=0.5):
+        self.path = Path(path)
+        self.schema = schema
+        self._values = {}
+        self._subscribers = {}  # key -> list of callback(key, value)
+        self._writer = WriteBehindWriter(save_delay)
+        self.reload()
+
+    def get(self, key, default=None):
+        if key in self._values:
+            return self._values[key]
+        setting = self.schema.get(key)
+        return setting.default if setting is not None else default
+
+    def set(self, key, value):
+        """Set one value; returns True if it changed"""
+        changed = self._assign(key, value)
+        if changed:
+            self.save()
+        return changed
+
+    def update(self, values):
+        """Set several values as one change and one write; returns the keys that changed"""
+        changed = [key for key, value in values.items() if self._assign(key, value)]
+        if changed:
+            self.save()
+        return changed
+
+    def reset(self):
+        """Restore every schema default"""
+        return self.update({key: setting.default for key, setting in self.schema.items()})
+
+    def as_dict(self):
+        """Every value, schema defaults filled in"""
+        values = {key: setting.default for key, setting in self.schema.items()}
+        values.update(self._values)
+        return values
+
+    def subscribe(self, key, callback):
+        """Call callback(key, value) whenever key changes; returns an unsubscribe function"""
+        callbacks = self._subscribers.setdefault(key, [])
+        callbacks.append(callback)
+        return lambda: callbacks.remove(callback) if callback in callbacks else None
+
+    def reload(self):
+        """Re-read the file, notifying subscribers of keys whose value differs"""
+        data = {}
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+
+        loaded = {}
+        for key, value in data.items():
+            setting = self.schema.get(key)
+            if setting is None:
+                loaded[key] = value
+                continue
+            try:
+                loaded[key] = setting.validate(value)
+            except TypeError as e:
+                print(f"Ignoring invalid setting {key}: {e}")
+
+        before = self.as_dict()
+        self._values = loaded
+        after = self.as_dict()
+        for key in after:
+            if before.get(key) != after[key]:
+                self._notify(key, after[key])
+
+    def save(self):
+        """Queue the current values to be written"""
+        self._writer.submit(self.path, self.as_dict())
+
+    def flush(self):
+        """Block until queued writes have reached disk"""
+        self._writer.flush()
+
+    def _assign(self, key, value):
+        setting = self.schema.get(key)
+        if setting is not None:
+            value = setting.validate(value)
+        changed = self.get(key) != value
+        self._values[key] = value
+        if changed:
+            self._notify(key, value)
+        return changed
+
+    def _notify(self, key, value):
+        for callback in list(self._subscribers.get(key, ())):
+            callback(key, value)
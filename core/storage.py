@@ -0,0 +1,90 @@
+"""
+Storage Helpers
+Crash-safe file writes and a coalescing background writer
+"""
+
+import json
+import os
+import tempfile
+import threading
+from functools import partial
+from pathlib import Path
+
+
+def atomic_write_json(path, data):
+    """Write JSON to path via temp file + rename so readers never see a partial file"""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindWriter:
+    """Coalesces JSON writes and performs them on a background thread
+
+    Every submit() replaces the pending data for its path; the writer
+    thread waits `delay` seconds after the first pending change and then
+    writes only the latest data, so a burst of changes costs one write.
+    submit_call() queues any other write the same way, keyed like a path.
+    """
+
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self._pending = {}
+        self._writing = False
+        self._flushing = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, path, data):
+        """Queue data to be written to path"""
+        self.submit_call(Path(path), partial(atomic_write_json, path, data))
+
+    def submit_call(self, key, write):
+        """Queue write(), replacing any write still pending under key"""
+        with self._cond:
+            self._pending[key] = write
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self):
+        """Block until every queued write has reached disk"""
+        with self._cond:
+            if not self._pending and not self._writing:
+                return
+            self._flushing += 1
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._pending and not self._writing)
+            self._flushing -= 1
+
+    def _run(self):
+        with self._cond:
+            while True:
+                self._cond.wait_for(lambda: self._pending)
+                # Coalescing window, cut short by flush()
+                self._cond.wait_for(lambda: self._flushing, timeout=self.delay)
+                batch, self._pending = self._pending, {}
+                self._writing = True
+                self._cond.release()
+                try:
+                    for key, write in batch.items():
+                        try:
+                            write()
+                        except Exception as e:
+                            print(f"Error writing {key}: {e}")
+                finally:
+                    self._cond.acquire()
+                    self._writing = False
+                    self._cond.notify_all()
@@ -0,0 +1,255 @@
+"""
+Table Sync
+Asyncio service that mirrors live table state to GM screens and player tablets
+
+The service runs its own event loop on a background thread.  The UI
+thread only calls publish(key, value), which hands the change to the loop
+and returns at once.  Clients connect over TCP and exchange one JSON
+object per line:
+
+    client -> server   {"since": 41}                 (optional resume point)
+    server -> client   {"s": 57, "snapshot": {...}}  full state at seq 57
+    server -> client   {"s": 58, "d": {"character.hope": 3}}
+
+Each client has its own queue of pending changes keyed by property, so a
+client that reads slowly receives the latest value of every property it
+missed in one delta instead of an unbounded backlog.
+
+There is no authentication, so the server listens on localhost unless
+given LAN_HOST (or another address) explicitly.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Every interface, for screens elsewhere on the network; opt-in only
+LAN_HOST = "0.0.0.0"
+
+# Recent deltas kept for clients resuming with {"since": seq}
+TAIL_SIZE = 1024
+
+# How long a new client has to send its hello before it is treated as fresh
+HELLO_TIMEOUT = 0.5
+
+# Clients whose socket stays full this long are dropped
+DRAIN_TIMEOUT = 30.0
+
+# Transport buffer above which writes wait for the client
+WRITE_BUFFER_LIMIT = 64 * 1024
+
+
+def _encode(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class _Client:
+    __slots__ = ('writer', 'pending', 'wake', 'closed')
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.pending = {}  # key -> latest value not yet sent
+        self.wake = asyncio.Event()
+        self.closed = False  # set once the peer has closed its side
+
+
+class SyncServer:
+    """Broadcasts per-property deltas of a key/value table state to TCP clients"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, tail_size=TAIL_SIZE):
+        self.host = host
+        self.port = port
+        self.on_clients_changed = None  # callback(count), called on the server thread
+        self._state = {}
+        self._seq = 0
+        self._tail = deque(maxlen=tail_size)  # (seq, key, value)
+        self._clients = set()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    # UI-thread API
+    def start(self):
+        """Start serving on a background thread; returns once the socket is listening"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='table-sync', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self):
+        """Close every client and stop the loop"""
+        if self._thread is None:
+            return
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = self._loop = None
+        self._ready.clear()
+
+    def publish(self, key, value):
+        """Queue a state change for broadcast; never blocks"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._apply, key, value)
+        else:
+            self._state[key] = value
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    @property
+    def address(self):
+        """(host, port) actually bound, once started"""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[:2]
+
+    # Event loop side
+    def _run(self):
+        self._loop = loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._serve_client, self.host, self.port))
+        except OSError as e:
+            print(f"Table sync could not listen on {self.host}:{self.port}: {e}")
+            self._loop = None
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            # Client handlers and their readers are still pending; end them before the loop goes
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+            self._server = None
+
+    def _apply(self, key, value):
+        if self._state.get(key, _MISSING) == value:
+            return
+        self._seq += 1
+        self._state[key] = value
+        self._tail.append((self._seq, key, value))
+        for client in self._clients:
+            client.pending[key] = value
+            client.wake.set()
+
+    async def _serve_client(self, reader, writer):
+        try:
+            await self._serve(reader, writer)
+        except asyncio.CancelledError:
+            # Cancelled by stop(); ending quietly keeps asyncio from logging the cancelled handler
+            writer.close()
+
+    async def _serve(self, reader, writer):
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_LIMIT)
+        since = await self._read_hello(reader)
+
+        client = _Client(writer)
+        first = self._catch_up(since)
+        self._clients.add(client)
+        self._clients_changed()
+        watcher = asyncio.ensure_future(self._watch_client(reader, client))
+        try:
+            writer.write(_encode(first))
+            await asyncio.wait_for(writer.drain(), DRAIN_TIMEOUT)
+            while True:
+                await client.wake.wait()
+                client.wake.clear()
+                if client.closed:
+                    break
+                if not client.pending:
+                    continue
+                changes, client.pending = client.pending, {}
+                writer.write(_encode({"s": self._seq, "d": changes}))
+                # Changes arriving while this waits coalesce into client.pending
+                await asyncio.wait_for(writer.drain(), DRAIN_TIMEOUT)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            watcher.cancel()
+            self._clients.discard(client)
+            self._clients_changed()
+            writer.close()
+
+    async def _watch_client(self, reader, client):
+        """Read (and ignore) what a client sends until it closes, then drop it"""
+        try:
+            while await reader.readline():
+                pass
+        except (ConnectionError, ValueError):
+            pass
+        client.closed = True
+        client.wake.set()
+
+    async def _read_hello(self, reader):
+        """Resume point sent by the client, or None"""
+        try:
+            line = await asyncio.wait_for(reader.readline(), HELLO_TIMEOUT)
+            return int(json.loads(line).get("since"))
+        except (asyncio.TimeoutError, ValueError, TypeError, AttributeError):
+            return None
+
+    def _catch_up(self, since):
+        """Tail delta for a client resuming at since, or a full snapshot"""
+        if since is not None and self._tail and since >= self._tail[0][0] - 1 and since <= self._seq:
+            changes = {key: value for seq, key, value in self._tail if seq > since}
+            return {"s": self._seq, "d": changes}
+        return {"s": self._seq, "snapshot": dict(self._state)}
+
+    def _clients_changed(self):
+        if self.on_clients_changed is not None:
+            self.on_clients_changed(len(self._clients))
+
+
+_MISSING = object()
+
+
+class SyncClient:
+    """Minimal asyncio client that mirrors a SyncServer's state
+
+        client = SyncClient(host, port)
+        async for changes in client.follow():
+            ...  # client.state is up to date
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.state = {}
+        self.seq = None
+
+    async def follow(self):
+        """Connect (resuming from the last seq seen) and yield each batch of changes"""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(_encode({"since": self.seq}))
+        await writer.drain()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                message = json.loads(line)
+                if "snapshot" in message:
+                    self.state = message["snapshot"]
+                    changes = dict(self.state)
+                else:
+                    changes = message["d"]
+                    self.state.update(changes)
+                self.seq = message["s"]
+                yield changes
+        finally:
+            writer.close()
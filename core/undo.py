@@ -0,0 +1,95 @@
+"""
+Undo History
+Bounded undo/redo of property changes, stored as (key, before, after) steps
+
+Only what changed is kept, so a long session costs memory in proportion
+to its edits rather than whole sheets per step.
+"""
+
+from collections import deque
+
+UNDO_LIMIT = 100
+
+
+class UndoHistory:
+    """Undo and redo stacks of change steps
+
+    record() outside a group is one step; changes recorded between
+    begin() and the matching commit() (groups nest) become a single step,
+    with repeated changes to one key folded into one.  Starting a new
+    step clears the redo stack.
+    """
+
+    def __init__(self, limit=UNDO_LIMIT):
+        self._undo = deque(maxlen=limit)
+        self._redo = []
+        self._group = []
+        self._depth = 0
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def begin(self):
+        self._depth += 1
+
+    def commit(self):
+        """Close a group; returns True if it was the outermost and pushed a step"""
+        if self._depth == 0:
+            return False
+        self._depth -= 1
+        if self._depth or not self._group:
+            return False
+        changes, self._group = self._group, []
+        folded = {}
+        for key, before, after in changes:
+            if key in folded:
+                before = folded[key][0]
+            folded[key] = (before, after)
+        return self._push(tuple((key, before, after) for key, (before, after) in folded.items()
+                                if before != after))
+
+    def record(self, key, before, after):
+        """Record one change; returns True if it pushed a step"""
+        if self._depth:
+            self._group.append((key, before, after))
+            return False
+        return self._push(((key, before, after),))
+
+    def undo(self):
+        """Step to revert, moved to the redo stack, or None
+
+        Apply each change's before value in reverse order.
+        """
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        self._redo.append(step)
+        return step
+
+    def redo(self):
+        """Step to reapply, moved back to the undo stack, or None
+
+        Apply each change's after value in order.
+        """
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._undo.append(step)
+        return step
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._group = []
+
+    def _push(self, step):
+        if not step:
+            return False
+        self._undo.append(step)
+        self._redo.clear()
+        return True
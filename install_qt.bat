@@ -23,6 +23,10 @@ if errorlevel 1 (
     exit /b 1
 )
 
+echo.
+echo Precompiling QML screens...
+python main_qt.py --precompile-qml
+
 echo.
 echo Installation completed successfully!
 echo You can now run the Qt version with: python main_qt.py
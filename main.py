@@ -9,6 +9,11 @@ Features:
 - Advanced dice rolling system
 """
 
+import time
+_STARTUP_T0 = time.perf_counter()
+
+import importlib
+import os
 import kivy
 kivy.require('2.0.0')
 from kivy.app import App
@@ -17,18 +22,39 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.core.window import Window
 from kivy.animation import Animation
+from kivy.clock import Clock
 from utils.settings import SettingsManager
 from components.platform_config import PlatformConfig
+from core.character import CharacterSheet
+
+# Screens are imported and built the first time they are shown
+SCREEN_REGISTRY = {
+    'menu': ('screens.menu', 'MenuScreen'),
+    'simple_menu': ('screens.simple_menu', 'SimpleMenuScreen'),
+    'settings': ('screens.settings', 'SettingsScreen'),
+    'rolls': ('screens.rolls', 'RollsScreen'),
+    'characteristics': ('screens.characteristics', 'CharacteristicsScreen'),
+    'ability_checks': ('screens.ability_checks', 'AbilityChecksScreen'),
+    'combat': ('screens.combat', 'CombatScreen'),
+}
+
+# Most likely next screen from each screen, built ahead of time while idle
+PREWARM_NEXT = {
+    'characteristics': 'rolls',
+    'rolls': 'ability_checks',
+    'ability_checks': 'rolls',
+    'combat': 'rolls',
+    'simple_menu': 'characteristics',
+    'menu': 'characteristics',
+}
+
+# Delay before prewarming, so it never competes with a screen transition
+PREWARM_DELAY = 0.5
 
-from screens.menu import MenuScreen
-from screens.simple_menu import SimpleMenuScreen
-from screens.settings import SettingsScreen
-from screens.rolls import RollsScreen
-from screens.characteristics import CharacteristicsScreen
-from screens.ability_checks import AbilityChecksScreen
-from screens.combat import CombatScreen
-from screens.ability_checks import AbilityChecksScreen
-from screens.combat import CombatScreen
+# Set by the benchmark harness to quit once the first frame is up
+EXIT_AFTER_START = bool(os.environ.get('DAGGERHEART_EXIT_AFTER_START'))
+
+_IMPORTS_DONE = time.perf_counter()
 
 # Set responsive window size with platform detection
 system_info = PlatformConfig.get_system_info()
@@ -46,36 +72,18 @@ else:
 
 class MainApp(App):
     def build(self):
+        self.startup_timings = [('imports', _IMPORTS_DONE - _STARTUP_T0)]
+        build_start = time.perf_counter()
         self.settings_manager = SettingsManager('settings.json')
         
         # Check if running on Raspberry Pi for optimizations
         system_info = PlatformConfig.get_system_info()
         self.is_raspberry_pi = system_info.get('is_raspberry_pi', False)
         
-        # Enhanced character data with more RPG stats
-        self.character = {
-            'name': 'Mi Personaje',
-            'class': 'Guerrero',
-            'level': 1,
-            'experience': 0,
-            'hp_max': 30,
-            'hp_current': 30,
-            'armor': 2,
-            'hope': 0,
-            'abilities': {
-                'Fuerza': 2,
-                'Destreza': 1,
-                'Carisma': 0,
-                'Constitución': 1,
-                'Sabiduría': 0,
-                'Inteligencia': -1
-            },
-            'thresholds': {
-                'minor': 10,
-                'major': 16,
-                'severe': 22
-            }
-        }
+        # Character sheet shared with the Qt front-end, behind the dict
+        # interface screens use (character['class'], character['abilities'], ...)
+        self.character = CharacterSheet()
+        self.character['hope'] = 0
         
         # Create screen manager with optimized transitions for Raspberry Pi
         if self.is_raspberry_pi:
@@ -86,24 +94,49 @@ class MainApp(App):
             
         self.sm = ScreenManager(transition=transition)
         
-        # Add screens
-        self.sm.add_widget(MenuScreen(name='menu', app=self))
-        self.sm.add_widget(SimpleMenuScreen(name='simple_menu', app=self))
-        self.sm.add_widget(SettingsScreen(name='settings', app=self))
-        self.sm.add_widget(RollsScreen(name='rolls', app=self))
-        self.sm.add_widget(CharacteristicsScreen(name='characteristics', app=self))
-        self.sm.add_widget(AbilityChecksScreen(name='ability_checks', app=self))
-        self.sm.add_widget(CombatScreen(name='combat', app=self))
-        
         # Set default screen to characteristics (skip the fancy menu)
+        self.ensure_screen('characteristics')
         self.sm.current = 'characteristics'
+        self.schedule_prewarm('characteristics')
         
+        self.startup_timings.append(('build', time.perf_counter() - build_start))
         return self.sm
-
+    
+    def on_start(self):
+        """Print the startup timing report once the first frame is up"""
+        self.startup_timings.append(('total', time.perf_counter() - _STARTUP_T0))
+        report = ', '.join(f"{label} {seconds * 1000:.0f}ms" for label, seconds in self.startup_timings)
+        print(f"Startup timing: {report}")
+        if EXIT_AFTER_START:
+            Clock.schedule_once(lambda dt: self.stop(), 0)
+    
+    def on_stop(self):
+        """Write settings still waiting in the write-behind queue"""
+        self.settings_manager.store.flush()
+    
+    def ensure_screen(self, screen_name):
+        """Import and build a registered screen if it doesn't exist yet"""
+        if self.sm.has_screen(screen_name):
+            return
+        
+        start = time.perf_counter()
+        module_name, class_name = SCREEN_REGISTRY[screen_name]
+        screen_class = getattr(importlib.import_module(module_name), class_name)
+        self.sm.add_widget(screen_class(name=screen_name, app=self))
+        self.startup_timings.append((f"screen:{screen_name}", time.perf_counter() - start))
+    
+    def schedule_prewarm(self, screen_name):
+        """Build the likely next screen during an idle frame"""
+        next_screen = PREWARM_NEXT.get(screen_name)
+        if next_screen and not self.sm.has_screen(next_screen):
+            Clock.schedule_once(lambda dt: self.ensure_screen(next_screen), PREWARM_DELAY)
+    
     def switch_screen(self, screen_name, direction='left'):
         """Switch to a screen with optional transition direction"""
+        self.ensure_screen(screen_name)
         self.sm.transition.direction = direction
         self.sm.current = screen_name
+        self.schedule_prewarm(screen_name)
 
 if __name__ == '__main__':
     MainApp().run()
@@ -8,8 +8,8 @@ import sys
 import os
 from pathlib import Path
 from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterType
-from PySide6.QtCore import QObject, Signal, Slot, Property
+from PySide6.QtQml import QQmlApplicationEngine, QQmlComponent, qmlRegisterType
+from PySide6.QtCore import QObject, Signal, Slot, Property, QUrl, QTimer
 
 # Add the project directory to Python path
 sys.path.append(str(Path(__file__).parent))
@@ -17,6 +17,62 @@ sys.path.append(str(Path(__file__).parent))
 from qt_models.character_model import CharacterModel
 from qt_models.dice_roller import DiceRoller
 from qt_models.settings_manager import SettingsManager
+from qt_models.roster_model import RosterModel, DEFAULT_CHARACTER_ID
+from qt_models.roll_history_model import RollHistoryModel
+from qt_models.combat_model import CombatModel
+from qt_models.table_sync import TableSync
+from core.sync import DEFAULT_HOST, DEFAULT_PORT, LAN_HOST
+
+QML_DIR = Path(__file__).resolve().parent / "qml"
+
+# Every RollsScreen variant; only the one chosen for the display is ever compiled
+ROLLS_SCREEN_VARIANTS = ("RollsScreen.qml", "RollsScreen_16_9.qml", "RollsScreen_fixed.qml")
+
+def select_rolls_screen(width, height):
+    """Pick the RollsScreen variant for a display size"""
+    if width <= 800:
+        # Raspberry Pi touchscreens
+        return "RollsScreen_fixed.qml"
+    if height and width / height >= 1.7:
+        return "RollsScreen_16_9.qml"
+    return "RollsScreen.qml"
+
+def detect_rolls_screen():
+    """RollsScreen variant for the primary screen"""
+    screen = QGuiApplication.primaryScreen()
+    if screen is None:
+        return "RollsScreen.qml"
+    size = screen.size()
+    return select_rolls_screen(size.width(), size.height())
+
+def table_sync_port(argv):
+    """Port from --table-sync[=PORT] (or --table-sync-lan), or None when table sync is off"""
+    port = None
+    for arg in argv:
+        if arg.startswith("--table-sync="):
+            return int(arg.split("=", 1)[1])
+        if arg in ("--table-sync", "--table-sync-lan"):
+            port = DEFAULT_PORT
+    return port
+
+def table_sync_host(argv):
+    """Interface table sync listens on: localhost, or every interface with --table-sync-lan"""
+    return LAN_HOST if "--table-sync-lan" in argv else DEFAULT_HOST
+
+def precompile_qml(engine):
+    """Compile the QML screens once so Qt's disk cache holds their bytecode"""
+    rolls_screen = detect_rolls_screen()
+    failed = 0
+    for qml_file in sorted(QML_DIR.glob("*.qml")):
+        if qml_file.name in ROLLS_SCREEN_VARIANTS and qml_file.name != rolls_screen:
+            continue
+        component = QQmlComponent(engine, QUrl.fromLocalFile(str(qml_file)))
+        if component.isError():
+            failed += 1
+            print(f"Error compiling {qml_file.name}: {component.errorString()}")
+        else:
+            print(f"Compiled {qml_file.name}")
+    return 1 if failed else 0
 
 class DaggerheartApp(QObject):
     """Main application controller"""
@@ -24,14 +80,29 @@ class DaggerheartApp(QObject):
     # Signals for QML
     screenChanged = Signal(str)
     
-    def __init__(self):
+    def __init__(self, sync_port=None, sync_host=DEFAULT_HOST):
         super().__init__()
         self._current_screen = "menu"
+        self._rolls_screen_source = detect_rolls_screen()
+        self._shut_down = False
         
         # Initialize models
-        self.character = CharacterModel()
-        self.dice_roller = DiceRoller()
         self.settings = SettingsManager()
+        self.roster = RosterModel(settings=self.settings)
+        self.character = self.roster.openCharacter(DEFAULT_CHARACTER_ID, pin=True)
+        self.roll_history = RollHistoryModel()
+        self.dice_roller = DiceRoller()
+        self.dice_roller.bindSettings(self.settings)
+        self.dice_roller.bindHistory(self.roll_history)
+        self.combat = CombatModel()
+        
+        # Optional live feed of the sheet and rolls for other screens at the table
+        self.table_sync = None
+        if sync_port is not None:
+            self.table_sync = TableSync(host=sync_host, port=sync_port)
+            self.table_sync.start()
+            self.table_sync.bindCharacter(self.character)
+            self.table_sync.bindDiceRoller(self.dice_roller)
     
     @Property(str, notify=screenChanged)
     def currentScreen(self):
@@ -43,6 +114,10 @@ class DaggerheartApp(QObject):
             self._current_screen = screen
             self.screenChanged.emit(screen)
     
+    @Property(str, constant=True)
+    def rollsScreenSource(self):
+        return self._rolls_screen_source
+    
     @Slot(str)
     def switchScreen(self, screen_name):
         """Switch to a different screen"""
@@ -52,7 +127,19 @@ class DaggerheartApp(QObject):
     @Slot()
     def exitApp(self):
         """Exit the application"""
+        self.shutdown()
         QGuiApplication.quit()
+    
+    def shutdown(self):
+        """Flush and close settings, roster, roll history and table sync; safe to call twice"""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        self.settings.flushSettings()
+        self.roster.close()
+        self.roll_history.close()
+        if self.table_sync is not None:
+            self.table_sync.stop()
 
 def main():
     app = QGuiApplication(sys.argv)
@@ -62,28 +149,44 @@ def main():
     # Create QML engine
     engine = QQmlApplicationEngine()
     
+    # Install-time step: fill the QML bytecode cache and exit
+    if "--precompile-qml" in sys.argv:
+        return precompile_qml(engine)
+    
     # Register custom types
     qmlRegisterType(CharacterModel, 'DaggerheartModels', 1, 0, 'CharacterModel')
     qmlRegisterType(DiceRoller, 'DaggerheartModels', 1, 0, 'DiceRoller')
     qmlRegisterType(SettingsManager, 'DaggerheartModels', 1, 0, 'SettingsManager')
     
     # Create app instance
-    daggerheart_app = DaggerheartApp()
+    daggerheart_app = DaggerheartApp(sync_port=table_sync_port(sys.argv), sync_host=table_sync_host(sys.argv))
     
     # Expose to QML
     engine.rootContext().setContextProperty("app", daggerheart_app)
     engine.rootContext().setContextProperty("character", daggerheart_app.character)
     engine.rootContext().setContextProperty("diceRoller", daggerheart_app.dice_roller)
     engine.rootContext().setContextProperty("settings", daggerheart_app.settings)
+    engine.rootContext().setContextProperty("roster", daggerheart_app.roster)
+    engine.rootContext().setContextProperty("rollHistory", daggerheart_app.roll_history)
+    engine.rootContext().setContextProperty("combat", daggerheart_app.combat)
+    engine.rootContext().setContextProperty("tableSync", daggerheart_app.table_sync)
     
     # Load main QML file
-    qml_file = Path(__file__).resolve().parent / "qml" / "main.qml"
+    qml_file = QML_DIR / "main.qml"
     engine.load(qml_file)
     
     if not engine.rootObjects():
         return -1
     
-    return app.exec()
+    # Set by the benchmark harness to quit once the event loop is running
+    if os.environ.get("DAGGERHEART_EXIT_AFTER_START"):
+        QTimer.singleShot(0, app.quit)
+    
+    exit_code = app.exec()
+    
+    # Closing the window bypasses exitApp, so shut down here too
+    daggerheart_app.shutdown()
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
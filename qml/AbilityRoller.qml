@@ -0,0 +1,55 @@
+import QtQuick 2.15
+import "rolls.js" as Rolls
+
+// Tirada de habilidad en curso de una pantalla (otras pantallas ignoran sus resultados); compartida por todas las variantes de RollsScreen
+Item {
+    id: abilityRoller
+    
+    // Tipo de tirada y texto del modificador tal como los muestran los ComboBox
+    property string rollType: "Normal"
+    property string modifierText: "Sin modificador"
+    
+    // Textos que la pantalla muestra
+    property string diceText: "🎲 -- 🎲 --"
+    property string resultText: "Pulsa una habilidad para tirar dados"
+    
+    property string pendingAbility: ""
+    property int pendingModifier: 0
+    property int pendingExtra: 0
+    
+    Connections {
+        target: diceRoller
+        
+        function onDiceAnimationFrame(dice) {
+            if (abilityRoller.pendingAbility !== "")
+                abilityRoller.diceText = Rolls.diceText(dice)
+        }
+        
+        function onRollFinished(dice, total, resultType) {
+            if (abilityRoller.pendingAbility === "") return
+            abilityRoller.showResult(dice, total, resultType)
+            abilityRoller.pendingAbility = ""
+        }
+    }
+    
+    function roll(abilityName, modifier) {
+        if (diceRoller.isRolling) return
+        
+        var extraModifiers = Rolls.modifierValues(modifierText)
+        var extraModifier = extraModifiers[Math.floor(Math.random() * extraModifiers.length)]
+        
+        // diceRoller animates and resolves the roll; results arrive through Connections
+        pendingAbility = abilityName
+        pendingModifier = modifier
+        pendingExtra = extraModifier
+        diceRoller.rollAbility(rollType, modifier + extraModifier, abilityName)
+    }
+    
+    function showResult(dice, total, resultType) {
+        var extraText = pendingExtra > 0 ? " + " + pendingExtra : ""
+        var modText = pendingModifier !== 0 ? (pendingModifier > 0 ? " + " + pendingModifier : " " + pendingModifier) : ""
+        
+        diceText = Rolls.diceText(dice)
+        resultText = pendingAbility + ": " + dice[0] + " + " + dice[1] + modText + extraText + " = " + total + "\n" + Rolls.resultTypeText(resultType)
+    }
+}
@@ -99,7 +99,9 @@ Item {
                         TextField {
                             Layout.fillWidth: true
                             text: character.name
-                            onTextChanged: character.name = text
+                            // Only user typing is staged; the model commits once typing pauses
+                            onTextEdited: character.editText("name", text)
+                            onEditingFinished: character.commitEdits()
                             background: Rectangle { radius: 8; color: "#34495e" }
                             color: "#ecf0f1"
                         }
@@ -108,7 +110,8 @@ Item {
                         TextField {
                             Layout.fillWidth: true
                             text: character.className
-                            onTextChanged: character.className = text
+                            onTextEdited: character.editText("className", text)
+                            onEditingFinished: character.commitEdits()
                             background: Rectangle { radius: 8; color: "#34495e" }
                             color: "#ecf0f1"
                         }
@@ -119,7 +122,7 @@ Item {
                             value: character.level
                             from: 1
                             to: 20
-                            onValueChanged: character.level = value
+                            onValueModified: character.setValue("level", value)
                         }
                     }
                 }
@@ -157,8 +160,9 @@ Item {
                         SpinBox {
                             value: character.hpCurrent
                             from: 0
-                            to: 999
-                            onValueChanged: character.hpCurrent = value
+                            to: character.hpMax
+                            // valueModified only fires for user steps, never for the binding's echo
+                            onValueModified: character.setValue("hpCurrent", value)
                         }
                         
                         Text {
@@ -171,12 +175,40 @@ Item {
                             value: character.hpMax
                             from: 1
                             to: 999
-                            onValueChanged: character.hpMax = value
+                            onValueModified: character.setValue("hpMax", value)
                         }
                     }
                 }
             }
             
+            // Undo/redo for mis-taps
+            Row {
+                anchors.horizontalCenter: parent.horizontalCenter
+                spacing: 15
+                
+                ModernButton {
+                    width: isSmallScreen ? 150 : 200
+                    height: 50
+                    text: "↶ Deshacer"
+                    enabled: character.canUndo
+                    opacity: enabled ? 1.0 : 0.5
+                    backgroundColor: "#34495e"
+                    hoverColor: "#2c3e50"
+                    onClicked: character.undo()
+                }
+                
+                ModernButton {
+                    width: isSmallScreen ? 150 : 200
+                    height: 50
+                    text: "↷ Rehacer"
+                    enabled: character.canRedo
+                    opacity: enabled ? 1.0 : 0.5
+                    backgroundColor: "#34495e"
+                    hoverColor: "#2c3e50"
+                    onClicked: character.redo()
+                }
+            }
+            
             // Placeholder for more character features
             Text {
                 anchors.horizontalCenter: parent.horizontalCenter
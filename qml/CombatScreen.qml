@@ -199,13 +199,168 @@ Item {
                 }
             }
             
-            // Placeholder
-            Text {
-                anchors.horizontalCenter: parent.horizontalCenter
-                text: "🚧 Sistema de combate en desarrollo..."
-                font.pixelSize: 18
-                color: "#ffffff"
-                opacity: 0.7
+            // Encounter Tracker Card
+            Rectangle {
+                width: parent.width
+                height: trackerColumn.height + 40
+                radius: 20
+                color: Qt.rgba(44/255, 62/255, 80/255, 0.9)
+                
+                Column {
+                    id: trackerColumn
+                    anchors.centerIn: parent
+                    width: parent.width - 40
+                    spacing: 15
+                    
+                    Row {
+                        width: parent.width
+                        spacing: 15
+                        
+                        Text {
+                            text: "Encuentro"
+                            font.pixelSize: 24
+                            font.bold: true
+                            color: "#ecf0f1"
+                            anchors.verticalCenter: parent.verticalCenter
+                        }
+                        
+                        Text {
+                            text: "Ronda " + combat.round + " · " + combat.count + " combatientes"
+                            font.pixelSize: 16
+                            color: "#bdc3c7"
+                            anchors.verticalCenter: parent.verticalCenter
+                        }
+                    }
+                    
+                    Row {
+                        spacing: 10
+                        
+                        Text {
+                            text: "Daño:"
+                            font.pixelSize: 16
+                            color: "#bdc3c7"
+                            anchors.verticalCenter: parent.verticalCenter
+                        }
+                        
+                        SpinBox {
+                            id: damageSpin
+                            from: 0
+                            to: 99
+                            value: 8
+                            editable: true
+                        }
+                    }
+                    
+                    GridLayout {
+                        width: parent.width
+                        columns: isSmallScreen ? 2 : 4
+                        rowSpacing: 10
+                        columnSpacing: 10
+                        
+                        ModernButton {
+                            Layout.fillWidth: true
+                            Layout.preferredHeight: 50
+                            text: "➕ Adversario"
+                            backgroundColor: "#8e44ad"
+                            hoverColor: "#7d3c98"
+                            onClicked: combat.addAdversary("Adversario " + (combat.count + 1), 10, 1, 8, 15, 3)
+                        }
+                        
+                        ModernButton {
+                            Layout.fillWidth: true
+                            Layout.preferredHeight: 50
+                            text: "➕ 10 Esbirros"
+                            backgroundColor: "#16a085"
+                            hoverColor: "#138d75"
+                            onClicked: combat.addMinions("Esbirro", 10, 1, 1)
+                        }
+                        
+                        ModernButton {
+                            Layout.fillWidth: true
+                            Layout.preferredHeight: 50
+                            text: "💥 Daño a todos"
+                            backgroundColor: "#e74c3c"
+                            hoverColor: "#c0392b"
+                            onClicked: combat.damageAll(damageSpin.value)
+                        }
+                        
+                        ModernButton {
+                            Layout.fillWidth: true
+                            Layout.preferredHeight: 50
+                            text: "🔦 Siguiente turno"
+                            backgroundColor: "#f39c12"
+                            hoverColor: "#d68910"
+                            onClicked: combat.nextTurn()
+                        }
+                    }
+                    
+                    ListView {
+                        id: combatantList
+                        width: parent.width
+                        height: Math.min(contentHeight, 400)
+                        clip: true
+                        spacing: 6
+                        model: combat
+                        
+                        delegate: Rectangle {
+                            width: combatantList.width
+                            height: 48
+                            radius: 8
+                            color: model.spotlight ? Qt.rgba(243/255, 156/255, 18/255, 0.35) : Qt.rgba(1, 1, 1, 0.08)
+                            opacity: model.defeated ? 0.4 : 1.0
+                            
+                            Row {
+                                anchors.fill: parent
+                                anchors.leftMargin: 12
+                                anchors.rightMargin: 12
+                                spacing: 12
+                                
+                                Text {
+                                    width: parent.width * 0.35
+                                    text: model.name
+                                    font.pixelSize: 16
+                                    font.bold: model.spotlight
+                                    color: "#ecf0f1"
+                                    elide: Text.ElideRight
+                                    anchors.verticalCenter: parent.verticalCenter
+                                }
+                                
+                                Text {
+                                    width: parent.width * 0.2
+                                    text: "❤️ " + model.hp + "/" + model.hpMax
+                                    font.pixelSize: 16
+                                    color: "#e74c3c"
+                                    anchors.verticalCenter: parent.verticalCenter
+                                }
+                                
+                                Text {
+                                    width: parent.width * 0.2
+                                    text: model.kind === "minion" ? "Esbirro" : model.minor + "/" + model.major + "/" + model.severe
+                                    font.pixelSize: 14
+                                    color: "#bdc3c7"
+                                    anchors.verticalCenter: parent.verticalCenter
+                                }
+                                
+                                ModernButton {
+                                    width: parent.width * 0.15
+                                    height: 36
+                                    text: "⚔️"
+                                    enabled: !model.defeated
+                                    backgroundColor: "#c0392b"
+                                    hoverColor: "#a93226"
+                                    anchors.verticalCenter: parent.verticalCenter
+                                    onClicked: combat.damage(index, damageSpin.value)
+                                }
+                            }
+                            
+                            MouseArea {
+                                anchors.fill: parent
+                                z: -1
+                                onClicked: combat.setSpotlight(index)
+                            }
+                        }
+                    }
+                }
             }
         }
         }
@@ -0,0 +1,48 @@
+import QtQuick 2.15
+import "rolls.js" as Rolls
+
+// Historial de tiradas - el modelo carga páginas al desplazarse; compartido por todas las variantes de RollsScreen
+Rectangle {
+    id: historyPanel
+    
+    property int padding: 20
+    property int titleSize: 20
+    property int fontSize: 14
+    
+    radius: 20
+    color: Qt.rgba(44/255, 62/255, 80/255, 0.9)
+    
+    Column {
+        anchors.fill: parent
+        anchors.margins: historyPanel.padding
+        spacing: 10
+        
+        Text {
+            id: historyTitle
+            width: parent.width
+            text: "Historial (" + rollHistory.count + ")  ·  Esperanza +" + rollHistory.sessionHope + "  ·  Miedo +" + rollHistory.sessionFear
+            font.pixelSize: historyPanel.titleSize
+            font.bold: true
+            color: "#ecf0f1"
+            elide: Text.ElideRight
+        }
+        
+        ListView {
+            width: parent.width
+            height: parent.height - historyTitle.height - parent.spacing
+            clip: true
+            model: rollHistory
+            
+            delegate: Text {
+                width: ListView.view.width
+                text: (ability !== "" ? ability + " · " : "") + rollType + ": " + dice.join(" + ") +
+                      (diceCount > dice.length ? " …" : "") +
+                      (modifier !== 0 ? (modifier > 0 ? " + " : " ") + modifier : "") + " = " + total +
+                      (kind === "ability" ? "  " + Rolls.resultTypeText(resultType) : "")
+                font.pixelSize: historyPanel.fontSize
+                color: resultType === "critical_success" ? "#f1c40f" : "#bdc3c7"
+                elide: Text.ElideRight
+            }
+        }
+    }
+}
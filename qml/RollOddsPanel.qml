@@ -0,0 +1,77 @@
+import QtQuick 2.15
+import "rolls.js" as Rolls
+
+// Probabilidades exactas de cada resultado, compartidas por todas las variantes de RollsScreen
+Rectangle {
+    id: oddsPanel
+    
+    // Tipo de tirada y texto del modificador tal como los muestran los ComboBox
+    property string rollType: "Normal"
+    property string modifierText: "Sin modificador"
+    property int fontSize: 12
+    
+    property var rollOdds: computeOdds(rollType, modifierText)
+    
+    height: oddsColumn.height + 20
+    radius: 15
+    color: Qt.rgba(142/255, 68/255, 173/255, 0.9) // Purple accent
+    
+    Column {
+        id: oddsColumn
+        anchors.centerIn: parent
+        width: parent.width - 20
+        spacing: 8
+        
+        Text {
+            text: "Stats Rápidas"
+            font.pixelSize: oddsPanel.fontSize + 4
+            font.bold: true
+            color: "#ecf0f1"
+            anchors.horizontalCenter: parent.horizontalCenter
+        }
+        
+        Text {
+            text: "Éxito Crítico: 22+ (" + formatOdds(rollOdds.critical_success) + ")"
+            font.pixelSize: oddsPanel.fontSize
+            color: "#f1c40f"
+            anchors.horizontalCenter: parent.horizontalCenter
+        }
+        
+        Text {
+            text: "Éxito Mayor: 16-21 (" + formatOdds(rollOdds.major_success) + ")"
+            font.pixelSize: oddsPanel.fontSize
+            color: "#2ecc71"
+            anchors.horizontalCenter: parent.horizontalCenter
+        }
+        
+        Text {
+            text: "Éxito Menor: 10-15 (" + formatOdds(rollOdds.minor_success) + ")"
+            font.pixelSize: oddsPanel.fontSize
+            color: "#3498db"
+            anchors.horizontalCenter: parent.horizontalCenter
+        }
+        
+        Text {
+            text: "Fallo: <10 (" + formatOdds(rollOdds.failure) + ")"
+            font.pixelSize: oddsPanel.fontSize
+            color: "#e74c3c"
+            anchors.horizontalCenter: parent.horizontalCenter
+        }
+    }
+    
+    function computeOdds(rollType, modifierText) {
+        // "1d4" se promedia sobre sus cuatro caras
+        var modifiers = Rolls.modifierValues(modifierText)
+        
+        var odds = {"critical_success": 0, "major_success": 0, "minor_success": 0, "failure": 0}
+        for (var i = 0; i < modifiers.length; i++) {
+            var partial = diceRoller.rollOdds(rollType, modifiers[i])
+            for (var key in odds) odds[key] += partial[key] / modifiers.length
+        }
+        return odds
+    }
+    
+    function formatOdds(probability) {
+        return Math.round(probability * 100) + "%"
+    }
+}
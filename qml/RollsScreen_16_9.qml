@@ -15,6 +15,13 @@ Item {
     property int buttonHeight: isWideScreen ? 90 : 100
     property int cardPadding: isWideScreen ? 30 : 20
     
+    // Tirada en curso de esta pantalla (componente compartido con las otras variantes)
+    AbilityRoller {
+        id: abilityRoller
+        rollType: rollTypeCombo.currentText
+        modifierText: modifierCombo.currentText
+    }
+    
     // Beautiful gradient background specific to rolls
     Rectangle {
         anchors.fill: parent
@@ -212,7 +219,7 @@ Item {
                         Text {
                             id: diceDisplay
                             anchors.horizontalCenter: parent.horizontalCenter
-                            text: "🎲 -- 🎲 --"
+                            text: abilityRoller.diceText
                             font.pixelSize: isWideScreen ? 36 : 48
                             color: "#f39c12"
                         }
@@ -221,7 +228,7 @@ Item {
                         Text {
                             id: resultText
                             anchors.horizontalCenter: parent.horizontalCenter
-                            text: "Pulsa una habilidad para tirar dados"
+                            text: abilityRoller.resultText
                             font.pixelSize: isWideScreen ? 14 : 18
                             color: "#bdc3c7"
                             wrapMode: Text.Wrap
@@ -231,55 +238,14 @@ Item {
                     }
                 }
                 
-                // Quick Stats Card - nueva sección para 16:9
-                Rectangle {
+                // Quick Stats Card - probabilidades exactas (componente compartido)
+                RollOddsPanel {
                     width: parent.width * (isWideScreen ? 0.25 : 0.0)
                     height: parent.height
                     radius: isWideScreen ? 15 : 20
-                    color: Qt.rgba(142/255, 68/255, 173/255, 0.9) // Purple accent
                     visible: isWideScreen
-                    
-                    Column {
-                        anchors.centerIn: parent
-                        width: parent.width - 20
-                        spacing: 8
-                        
-                        Text {
-                            text: "Stats Rápidas"
-                            font.pixelSize: 16
-                            font.bold: true
-                            color: "#ecf0f1"
-                            anchors.horizontalCenter: parent.horizontalCenter
-                        }
-                        
-                        Text {
-                            text: "Éxito Crítico: 22+"
-                            font.pixelSize: 12
-                            color: "#f1c40f"
-                            anchors.horizontalCenter: parent.horizontalCenter
-                        }
-                        
-                        Text {
-                            text: "Éxito Mayor: 16-21"
-                            font.pixelSize: 12
-                            color: "#2ecc71"
-                            anchors.horizontalCenter: parent.horizontalCenter
-                        }
-                        
-                        Text {
-                            text: "Éxito Menor: 10-15"
-                            font.pixelSize: 12
-                            color: "#3498db"
-                            anchors.horizontalCenter: parent.horizontalCenter
-                        }
-                        
-                        Text {
-                            text: "Fallo: <10"
-                            font.pixelSize: 12
-                            color: "#e74c3c"
-                            anchors.horizontalCenter: parent.horizontalCenter
-                        }
-                    }
+                    rollType: rollTypeCombo.currentText
+                    modifierText: modifierCombo.currentText
                 }
             }
             
@@ -319,7 +285,7 @@ Item {
                             backgroundColor: "#e74c3c"
                             hoverColor: "#c0392b"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Fuerza", 2)
+                            onClicked: abilityRoller.roll("Fuerza", 2)
                         }
                         
                         ModernButton {
@@ -329,7 +295,7 @@ Item {
                             backgroundColor: "#f39c12"
                             hoverColor: "#d68910"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Destreza", 1)
+                            onClicked: abilityRoller.roll("Destreza", 1)
                         }
                         
                         ModernButton {
@@ -339,7 +305,7 @@ Item {
                             backgroundColor: "#9b59b6"
                             hoverColor: "#8e44ad"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Carisma", 0)
+                            onClicked: abilityRoller.roll("Carisma", 0)
                         }
                         
                         ModernButton {
@@ -349,7 +315,7 @@ Item {
                             backgroundColor: "#27ae60"
                             hoverColor: "#229954"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Constitución", 1)
+                            onClicked: abilityRoller.roll("Constitución", 1)
                         }
                         
                         ModernButton {
@@ -359,7 +325,7 @@ Item {
                             backgroundColor: "#3498db"
                             hoverColor: "#2980b9"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Sabiduría", 0)
+                            onClicked: abilityRoller.roll("Sabiduría", 0)
                         }
                         
                         ModernButton {
@@ -369,95 +335,21 @@ Item {
                             backgroundColor: "#95a5a6"
                             hoverColor: "#7f8c8d"
                             fontSize: isWideScreen ? 16 : 20
-                            onClicked: rollAbility("Inteligencia", -1)
+                            onClicked: abilityRoller.roll("Inteligencia", -1)
                         }
                     }
                 }
             }
-        }
-    }
-    
-    function rollAbility(abilityName, modifier) {
-        var rollType = rollTypeCombo.currentText
-        var modifierText = modifierCombo.currentText
-        
-        // Convert modifier text to number
-        var extraModifier = 0
-        if (modifierText === "+1") extraModifier = 1
-        else if (modifierText === "+2") extraModifier = 2
-        else if (modifierText === "1d4") extraModifier = Math.floor(Math.random() * 4) + 1
-        
-        // Start dice animation
-        animateDiceRoll(abilityName, modifier, extraModifier, rollType)
-    }
-    
-    function animateDiceRoll(ability, mod, extra, rollType) {
-        // Animate rolling
-        var animationFrames = 15
-        var currentFrame = 0
-        
-        var rollTimer = Qt.createQmlObject('import QtQuick 2.15; Timer {}', rollsScreen)
-        rollTimer.interval = 80
-        rollTimer.repeat = true
-        
-        rollTimer.triggered.connect(function() {
-            if (currentFrame < animationFrames) {
-                var d1 = Math.floor(Math.random() * 12) + 1
-                var d2 = Math.floor(Math.random() * 12) + 1
-                diceDisplay.text = "🎲 " + d1 + " 🎲 " + d2
-                currentFrame++
-            } else {
-                rollTimer.stop()
-                rollTimer.destroy()
-                
-                // Calculate final result
-                var dice = calculateDiceRoll(rollType)
-                var total = dice[0] + dice[1] + mod + extra
-                
-                diceDisplay.text = "🎲 " + dice[0] + " 🎲 " + dice[1]
-                
-                var resultType = getResultType(total)
-                var extraText = extra > 0 ? " + " + extra : ""
-                var modText = mod !== 0 ? (mod > 0 ? " + " + mod : " " + mod) : ""
-                
-                resultText.text = ability + ": " + dice[0] + " + " + dice[1] + modText + extraText + " = " + total + "\n" + resultType
+            
+            // Historial de tiradas (componente compartido con las otras variantes)
+            RollHistoryPanel {
+                width: parent.width
+                height: 300
+                radius: isWideScreen ? 15 : 20
+                padding: cardPadding
+                titleSize: isWideScreen ? 18 : 20
+                fontSize: isSmallScreen ? 12 : 14
             }
-        })
-        
-        rollTimer.start()
-    }
-    
-    function calculateDiceRoll(rollType) {
-        switch(rollType) {
-            case "Normal":
-                return [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-            case "Ventaja":
-                var rolls = [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            case "Desventaja":
-                var rolls = [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-                rolls.sort(function(a, b) { return a - b })
-                return [rolls[0], rolls[1]]
-            case "Doble Ventaja":
-                var rolls = []
-                for (var i = 0; i < 4; i++) rolls.push(Math.floor(Math.random() * 12) + 1)
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            case "Triple Ventaja":
-                var rolls = []
-                for (var i = 0; i < 5; i++) rolls.push(Math.floor(Math.random() * 12) + 1)
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            default:
-                return [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
         }
     }
-    
-    function getResultType(total) {
-        if (total >= 22) return "🌟 ÉXITO CRÍTICO! 🌟"
-        else if (total >= 16) return "⭐ Éxito Mayor ⭐"
-        else if (total >= 10) return "✨ Éxito Menor ✨"
-        else return "💥 Fallo 💥"
-    }
 }
@@ -9,6 +9,13 @@ Item {
     property bool isSmallScreen: width <= 800
     property real scaleFactor: isSmallScreen ? 0.8 : 1.0
     
+    // Tirada en curso de esta pantalla (componente compartido con las otras variantes)
+    AbilityRoller {
+        id: abilityRoller
+        rollType: rollTypeCombo.currentText
+        modifierText: modifierCombo.currentText
+    }
+    
     // Beautiful gradient background specific to rolls
     Rectangle {
         anchors.fill: parent
@@ -192,7 +199,7 @@ Item {
                             Text {
                                 id: diceDisplay
                                 anchors.horizontalCenter: parent.horizontalCenter
-                                text: "🎲 -- 🎲 --"
+                                text: abilityRoller.diceText
                                 font.pixelSize: 36
                                 color: "#f39c12"
                             }
@@ -201,7 +208,7 @@ Item {
                             Text {
                                 id: resultText
                                 anchors.horizontalCenter: parent.horizontalCenter
-                                text: "Pulsa una habilidad para tirar dados"
+                                text: abilityRoller.resultText
                                 font.pixelSize: 14
                                 color: "#bdc3c7"
                                 wrapMode: Text.Wrap
@@ -210,6 +217,15 @@ Item {
                             }
                         }
                     }
+                    
+                    // Probabilidades exactas (componente compartido con las otras variantes)
+                    RollOddsPanel {
+                        width: parent.width
+                        radius: isSmallScreen ? 15 : 20
+                        fontSize: 14
+                        rollType: rollTypeCombo.currentText
+                        modifierText: modifierCombo.currentText
+                    }
                 }
                 
                 // Columna derecha - Habilidades (más ancha)
@@ -251,7 +267,7 @@ Item {
                                     backgroundColor: "#e74c3c"
                                     hoverColor: "#c0392b"
                                     fontSize: 18
-                                    onClicked: rollAbility("Fuerza", 2)
+                                    onClicked: abilityRoller.roll("Fuerza", 2)
                                 }
                                 
                                 ModernButton {
@@ -261,7 +277,7 @@ Item {
                                     backgroundColor: "#f39c12"
                                     hoverColor: "#d68910"
                                     fontSize: 18
-                                    onClicked: rollAbility("Destreza", 1)
+                                    onClicked: abilityRoller.roll("Destreza", 1)
                                 }
                                 
                                 ModernButton {
@@ -271,7 +287,7 @@ Item {
                                     backgroundColor: "#9b59b6"
                                     hoverColor: "#8e44ad"
                                     fontSize: 18
-                                    onClicked: rollAbility("Carisma", 0)
+                                    onClicked: abilityRoller.roll("Carisma", 0)
                                 }
                                 
                                 ModernButton {
@@ -281,7 +297,7 @@ Item {
                                     backgroundColor: "#27ae60"
                                     hoverColor: "#229954"
                                     fontSize: 18
-                                    onClicked: rollAbility("Constitución", 1)
+                                    onClicked: abilityRoller.roll("Constitución", 1)
                                 }
                                 
                                 ModernButton {
@@ -291,7 +307,7 @@ Item {
                                     backgroundColor: "#3498db"
                                     hoverColor: "#2980b9"
                                     fontSize: 18
-                                    onClicked: rollAbility("Sabiduría", 0)
+                                    onClicked: abilityRoller.roll("Sabiduría", 0)
                                 }
                                 
                                 ModernButton {
@@ -301,97 +317,23 @@ Item {
                                     backgroundColor: "#95a5a6"
                                     hoverColor: "#7f8c8d"
                                     fontSize: 18
-                                    onClicked: rollAbility("Inteligencia", -1)
+                                    onClicked: abilityRoller.roll("Inteligencia", -1)
                                 }
                             }
                         }
                     }
                 }
             }
-        }
-    }
-    
-    function rollAbility(abilityName, modifier) {
-        var rollType = rollTypeCombo.currentText
-        var modifierText = modifierCombo.currentText
-        
-        // Convert modifier text to number
-        var extraModifier = 0
-        if (modifierText === "+1") extraModifier = 1
-        else if (modifierText === "+2") extraModifier = 2
-        else if (modifierText === "1d4") extraModifier = Math.floor(Math.random() * 4) + 1
-        
-        // Start dice animation
-        animateDiceRoll(abilityName, modifier, extraModifier, rollType)
-    }
-    
-    function animateDiceRoll(ability, mod, extra, rollType) {
-        // Animate rolling
-        var animationFrames = 15
-        var currentFrame = 0
-        
-        var rollTimer = Qt.createQmlObject('import QtQuick 2.15; Timer {}', rollsScreen)
-        rollTimer.interval = 80
-        rollTimer.repeat = true
-        
-        rollTimer.triggered.connect(function() {
-            if (currentFrame < animationFrames) {
-                var d1 = Math.floor(Math.random() * 12) + 1
-                var d2 = Math.floor(Math.random() * 12) + 1
-                diceDisplay.text = "🎲 " + d1 + " 🎲 " + d2
-                currentFrame++
-            } else {
-                rollTimer.stop()
-                rollTimer.destroy()
-                
-                // Calculate final result
-                var dice = calculateDiceRoll(rollType)
-                var total = dice[0] + dice[1] + mod + extra
-                
-                diceDisplay.text = "🎲 " + dice[0] + " 🎲 " + dice[1]
-                
-                var resultType = getResultType(total)
-                var extraText = extra > 0 ? " + " + extra : ""
-                var modText = mod !== 0 ? (mod > 0 ? " + " + mod : " " + mod) : ""
-                
-                resultText.text = ability + ": " + dice[0] + " + " + dice[1] + modText + extraText + " = " + total + "\n" + resultType
+            
+            // Historial de tiradas (componente compartido con las otras variantes)
+            RollHistoryPanel {
+                width: parent.width
+                height: isSmallScreen ? 220 : 300
+                radius: isSmallScreen ? 15 : 20
+                padding: isSmallScreen ? 15 : 20
+                titleSize: isSmallScreen ? 16 : 20
+                fontSize: isSmallScreen ? 12 : 14
             }
-        })
-        
-        rollTimer.start()
-    }
-    
-    function calculateDiceRoll(rollType) {
-        switch(rollType) {
-            case "Normal":
-                return [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-            case "Ventaja":
-                var rolls = [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            case "Desventaja":
-                var rolls = [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
-                rolls.sort(function(a, b) { return a - b })
-                return [rolls[0], rolls[1]]
-            case "Doble Ventaja":
-                var rolls = []
-                for (var i = 0; i < 4; i++) rolls.push(Math.floor(Math.random() * 12) + 1)
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            case "Triple Ventaja":
-                var rolls = []
-                for (var i = 0; i < 5; i++) rolls.push(Math.floor(Math.random() * 12) + 1)
-                rolls.sort(function(a, b) { return b - a })
-                return [rolls[0], rolls[1]]
-            default:
-                return [Math.floor(Math.random() * 12) + 1, Math.floor(Math.random() * 12) + 1]
         }
     }
-    
-    function getResultType(total) {
-        if (total >= 22) return "🌟 ÉXITO CRÍTICO! 🌟"
-        else if (total >= 16) return "⭐ Éxito Mayor ⭐"
-        else if (total >= 10) return "✨ Éxito Menor ✨"
-        else return "💥 Fallo 💥"
-    }
 }
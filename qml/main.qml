@@ -47,31 +47,47 @@ ApplicationWindow {
         }
     }
     
+    // Screens are compiled and created on first visit, then kept alive.
+    // app.rollsScreenSource picks the one RollsScreen variant for this display.
+    property var screenSources: ({
+        "rolls": app.rollsScreenSource,
+        "character": "CharacterScreen.qml",
+        "combat": "CombatScreen.qml",
+        "settings": "SettingsScreen.qml"
+    })
+    property string currentScreen: "rolls"
+    property var visitedScreens: ({"rolls": true})
+    property var screenHistory: []
+    
     // Main content area
-    StackView {
-        id: stackView
+    Item {
+        id: screenContainer
         anchors.fill: parent
         anchors.bottomMargin: bottomNavigation.height
+        clip: true
         
-        initialItem: RollsScreen {}
-        
-        pushEnter: Transition {
-            PropertyAnimation {
-                property: "x"
-                from: stackView.width
-                to: 0
-                duration: settings.animationsEnabled ? 300 : 0
-                easing.type: Easing.OutCubic
-            }
-        }
-        
-        pushExit: Transition {
-            PropertyAnimation {
-                property: "x"
-                from: 0
-                to: -stackView.width
-                duration: settings.animationsEnabled ? 300 : 0
-                easing.type: Easing.OutCubic
+        Repeater {
+            model: ["rolls", "character", "combat", "settings"]
+            
+            Loader {
+                id: screenLoader
+                width: screenContainer.width
+                height: screenContainer.height
+                active: window.visitedScreens[modelData] === true
+                visible: window.currentScreen === modelData
+                source: window.screenSources[modelData]
+                
+                onVisibleChanged: if (visible) slideIn.restart()
+                
+                NumberAnimation {
+                    id: slideIn
+                    target: screenLoader
+                    property: "x"
+                    from: screenContainer.width
+                    to: 0
+                    duration: settings.animationsEnabled ? 300 : 0
+                    easing.type: Easing.OutCubic
+                }
             }
         }
     }
@@ -90,40 +106,29 @@ ApplicationWindow {
     }
     
     // Screen switching function
-    function switchToScreen(screenName) {
-        var component
-        
-        switch(screenName) {
-            case "rolls":
-                component = Qt.createComponent("RollsScreen.qml")
-                break
-            case "character":
-                component = Qt.createComponent("CharacterScreen.qml")
-                break
-            case "combat":
-                component = Qt.createComponent("CombatScreen.qml")
-                break
-            case "settings":
-                component = Qt.createComponent("SettingsScreen.qml")
-                break
-            default:
-                console.log("Unknown screen:", screenName)
-                return
+    function switchToScreen(screenName, remember) {
+        if (!(screenName in screenSources)) {
+            console.log("Unknown screen:", screenName)
+            return
         }
+        if (screenName === currentScreen) return
         
-        if (component.status === Component.Ready) {
-            stackView.push(component)
-            app.switchScreen(screenName)
-        } else {
-            console.log("Error loading screen:", component.errorString())
+        if (remember !== false) screenHistory.push(currentScreen)
+        if (!visitedScreens[screenName]) {
+            var visited = Object.assign({}, visitedScreens)
+            visited[screenName] = true
+            visitedScreens = visited
         }
+        currentScreen = screenName
+        bottomNavigation.currentScreen = screenName
+        app.switchScreen(screenName)
     }
     
     // Handle back button
     onClosing: function(close) {
-        if (stackView.depth > 1) {
+        if (screenHistory.length > 0) {
             close.accepted = false
-            stackView.pop()
+            switchToScreen(screenHistory.pop(), false)
         } else {
             app.exitApp()
         }
@@ -0,0 +1,24 @@
+.pragma library
+
+// Textos y modificadores de las tiradas de habilidad, compartidos por todas las variantes de RollsScreen
+
+// Valores posibles del modificador extra elegido en el ComboBox ("1d4" tiene cuatro caras)
+function modifierValues(modifierText) {
+    if (modifierText === "+1") return [1]
+    if (modifierText === "+2") return [2]
+    if (modifierText === "1d4") return [1, 2, 3, 4]
+    return [0]
+}
+
+function diceText(dice) {
+    return "🎲 " + dice[0] + " 🎲 " + dice[1]
+}
+
+function resultTypeText(resultType) {
+    switch(resultType) {
+        case "critical_success": return "🌟 ÉXITO CRÍTICO! 🌟"
+        case "major_success": return "⭐ Éxito Mayor ⭐"
+        case "minor_success": return "✨ Éxito Menor ✨"
+        default: return "💥 Fallo 💥"
+    }
+}
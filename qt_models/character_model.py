@@ -3,10 +3,30 @@ Character Model for Qt/QML Version
 Manages character data with Qt properties and signals
 """
 
-from PySide6.QtCore import QObject, Signal, Property
+from contextlib import contextmanager
+from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer
+
+from core.character import CharacterState, DEFAULT_ABILITIES
+from core.undo import UNDO_LIMIT, UndoHistory
+
+# Quiet period after the last keystroke before a text edit is committed (ms)
+EDIT_COMMIT_DELAY = 400
 
 class CharacterModel(QObject):
-    """Character data model with Qt properties"""
+    """Character data model with Qt properties, wrapping a core CharacterState"""
+    
+    # Scalar properties saved with the character, in load order
+    # (hpMax before hpCurrent so the current HP clamp sees the right maximum)
+    PERSISTED_PROPERTIES = ("name", "className", "level", "hpMax", "hpCurrent", "armor", "hope", "fear")
+    
+    # CharacterState field behind each property
+    STATE_FIELDS = {
+        "name": "name", "className": "class_name", "level": "level", "hpMax": "hp_max",
+        "hpCurrent": "hp_current", "armor": "armor", "hope": "hope", "fear": "fear",
+    }
+    
+    # Properties edited as free text, committed after a pause in typing
+    TEXT_PROPERTIES = ("name", "className")
     
     # Signals for property changes
     nameChanged = Signal()
@@ -18,174 +38,315 @@ class CharacterModel(QObject):
     abilitiesChanged = Signal()
     hopeChanged = Signal()
     fearChanged = Signal()
+    dirtyChanged = Signal()
+    historyChanged = Signal()
     
-    def __init__(self):
+    def __init__(self, undo_limit=UNDO_LIMIT):
         super().__init__()
         
-        # Character basic info
-        self._name = "Mi Personaje"
-        self._class_name = "Guerrero"
-        self._level = 1
-        
-        # Health and defense
-        self._hp_current = 30
-        self._hp_max = 30
-        self._armor = 2
+        # All rules live in the headless state; this class only adds signals
+        self._state = CharacterState()
         
-        # Resources
-        self._hope = 1
-        self._fear = 0
+        # Open update batches and, per property changed inside them, its value before the batch
+        self._batch_depth = 0
+        self._batch_before = {}
         
-        # Abilities
-        self._abilities = {
-            "Fuerza": 2,
-            "Destreza": 1,
-            "Carisma": 0,
-            "Constitución": 1,
-            "Sabiduría": 0,
-            "Inteligencia": -1
-        }
+        # Text edits not yet applied to the state, committed together once typing pauses
+        self._edits = {}
+        self._edit_timer = QTimer()
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(EDIT_COMMIT_DELAY)
+        self._edit_timer.timeout.connect(self.commitEdits)
         
-        # Thresholds
-        self._thresholds = {
-            "minor": 10,
-            "major": 16,
-            "severe": 22
-        }
+        # Undo steps hold only the values that changed; a batch is one step
+        self._undo = UndoHistory(undo_limit)
+        self._restoring = False
+    
+    @property
+    def state(self):
+        """The wrapped core CharacterState"""
+        return self._state
     
     # Name property
     @Property(str, notify=nameChanged)
     def name(self):
-        return self._name
+        return self._state.name
     
     @name.setter
     def name(self, value):
-        if self._name != value:
-            self._name = value
-            self.nameChanged.emit()
+        self._apply("name", self._state.set_name, value)
     
     # Class name property
     @Property(str, notify=classNameChanged)
     def className(self):
-        return self._class_name
+        return self._state.class_name
     
     @className.setter
     def className(self, value):
-        if self._class_name != value:
-            self._class_name = value
-            self.classNameChanged.emit()
+        self._apply("className", self._state.set_class_name, value)
     
     # Level property
     @Property(int, notify=levelChanged)
     def level(self):
-        return self._level
+        return self._state.level
     
     @level.setter
     def level(self, value):
-        if self._level != value:
-            self._level = value
-            self.levelChanged.emit()
+        self._apply("level", self._state.set_level, value)
     
     # Current HP property
     @Property(int, notify=hpCurrentChanged)
     def hpCurrent(self):
-        return self._hp_current
+        return self._state.hp_current
     
     @hpCurrent.setter
     def hpCurrent(self, value):
-        if self._hp_current != value:
-            self._hp_current = max(0, min(self._hp_max, value))
-            self.hpCurrentChanged.emit()
+        self._apply("hpCurrent", self._state.set_hp_current, value)
     
     # Max HP property
     @Property(int, notify=hpMaxChanged)
     def hpMax(self):
-        return self._hp_max
+        return self._state.hp_max
     
     @hpMax.setter
     def hpMax(self, value):
-        if self._hp_max != value:
-            self._hp_max = value
-            self.hpMaxChanged.emit()
+        self._apply("hpMax", self._state.set_hp_max, value)
     
     # Armor property
     @Property(int, notify=armorChanged)
     def armor(self):
-        return self._armor
+        return self._state.armor
     
     @armor.setter
     def armor(self, value):
-        if self._armor != value:
-            self._armor = value
-            self.armorChanged.emit()
+        self._apply("armor", self._state.set_armor, value)
     
     # Hope property
     @Property(int, notify=hopeChanged)
     def hope(self):
-        return self._hope
+        return self._state.hope
     
     @hope.setter
     def hope(self, value):
-        if self._hope != value:
-            self._hope = max(0, value)
-            self.hopeChanged.emit()
+        self._apply("hope", self._state.set_hope, value)
     
     # Fear property
     @Property(int, notify=fearChanged)
     def fear(self):
-        return self._fear
+        return self._state.fear
     
     @fear.setter
     def fear(self, value):
-        if self._fear != value:
-            self._fear = max(0, value)
-            self.fearChanged.emit()
+        self._apply("fear", self._state.set_fear, value)
     
     # Ability getters/setters
     def getAbility(self, ability_name):
-        return self._abilities.get(ability_name, 0)
+        return self._state.get_ability(ability_name)
     
     def setAbility(self, ability_name, value):
-        if ability_name in self._abilities:
-            self._abilities[ability_name] = value
-            self.abilitiesChanged.emit()
+        self._apply("abilities", self._state.set_ability, ability_name, value)
+    
+    def getAbilities(self):
+        return dict(self._state.abilities)
+    
+    # Batched updates
+    @Slot()
+    def beginUpdate(self):
+        """Hold change signals until the matching commitUpdate (batches nest)"""
+        self._batch_depth += 1
+        self._undo.begin()
+    
+    @Slot()
+    def commitUpdate(self):
+        """Close a batch; the outermost one emits one signal per property that ended up changed"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        pushed = self._undo.commit()
+        if not self._batch_depth:
+            before, self._batch_before = self._batch_before, {}
+            for key, value in before.items():
+                if self._value(key) != value:
+                    getattr(self, key + "Changed").emit()
+        if pushed:
+            self.historyChanged.emit()
+    
+    @contextmanager
+    def updates(self):
+        """Context manager around beginUpdate/commitUpdate"""
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.commitUpdate()
+    
+    def _value(self, key):
+        if key == "abilities":
+            return dict(self._state.abilities)
+        return getattr(self, key)
+    
+    def _apply(self, key, setter, *args):
+        """Run a state setter, record it for undo and emit (or, inside a batch, defer) key's change signal"""
+        undo_key = ("abilities", args[0]) if key == "abilities" else key
+        old = self._undo_value(undo_key)
+        if self._batch_depth and key not in self._batch_before:
+            before = self._value(key)
+            changed = setter(*args)
+            if changed:
+                self._batch_before[key] = before
+        else:
+            changed = setter(*args)
+            if changed and not self._batch_depth:
+                getattr(self, key + "Changed").emit()
+        if changed and not self._restoring and self._undo.record(undo_key, old, self._undo_value(undo_key)):
+            self.historyChanged.emit()
+    
+    def _undo_value(self, undo_key):
+        if isinstance(undo_key, tuple):
+            return self._state.abilities.get(undo_key[1])
+        return getattr(self._state, self.STATE_FIELDS[undo_key])
+    
+    # Undo/redo
+    @Property(bool, notify=historyChanged)
+    def canUndo(self):
+        return self._undo.can_undo
+    
+    @Property(bool, notify=historyChanged)
+    def canRedo(self):
+        return self._undo.can_redo
+    
+    @Slot()
+    def undo(self):
+        """Revert the last change or batch; only properties that end up different emit"""
+        self.commitEdits()
+        step = self._undo.undo()
+        if step is not None:
+            self._restore([(key, before) for key, before, after in reversed(step)])
+            self.historyChanged.emit()
+    
+    @Slot()
+    def redo(self):
+        """Reapply the last undone change or batch"""
+        self.commitEdits()
+        step = self._undo.redo()
+        if step is not None:
+            self._restore([(key, after) for key, before, after in step])
+            self.historyChanged.emit()
+    
+    @Slot()
+    def clearHistory(self):
+        """Forget every undo and redo step (e.g. after loading a saved sheet)"""
+        self._undo.clear()
+        self.historyChanged.emit()
+    
+    def _restore(self, values):
+        # Values are written back as they were held, without setter clamps
+        self._restoring = True
+        try:
+            with self.updates():
+                for undo_key, value in values:
+                    if isinstance(undo_key, tuple):
+                        self._apply("abilities", self._state.set_ability, undo_key[1], value)
+                    else:
+                        self._apply(undo_key, self._state.restore, self.STATE_FIELDS[undo_key], value)
+        finally:
+            self._restoring = False
+    
+    # Editing sessions
+    @Property(bool, notify=dirtyChanged)
+    def dirty(self):
+        """True while text edits are waiting to be committed"""
+        return bool(self._edits)
+    
+    @Slot(str, str)
+    def editText(self, key, text):
+        """Stage a keystroke's text for a text property; committed after EDIT_COMMIT_DELAY of quiet"""
+        if key not in self.TEXT_PROPERTIES:
+            return
+        was_dirty = bool(self._edits)
+        if text == getattr(self, key):
+            self._edits.pop(key, None)
+        else:
+            self._edits[key] = text
+        
+        if self._edits:
+            self._edit_timer.start()
+        else:
+            self._edit_timer.stop()
+        if bool(self._edits) != was_dirty:
+            self.dirtyChanged.emit()
+    
+    @Slot()
+    def commitEdits(self):
+        """Apply staged text edits now as one update (e.g. when the field loses focus)"""
+        self._edit_timer.stop()
+        if not self._edits:
+            return
+        edits, self._edits = self._edits, {}
+        with self.updates():
+            for key, text in edits.items():
+                setattr(self, key, text)
+        self.dirtyChanged.emit()
+    
+    @Slot(str, int, result=int)
+    def clampValue(self, key, value):
+        """Value a numeric property would actually store, for validating editors"""
+        field = self.STATE_FIELDS.get(key)
+        return self._state.clamped(field, value) if field else value
+    
+    @Slot(str, int)
+    def setValue(self, key, value):
+        """Set a numeric property from an editor; values that clamp to the current one are dropped"""
+        field = self.STATE_FIELDS.get(key)
+        if field is None or key in self.TEXT_PROPERTIES:
+            return
+        if self._state.clamped(field, value) != getattr(self._state, field):
+            setattr(self, key, value)
     
     # Utility methods
     def modifyHp(self, amount):
         """Modify current HP by amount"""
-        self.hpCurrent = self._hp_current + amount
+        self.hpCurrent = self._state.hp_current + amount
     
     def modifyHope(self, amount):
         """Modify hope by amount"""
-        self.hope = self._hope + amount
+        self.hope = self._state.hope + amount
     
     def modifyFear(self, amount):
         """Modify fear by amount"""
-        self.fear = self._fear + amount
+        self.fear = self._state.fear + amount
     
     def getThreshold(self, threshold_type):
         """Get threshold value"""
-        return self._thresholds.get(threshold_type, 0)
+        return self._state.get_threshold(threshold_type)
     
     def resetCharacter(self):
         """Reset character to default values"""
-        self.name = "Mi Personaje"
-        self.className = "Guerrero"
-        self.level = 1
-        self.hpCurrent = 30
-        self.hpMax = 30
-        self.armor = 2
-        self.hope = 1
-        self.fear = 0
-        
-        # Reset abilities
-        default_abilities = {
-            "Fuerza": 2,
-            "Destreza": 1,
-            "Carisma": 0,
-            "Constitución": 1,
-            "Sabiduría": 0,
-            "Inteligencia": -1
-        }
-        for ability, value in default_abilities.items():
-            self.setAbility(ability, value)
+        with self.updates():
+            self.name = "Mi Personaje"
+            self.className = "Guerrero"
+            self.level = 1
+            self.hpMax = 30
+            self.hpCurrent = 30
+            self.armor = 2
+            self.hope = 1
+            self.fear = 0
+            
+            # Reset abilities
+            for ability, value in DEFAULT_ABILITIES.items():
+                self.setAbility(ability, value)
+    
+    def toDict(self):
+        """Plain dict with the saved character state"""
+        data = {key: getattr(self, key) for key in self.PERSISTED_PROPERTIES}
+        data["abilities"] = dict(self._state.abilities)
+        return data
+    
+    def loadDict(self, data):
+        """Apply a dict produced by toDict, ignoring unknown keys"""
+        with self.updates():
+            for key in self.PERSISTED_PROPERTIES:
+                if key in data:
+                    setattr(self, key, data[key])
+            for ability, value in data.get("abilities", {}).items():
+                self.setAbility(ability, value)
@@ -0,0 +1,94 @@
+"""
+Character Store for Qt/QML Version
+Persists CharacterModel changes through an append-only change journal
+"""
+
+from functools import partial
+from pathlib import Path
+from PySide6.QtCore import QObject, Slot
+
+from core.journal import ChangeJournal
+from core.storage import WriteBehindWriter
+
+DEFAULT_CHARACTER_DIR = Path.home() / ".daggerheart" / "characters" / "default"
+
+# How long journal changes may wait before they are written and fsynced together
+JOURNAL_DELAY = 0.2
+
+# One writer thread for every open character's journal, off the GUI thread
+_journal_writer = WriteBehindWriter(JOURNAL_DELAY)
+
+class CharacterStore(QObject):
+    """Loads a CharacterModel from disk and journals every property change"""
+    
+    def __init__(self, character, directory=DEFAULT_CHARACTER_DIR, settings=None, compact_every=200, load=True):
+        """load=False binds a character that already holds its saved state (e.g. one re-opened by the roster)"""
+        super().__init__()
+        self._character = character
+        self._settings = settings
+        self._dirty = False
+        self._journal = ChangeJournal(directory, compact_every, writer=_journal_writer)
+        
+        # Restore the saved sheet before listening, so loading isn't journaled.
+        # The journal is read even with load=False, so new entries carry on
+        # from its last seq instead of being skipped as already snapshotted.
+        try:
+            state = self._journal.load()
+            if load and state:
+                character.loadDict(state)
+                character.clearHistory()
+        except Exception as e:
+            print(f"Error loading character: {e}")
+        
+        self._connections = []
+        for key in character.PERSISTED_PROPERTIES + ("abilities",):
+            self._connect(getattr(character, key + "Changed"), partial(self._on_property_changed, key))
+        
+        if settings is not None:
+            self._connect(settings.autoSaveChanged, self._on_auto_save_changed)
+    
+    def _connect(self, signal, slot):
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+    
+    def _auto_save_enabled(self):
+        return self._settings is None or self._settings.autoSave
+    
+    def _on_property_changed(self, key):
+        """Journal a single property change"""
+        if not self._auto_save_enabled():
+            self._dirty = True
+            return
+        
+        if key == "abilities":
+            value = self._character.getAbilities()
+        else:
+            value = getattr(self._character, key)
+        
+        try:
+            self._journal.record(key, value)
+        except Exception as e:
+            print(f"Error saving character: {e}")
+    
+    def _on_auto_save_changed(self):
+        """Catch up on changes made while auto save was off"""
+        if self._dirty and self._auto_save_enabled():
+            self.saveCharacter()
+    
+    @Slot()
+    def saveCharacter(self):
+        """Write a full snapshot of the character"""
+        try:
+            self._journal.write_snapshot(self._character.toDict())
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving character: {e}")
+    
+    @Slot()
+    def close(self):
+        """Commit pending edits, stop listening to the character, write queued changes and close the journal"""
+        self._character.commitEdits()
+        for signal, slot in self._connections:
+            signal.disconnect(slot)
+        self._connections = []
+        self._journal.close()
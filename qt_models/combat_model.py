@@ -0,0 +1,223 @@
+"""
+Combat Model for Qt/QML Version
+Combatant list over the core CombatTracker, refreshing only the rows that change
+"""
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property
+
+from core.combat import KINDS, CombatTracker
+
+class CombatModel(QAbstractListModel):
+    """Combatant list model; damage, Stress and spotlight changes emit per-row dataChanged"""
+    
+    NameRole = Qt.UserRole + 1
+    KindRole = Qt.UserRole + 2
+    HpRole = Qt.UserRole + 3
+    HpMaxRole = Qt.UserRole + 4
+    StressRole = Qt.UserRole + 5
+    StressMaxRole = Qt.UserRole + 6
+    MinorRole = Qt.UserRole + 7
+    MajorRole = Qt.UserRole + 8
+    SevereRole = Qt.UserRole + 9
+    DefeatedRole = Qt.UserRole + 10
+    SpotlightRole = Qt.UserRole + 11
+    
+    _ROLE_NAMES = {
+        NameRole: b"name", KindRole: b"kind", HpRole: b"hp", HpMaxRole: b"hpMax",
+        StressRole: b"stress", StressMaxRole: b"stressMax", MinorRole: b"minor",
+        MajorRole: b"major", SevereRole: b"severe", DefeatedRole: b"defeated",
+        SpotlightRole: b"spotlight",
+    }
+    
+    # Roles that can change for a row after it is added
+    _HP_ROLES = [HpRole, DefeatedRole]
+    _STRESS_ROLES = [StressRole]
+    _SPOTLIGHT_ROLES = [SpotlightRole]
+    
+    countChanged = Signal()
+    spotlightChanged = Signal()
+    roundChanged = Signal()
+    
+    def __init__(self):
+        super().__init__()
+        self._tracker = CombatTracker()
+    
+    @property
+    def tracker(self):
+        """The wrapped core CombatTracker"""
+        return self._tracker
+    
+    # QAbstractListModel interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tracker)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        tracker = self._tracker
+        row = index.row()
+        if not index.isValid() or not 0 <= row < len(tracker):
+            return None
+        if role == Qt.DisplayRole or role == self.NameRole:
+            return tracker.names[row]
+        if role == self.HpRole:
+            return tracker.hp[row]
+        if role == self.DefeatedRole:
+            return tracker.hp[row] <= 0
+        if role == self.StressRole:
+            return tracker.stress[row]
+        if role == self.SpotlightRole:
+            return row == tracker.spotlight
+        if role == self.KindRole:
+            return KINDS[tracker.kinds[row]]
+        if role == self.HpMaxRole:
+            return tracker.hp_max[row]
+        if role == self.StressMaxRole:
+            return tracker.stress_max[row]
+        if role == self.MinorRole:
+            return tracker.minor[row]
+        if role == self.MajorRole:
+            return tracker.major[row]
+        if role == self.SevereRole:
+            return tracker.severe[row]
+        return None
+    
+    def roleNames(self):
+        return self._ROLE_NAMES
+    
+    # Properties
+    @Property(int, notify=countChanged)
+    def count(self):
+        return len(self._tracker)
+    
+    @Property(int, notify=spotlightChanged)
+    def spotlight(self):
+        """Row holding the spotlight, -1 for nobody"""
+        return self._tracker.spotlight
+    
+    @Property(int, notify=roundChanged)
+    def round(self):
+        return self._tracker.round
+    
+    # Roster
+    @Slot(str, int, int, int, int, int)
+    def addAdversary(self, name, hp, minor, major, severe, stress=0):
+        try:
+            CombatTracker.validate(hp, (minor, major, severe), stress)
+        except ValueError as e:
+            print(f"Error adding adversary: {e}")
+            return
+        row = len(self._tracker)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tracker.add(name, hp, (minor, major, severe), stress)
+        self.endInsertRows()
+        self.countChanged.emit()
+    
+    @Slot(str, int, int, int)
+    def addMinions(self, name, count, hp=1, threshold=1):
+        """Add count numbered minions that any hit of threshold or more defeats"""
+        if count <= 0:
+            return
+        try:
+            CombatTracker.validate(hp, (threshold, threshold, threshold), kind="minion")
+        except ValueError as e:
+            print(f"Error adding minions: {e}")
+            return
+        first = len(self._tracker)
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._tracker.add_many(name, count, hp, (threshold, threshold, threshold))
+        self.endInsertRows()
+        self.countChanged.emit()
+    
+    @Slot(int)
+    def removeCombatant(self, row):
+        if not 0 <= row < len(self._tracker):
+            return
+        spotlight = self._tracker.spotlight
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._tracker.remove(row)
+        self.endRemoveRows()
+        self.countChanged.emit()
+        if self._tracker.spotlight != spotlight:
+            self.spotlightChanged.emit()
+    
+    @Slot()
+    def clear(self):
+        self.beginResetModel()
+        self._tracker.clear()
+        self.endResetModel()
+        self.countChanged.emit()
+        self.spotlightChanged.emit()
+        self.roundChanged.emit()
+    
+    # Damage and Stress
+    @Slot(int, int, result=int)
+    def damage(self, row, amount):
+        """Apply damage to one combatant; returns the HP it marked"""
+        if not 0 <= row < len(self._tracker):
+            return 0
+        before = self._tracker.hp[row]
+        self._rows_changed(self._tracker.apply_damage([row], amount), self._HP_ROLES)
+        return before - self._tracker.hp[row]
+    
+    @Slot('QVariantList', int, result=int)
+    def damageMany(self, rows, amount):
+        """Apply the same damage to several combatants; returns how many marked HP"""
+        rows = [int(row) for row in rows if 0 <= int(row) < len(self._tracker)]
+        changed = self._tracker.apply_damage(rows, amount)
+        self._rows_changed(changed, self._HP_ROLES)
+        return len(changed)
+    
+    @Slot(int, result=int)
+    def damageAll(self, amount):
+        """Apply damage to every combatant still standing (an area attack)"""
+        tracker = self._tracker
+        return self.damageMany([row for row in range(len(tracker)) if tracker.hp[row] > 0], amount)
+    
+    @Slot(int, int)
+    def heal(self, row, amount):
+        if 0 <= row < len(self._tracker):
+            self._rows_changed(self._tracker.heal([row], amount), self._HP_ROLES)
+    
+    @Slot(int, int)
+    def markStress(self, row, amount):
+        """Mark (or, when negative, clear) Stress on one combatant"""
+        if 0 <= row < len(self._tracker):
+            self._rows_changed(self._tracker.mark_stress([row], amount), self._STRESS_ROLES)
+    
+    # Spotlight
+    @Slot()
+    def nextTurn(self):
+        """Pass the spotlight to the next combatant still standing"""
+        round_before = self._tracker.round
+        self._spotlight_moved(*self._tracker.next_turn())
+        if self._tracker.round != round_before:
+            self.roundChanged.emit()
+    
+    @Slot(int)
+    def setSpotlight(self, row):
+        self._spotlight_moved(*self._tracker.set_spotlight(row))
+    
+    @Slot(int, result='QVariantMap')
+    def get(self, row):
+        """One combatant as a plain map, for detail panels"""
+        if not 0 <= row < len(self._tracker):
+            return {}
+        return self._tracker.row(row)
+    
+    # Internals
+    def _spotlight_moved(self, previous, row):
+        if previous == row:
+            return
+        self._rows_changed([r for r in (previous, row) if r >= 0], self._SPOTLIGHT_ROLES)
+        self.spotlightChanged.emit()
+    
+    def _rows_changed(self, rows, roles):
+        """One dataChanged per run of consecutive changed rows"""
+        rows = sorted(rows)
+        i = 0
+        while i < len(rows):
+            first = last = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == last + 1:
+                last = rows[i]
+                i += 1
+            self.dataChanged.emit(self.index(first), self.index(last), roles)
@@ -3,30 +3,146 @@ Dice Roller Model for Qt/QML Version
 Handles all dice rolling mechanics with animations and results
 """
 
-import random
-from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer
+from PySide6.QtCore import QObject, Qt, Signal, Slot, Property, QTimer, QThreadPool, QElapsedTimer
+
+from core.dice import batch_modifier, roll_batch, roll_dice, determine_result_type, roll_tally
+from core.expression import compile_expression
+from core.probability import result_odds
+from core.rng import StreamSet
+
+# Frame interval at the default dice speed (50%)
+BASE_FRAME_INTERVAL = 80
+
+# Dice of a custom roll sent with rollFinished; the rest stay tallied until asked for
+MAX_SHOWN_DICE = 100
+
+# Dice one damage or expression roll may throw on the UI thread; rollCustomDice takes any number
+MAX_EXPRESSION_DICE = 100_000
+
+# Upper bounds on one background batch: rolls, and dice drawn for an expression sample
+MAX_BATCH_ROLLS = 1_000_000
+MAX_SAMPLE_DICE = 10_000_000
+
+# Rolls sampled to estimate the odds of an expression too large to compute exactly
+ODDS_SAMPLES = 20_000
+
+def _sample_summary(text, totals):
+    """Plain dict summary of sampled totals, suitable for QML"""
+    return {
+        "expression": text,
+        "count": len(totals),
+        "mean": sum(totals) / len(totals) if totals else 0.0,
+        "min": min(totals, default=0),
+        "max": max(totals, default=0),
+    }
+
+def _checked_expression(text):
+    """Compiled expression for a single roll; raises ValueError if invalid or too many dice"""
+    expression = compile_expression(text)
+    if expression.dice_count > MAX_EXPRESSION_DICE:
+        raise ValueError(f"{text} rolls more than {MAX_EXPRESSION_DICE} dice; use a custom roll")
+    return expression
+
+def _expression_odds(expression, rng):
+    """Odds of every total of an expression, exact when it is small enough and sampled otherwise"""
+    try:
+        odds = expression.distribution()
+        mean = expression.mean()
+        exact = True
+    except ValueError:
+        totals = expression.sample(ODDS_SAMPLES, rng)
+        counts = {}
+        for total in totals:
+            counts[total] = counts.get(total, 0) + 1
+        odds = {total: counts[total] / len(totals) for total in sorted(counts)}
+        mean = sum(totals) / len(totals)
+        exact = False
+    totals = list(odds)
+    return {
+        "valid": True,
+        "expression": expression.text,
+        "exact": exact,
+        "totals": totals,
+        "odds": list(odds.values()),
+        "mean": mean,
+        "min": totals[0],
+        "max": totals[-1],
+    }
+
+def _sample_limit(expression):
+    """Most rolls of an expression one background sample may draw"""
+    dice = max(1, sum(term.count for term in expression.terms))
+    return min(MAX_BATCH_ROLLS, MAX_SAMPLE_DICE // dice)
 
 class DiceRoller(QObject):
     """Dice rolling system with Qt integration"""
     
     # Signals
     rollStarted = Signal()
-    rollFinished = Signal(list, int, str)  # dice_results, total, result_type
+    rollFinished = Signal(list, 'qlonglong', str)  # dice_results, total (64-bit for huge custom rolls), result_type
     diceAnimationFrame = Signal(list)  # animated dice values
+    batchFinished = Signal(dict)  # batch summary
+    customRollFinished = Signal(dict)  # custom roll total, histogram and stats
+    sampleFinished = Signal(dict)  # expression sample summary
+    expressionOddsFinished = Signal(dict)  # expression totals and their odds
+    seedChanged = Signal()
     
-    def __init__(self):
+    def __init__(self, seed=None):
         super().__init__()
         self._is_rolling = False
+        self._settings = None
+        self._history = None
+        self._set_seed(seed)
+        
+        # Shared animation scheduler: one timer, frames precomputed per roll
         self._animation_timer = QTimer()
+        # A coarse timer may fire up to 5% early, which would land a tick just before its frame
+        self._animation_timer.setTimerType(Qt.PreciseTimer)
         self._animation_timer.timeout.connect(self._animate_dice)
-        self._animation_frames = 0
+        self._animation_clock = QElapsedTimer()
+        self._animation_sequence = []
+        self._animation_frames = -1  # index of the last emitted frame
+        self._frame_interval = BASE_FRAME_INTERVAL
         self._max_animation_frames = 15
         self._final_result = None
+        self._last_tally = None
+    
+    def bindSettings(self, settings):
+        """Take dice speed and animation toggle from a SettingsManager"""
+        self._settings = settings
+    
+    def bindHistory(self, history):
+        """Record every finished roll into a RollHistoryModel"""
+        self._history = history
     
     @Property(bool, notify=rollStarted)
     def isRolling(self):
         return self._is_rolling
     
+    # Seeds are 64-bit, wider than a QML int, so they cross as strings
+    @Property(str, notify=seedChanged)
+    def seed(self):
+        return str(self._streams.seed)
+    
+    @Slot(str)
+    def reseed(self, seed):
+        """Restart the session from a seed ("" for a fresh random one)"""
+        self._set_seed(int(seed) if seed else None)
+        self.seedChanged.emit()
+    
+    @Slot(result='QVariantMap')
+    def sessionLog(self):
+        """Seed and every roll made since it was set, for core.rng.replay_session"""
+        return {"seed": str(self._streams.seed), "rolls": [list(entry) for entry in self._session]}
+    
+    def _set_seed(self, seed):
+        # Game rolls, animation frames and batches each get their own
+        # substream, so cosmetic draws never shift the real results
+        self._streams = StreamSet(seed)
+        self._rng = self._streams.stream("rolls")
+        self._animation_rng = self._streams.stream("animation")
+        self._session = []
+    
     @Slot(str, int, str)
     def rollAbility(self, roll_type, modifier, ability_name):
         """Roll for an ability check"""
@@ -37,6 +153,7 @@ class DiceRoller(QObject):
         self.rollStarted.emit()
         
         # Calculate dice based on roll type
+        self._session.append(("ability", roll_type, modifier))
         dice_results = self._calculate_dice_roll(roll_type)
         
         # Calculate total
@@ -46,86 +163,194 @@ class DiceRoller(QObject):
         result_type = self._determine_result_type(total)
         
         # Store final result for animation
-        self._final_result = (dice_results, total, result_type, ability_name, modifier)
+        self._final_result = (roll_type, dice_results, total, result_type, ability_name, modifier)
         
         # Start animation
-        self._animation_frames = 0
-        self._animation_timer.start(80)  # 80ms per frame
+        self._start_animation()
     
     @Slot(str, int)
     def rollDamage(self, die_type, modifier):
-        """Roll damage dice"""
+        """Roll damage dice, from "d6" to a full expression such as "2d8+1d6" """
         if self._is_rolling:
             return
         
-        # Extract die size (e.g., "d6" -> 6)
-        die_size = int(die_type.replace('d', ''))
-        
-        # Roll the die
-        roll = random.randint(1, die_size)
-        total = roll + modifier
+        try:
+            expression = _checked_expression(die_type)
+        except ValueError as e:
+            print(f"Error rolling damage: {e}")
+            return
+        self._session.append(("damage", die_type, modifier))
+        dice, total = expression.roll(self._rng)
+        total += modifier
+        shown = dice[:MAX_SHOWN_DICE]
+        if self._history is not None:
+            self._history.recordRoll("damage", die_type, shown, expression.constant + modifier, total,
+                                     dice_count=len(dice))
         
         # Emit immediate result for damage
-        self.rollFinished.emit([roll], total, "damage")
+        self.rollFinished.emit(shown, total, "damage")
+    
+    @Slot(str)
+    def rollExpression(self, text):
+        """Roll a dice expression such as "2d8+1d6+3", "4d6kh3" or "2d12+adv" """
+        if self._is_rolling:
+            return
+        
+        try:
+            expression = _checked_expression(text)
+        except ValueError as e:
+            print(f"Error rolling {text}: {e}")
+            return
+        self._session.append(("expression", text))
+        dice, total = expression.roll(self._rng)
+        shown = dice[:MAX_SHOWN_DICE]
+        if self._history is not None:
+            self._history.recordRoll("custom", text, shown, expression.constant, total, dice_count=len(dice))
+        self.rollFinished.emit(shown, total, "custom")
     
     @Slot(int, int)
     def rollCustomDice(self, num_dice, die_size):
-        """Roll custom dice"""
+        """Roll custom dice
+        
+        Any number of dice costs the same: customRollFinished carries the
+        total, histogram and stats, and rollFinished only the first
+        MAX_SHOWN_DICE dice.  customDice() materialises more on demand.
+        """
         if self._is_rolling:
             return
         
-        results = []
-        for _ in range(num_dice):
-            results.append(random.randint(1, die_size))
-        
-        total = sum(results)
-        self.rollFinished.emit(results, total, "custom")
+        try:
+            tally = roll_tally(num_dice, die_size, self._rng)
+        except ValueError as e:
+            print(f"Error rolling custom dice: {e}")
+            return
+        self._session.append(("custom", num_dice, die_size))
+        self._last_tally = tally
+        shown = tally.dice(MAX_SHOWN_DICE)
+        total = tally.total()
+        self.customRollFinished.emit(tally.summary())
+        self.rollFinished.emit(shown, total, "custom")
+        if self._history is not None:
+            self._history.recordRoll("custom", f"{num_dice}d{die_size}", shown, 0, total, dice_count=len(tally))
+    
+    @Slot(int, int, result='QVariantList')
+    def customDice(self, start, count):
+        """Dice start .. start + count - 1 of the last custom roll, for views that draw them"""
+        if self._last_tally is None or start < 0 or count <= 0:
+            return []
+        return self._last_tally.dice(start + count)[start:]
+    
+    def roll_batch(self, roll_type, modifier, n):
+        """Roll n ability checks at once, returning a core.dice.BatchResult"""
+        self._session.append(("batch", roll_type, modifier, n))
+        return roll_batch(roll_type, modifier, n, self._streams.spawn("batch"))
+    
+    @Slot(str, int, int)
+    def rollBatch(self, roll_type, modifier, n):
+        """Roll a batch of up to MAX_BATCH_ROLLS in the thread pool and emit batchFinished with its summary"""
+        try:
+            modifier = batch_modifier(modifier)
+        except (TypeError, ValueError) as e:
+            print(f"Error rolling batch: {e}")
+            return
+        n = max(0, min(n, MAX_BATCH_ROLLS))
+        # The batch substream is taken here, in call order, and owned by the worker
+        self._session.append(("batch", roll_type, modifier, n))
+        rng = self._streams.spawn("batch")
+        QThreadPool.globalInstance().start(
+            lambda: self.batchFinished.emit(roll_batch(roll_type, modifier, n, rng).summary())
+        )
+    
+    @Slot(str, int)
+    def sampleExpression(self, text, n):
+        """Roll an expression n times in the thread pool and emit sampleFinished
+
+        n is capped so one sample draws at most MAX_BATCH_ROLLS rolls and
+        MAX_SAMPLE_DICE dice.
+        """
+        try:
+            expression = compile_expression(text)
+        except ValueError as e:
+            print(f"Error sampling {text}: {e}")
+            return
+        n = max(0, min(n, _sample_limit(expression)))
+        self._session.append(("sample", text, n))
+        rng = self._streams.spawn("sample")
+        QThreadPool.globalInstance().start(
+            lambda: self.sampleFinished.emit(_sample_summary(text, expression.sample(n, rng)))
+        )
+    
+    @Slot(str)
+    def expressionOdds(self, text):
+        """Compute an expression's odds in the thread pool and emit expressionOddsFinished
+
+        The map holds totals, their odds, mean, min and max, with exact
+        false when the expression had too many outcomes and its odds were
+        estimated from ODDS_SAMPLES rolls.
+        """
+        try:
+            expression = compile_expression(text)
+        except ValueError as e:
+            self.expressionOddsFinished.emit({"valid": False, "expression": text, "error": str(e)})
+            return
+        # Odds samples have their own substreams, so they never shift the replayable rolls
+        rng = self._streams.spawn("odds")
+        QThreadPool.globalInstance().start(
+            lambda: self.expressionOddsFinished.emit(_expression_odds(expression, rng))
+        )
+    
+    @Slot(str, int, result='QVariantMap')
+    def rollOdds(self, roll_type, modifier):
+        """Exact probability of each result type for a roll type and modifier"""
+        return result_odds(roll_type, modifier)
     
     def _calculate_dice_roll(self, roll_type):
         """Calculate dice results based on roll type"""
-        if roll_type == "Normal":
-            return [random.randint(1, 12), random.randint(1, 12)]
-        elif roll_type == "Ventaja":
-            rolls = [random.randint(1, 12) for _ in range(3)]
-            return sorted(rolls, reverse=True)[:2]
-        elif roll_type == "Desventaja":
-            rolls = [random.randint(1, 12) for _ in range(3)]
-            return sorted(rolls)[:2]
-        elif roll_type == "Doble Ventaja":
-            rolls = [random.randint(1, 12) for _ in range(4)]
-            return sorted(rolls, reverse=True)[:2]
-        elif roll_type == "Triple Ventaja":
-            rolls = [random.randint(1, 12) for _ in range(5)]
-            return sorted(rolls, reverse=True)[:2]
-        else:
-            return [random.randint(1, 12), random.randint(1, 12)]
+        return roll_dice(roll_type, self._rng)
     
     def _determine_result_type(self, total):
         """Determine the type of result based on total"""
-        if total >= 22:
-            return "critical_success"
-        elif total >= 16:
-            return "major_success"
-        elif total >= 10:
-            return "minor_success"
-        else:
-            return "failure"
+        return determine_result_type(total)
+    
+    def _start_animation(self):
+        """Precompute this roll's animation frames and start the shared timer"""
+        settings = self._settings
+        if settings is not None and not settings.animationsEnabled:
+            self._finish_roll()
+            return
+        
+        # diceSpeed runs 10-100%, 50% keeps the classic 80ms per frame
+        speed = settings.diceSpeed if settings is not None else 50
+        self._frame_interval = max(16, round(BASE_FRAME_INTERVAL * 50 / max(1, speed)))
+        
+        faces = self._animation_rng.dice(12, 2 * self._max_animation_frames)
+        self._animation_sequence = [faces[i:i + 2] for i in range(0, len(faces), 2)]
+        self._animation_frames = -1
+        self._animation_clock.start()
+        self._animation_timer.start(self._frame_interval)
     
     def _animate_dice(self):
         """Animation frame for dice rolling"""
-        if self._animation_frames < self._max_animation_frames:
-            # Generate random dice for animation
-            animated_dice = [random.randint(1, 12), random.randint(1, 12)]
-            self.diceAnimationFrame.emit(animated_dice)
-            self._animation_frames += 1
-        else:
-            # Finish animation
-            self._animation_timer.stop()
-            self._is_rolling = False
-            
-            # Emit final result
-            dice_results, total, result_type, ability_name, modifier = self._final_result
-            self.rollFinished.emit(dice_results, total, result_type)
+        # Frame i is due after (i + 1) intervals, counted to the nearest
+        # interval so a slightly early tick still shows its frame; if the
+        # event loop fell behind, jump straight to the frame due now
+        due = (self._animation_clock.elapsed() + self._frame_interval // 2) // self._frame_interval - 1
+        if due >= len(self._animation_sequence):
+            self._finish_roll()
+        elif due > self._animation_frames:
+            self._animation_frames = due
+            self.diceAnimationFrame.emit(self._animation_sequence[due])
+    
+    def _finish_roll(self):
+        """Stop the animation and emit the precomputed result"""
+        self._animation_timer.stop()
+        self._is_rolling = False
+        
+        # Emit final result
+        roll_type, dice_results, total, result_type, ability_name, modifier = self._final_result
+        if self._history is not None:
+            self._history.recordRoll("ability", roll_type, dice_results, modifier, total, result_type, ability_name)
+        self.rollFinished.emit(dice_results, total, result_type)
     
     @Slot()
     def stopRoll(self):
@@ -0,0 +1,153 @@
+"""
+Roll History Model for Qt/QML Version
+Pages the core RollHistory into QML, newest roll first
+"""
+
+import struct
+from collections import OrderedDict
+from pathlib import Path
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property
+
+from core.history import DEFAULT_CAPACITY, RollHistory
+
+DEFAULT_HISTORY_DIR = Path.home() / ".daggerheart" / "history"
+
+# Rows handed to a view per fetchMore, and the unit rolls are read from disk in
+PAGE_SIZE = 50
+
+# Disk pages kept decoded for scrolling back and forth
+MAX_CACHED_PAGES = 8
+
+class RollHistoryModel(QAbstractListModel):
+    """Roll history list model that only materialises the rows a view scrolls to"""
+
+    SeqRole = Qt.UserRole + 1
+    TimestampRole = Qt.UserRole + 2
+    KindRole = Qt.UserRole + 3
+    RollTypeRole = Qt.UserRole + 4
+    AbilityRole = Qt.UserRole + 5
+    ResultTypeRole = Qt.UserRole + 6
+    ModifierRole = Qt.UserRole + 7
+    DiceRole = Qt.UserRole + 8
+    DiceCountRole = Qt.UserRole + 9
+    TotalRole = Qt.UserRole + 10
+
+    _ROLE_KEYS = {
+        SeqRole: "seq", TimestampRole: "timestamp", KindRole: "kind", RollTypeRole: "rollType",
+        AbilityRole: "ability", ResultTypeRole: "resultType", ModifierRole: "modifier",
+        DiceRole: "dice", DiceCountRole: "diceCount", TotalRole: "total",
+    }
+
+    countChanged = Signal()
+    sessionChanged = Signal()
+
+    def __init__(self, directory=DEFAULT_HISTORY_DIR, capacity=DEFAULT_CAPACITY):
+        super().__init__()
+        self._history = RollHistory(directory, capacity)
+        self._loaded = min(PAGE_SIZE, len(self._history))
+        self._pages = OrderedDict()  # disk page number -> list of roll dicts
+
+    @property
+    def history(self):
+        """The wrapped core RollHistory"""
+        return self._history
+
+    # QAbstractListModel interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._history)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        more = min(PAGE_SIZE, len(self._history) - self._loaded)
+        if more <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + more - 1)
+        self._loaded += more
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+        roll = self._roll(len(self._history) - 1 - index.row())
+        if roll is None:
+            return None
+        if role == Qt.DisplayRole:
+            return f"{roll['rollType']}: {roll['total']}"
+        key = self._ROLE_KEYS.get(role)
+        return roll[key] if key else None
+
+    def roleNames(self):
+        return {role: key.encode() for role, key in self._ROLE_KEYS.items()}
+
+    # Properties
+    @Property(int, notify=countChanged)
+    def count(self):
+        """Rolls recorded in total, including those not fetched yet"""
+        return len(self._history)
+
+    @Property(int, notify=sessionChanged)
+    def sessionHope(self):
+        return self._history.session_hope
+
+    @Property(int, notify=sessionChanged)
+    def sessionFear(self):
+        return self._history.session_fear
+
+    # Recording and queries
+    def recordRoll(self, kind, roll_type, dice, modifier, total, result_type=None, ability="", dice_count=None):
+        """Record a finished roll and show it as the new first row; returns its seq, or -1 if it failed"""
+        # Recorded before the rows are opened, so a roll the log rejects leaves the model untouched
+        try:
+            seq = self._history.record(kind, roll_type, dice, modifier, total, result_type, ability,
+                                       dice_count=dice_count)
+        except (ValueError, OverflowError, struct.error, OSError) as e:
+            print(f"Error recording roll: {e}")
+            return -1
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._loaded += 1
+        self.endInsertRows()
+        self.countChanged.emit()
+        if kind == "ability":
+            self.sessionChanged.emit()
+        return seq
+
+    @Slot(int, str, str, result='QVariantList')
+    def lastRolls(self, n, result_type="", ability=""):
+        """Newest n rolls, optionally only one result type and/or ability ("" for any)"""
+        return self._history.last(n, result_type or None, ability or None)
+
+    @Slot(str, str, result=int)
+    def countRolls(self, result_type="", ability=""):
+        """Rolls in memory matching a result type and/or ability ("" for any)"""
+        return self._history.count(result_type or None, ability or None)
+
+    @Slot()
+    def startSession(self):
+        """Start counting session Hope/Fear from now"""
+        self._history.start_session()
+        self.sessionChanged.emit()
+
+    @Slot()
+    def close(self):
+        self._history.close()
+
+    # Internals
+    def _roll(self, seq):
+        if seq >= self._history.oldest_in_memory:
+            return self._history.get(seq)
+
+        # Older rolls are only on disk; read and keep the whole page
+        page = seq // PAGE_SIZE
+        rolls = self._pages.get(page)
+        if rolls is None:
+            rolls = self._pages[page] = self._history.read(page * PAGE_SIZE, PAGE_SIZE)
+            if len(self._pages) > MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        offset = seq - page * PAGE_SIZE
+        return rolls[offset] if offset < len(rolls) else None
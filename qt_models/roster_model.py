@@ -0,0 +1,228 @@
+"""
+Roster Model for Qt/QML Version
+Lists saved characters from a lightweight index and loads full models on demand
+"""
+
+import json
+import shutil
+import uuid
+import weakref
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, Signal, Slot, Property
+from PySide6.QtQml import QQmlEngine
+
+from core.journal import ChangeJournal
+from core.storage import WriteBehindWriter
+from qt_models.character_model import CharacterModel
+from qt_models.character_store import CharacterStore
+
+DEFAULT_ROSTER_DIR = Path.home() / ".daggerheart" / "characters"
+DEFAULT_CHARACTER_ID = "default"
+
+# Fields kept in the roster index, with the defaults of a new CharacterModel
+INDEX_FIELDS = {"name": "Mi Personaje", "className": "Guerrero", "level": 1}
+
+class RosterModel(QAbstractListModel):
+    """Character roster backed by roster.json and an LRU of live characters
+    
+    At most max_live CharacterModels (plus pinned ones) are held, each with
+    its open store.  An evicted model is handed to QML: it lives on only
+    while QML still references it, and is re-bound to a new store on its
+    next access or change until then.
+    """
+    
+    IdRole = Qt.UserRole + 1
+    NameRole = Qt.UserRole + 2
+    ClassNameRole = Qt.UserRole + 3
+    LevelRole = Qt.UserRole + 4
+    
+    _ROLE_KEYS = {IdRole: "id", NameRole: "name", ClassNameRole: "className", LevelRole: "level"}
+    _KEY_ROLES = {key: role for role, key in _ROLE_KEYS.items()}
+    
+    countChanged = Signal()
+    
+    def __init__(self, directory=DEFAULT_ROSTER_DIR, settings=None, max_live=8):
+        super().__init__()
+        self._directory = Path(directory)
+        self._index_file = self._directory / "roster.json"
+        self._settings = settings
+        self._max_live = max_live
+        
+        self._entries = []  # index rows: {"id", "name", "className", "level"}
+        self._rows = {}     # character id -> row
+        self._models = weakref.WeakValueDictionary()  # character id -> CharacterModel still referenced
+        self._live = OrderedDict()  # character id -> (CharacterModel, open CharacterStore), LRU order
+        self._pinned = set()
+        self._writer = WriteBehindWriter()
+        
+        self._load_index()
+    
+    # QAbstractListModel interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry["name"]
+        key = self._ROLE_KEYS.get(role)
+        return entry[key] if key else None
+    
+    def roleNames(self):
+        return {role: key.encode() for role, key in self._ROLE_KEYS.items()}
+    
+    @Property(int, notify=countChanged)
+    def count(self):
+        return len(self._entries)
+    
+    # Character access
+    @Slot(str, result=QObject)
+    def openCharacter(self, character_id, pin=False):
+        """Get the live CharacterModel for an id, loading it from disk if needed"""
+        if pin:
+            self._pinned.add(character_id)
+        
+        if character_id in self._live:
+            self._live.move_to_end(character_id)
+            return self._live[character_id][0]
+        
+        character = self._models.get(character_id)
+        if character is None:
+            character = CharacterModel()
+            store = CharacterStore(character, self._directory / character_id, self._settings)
+            for key in character.PERSISTED_PROPERTIES + ("abilities",):
+                getattr(character, key + "Changed").connect(partial(self._on_character_changed, character_id, key))
+            self._models[character_id] = character
+        else:
+            # An evicted model kept every change up to eviction, so it already holds its saved state
+            QQmlEngine.setObjectOwnership(character, QQmlEngine.CppOwnership)
+            store = CharacterStore(character, self._directory / character_id, self._settings, load=False)
+        self._live[character_id] = (character, store)
+        
+        if character_id not in self._rows:
+            self._append_entry(character_id, {key: getattr(character, key) for key in INDEX_FIELDS})
+        
+        self._evict()
+        return character
+    
+    @Slot(int, result=QObject)
+    def characterAt(self, row):
+        """Get the live CharacterModel for a roster row"""
+        if not 0 <= row < len(self._entries):
+            return None
+        return self.openCharacter(self._entries[row]["id"])
+    
+    @Slot(str, result=str)
+    def createCharacter(self, name):
+        """Create and open a new character, returning its id"""
+        character_id = uuid.uuid4().hex[:12]
+        character = self.openCharacter(character_id)
+        character.name = name
+        return character_id
+    
+    @Slot(int)
+    def removeCharacter(self, row):
+        """Delete a character and its saved data"""
+        if not 0 <= row < len(self._entries):
+            return
+        character_id = self._entries[row]["id"]
+        if character_id in self._pinned:
+            return
+        
+        if character_id in self._live:
+            self._live.pop(character_id)[1].close()
+        # Not deleted: QML may still hold it, and with no row its changes go nowhere
+        self._models.pop(character_id, None)
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        self._rows = {entry["id"]: i for i, entry in enumerate(self._entries)}
+        self.endRemoveRows()
+        self.countChanged.emit()
+        
+        shutil.rmtree(self._directory / character_id, ignore_errors=True)
+        self._save_index()
+    
+    @Slot()
+    def close(self):
+        """Close every live character and write the index"""
+        for character, store in self._live.values():
+            store.close()
+        self._writer.flush()
+    
+    # Internals
+    def _evict(self):
+        """Drop the least recently used characters beyond max_live (their journals are already durable)
+        
+        The model is not deleted here, since QML may still hold it; the
+        roster stops referencing it and hands it to QML's garbage collector.
+        """
+        for character_id in list(self._live):
+            if len(self._live) <= self._max_live:
+                break
+            if character_id in self._pinned:
+                continue
+            character, store = self._live.pop(character_id)
+            store.close()
+            QQmlEngine.setObjectOwnership(character, QQmlEngine.JavaScriptOwnership)
+    
+    def _append_entry(self, character_id, summary):
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(dict(summary, id=character_id))
+        self._rows[character_id] = row
+        self.endInsertRows()
+        self.countChanged.emit()
+        self._save_index()
+    
+    def _on_character_changed(self, character_id, key):
+        """Re-bind an evicted character edited through a reference QML kept, and mirror its summary"""
+        row = self._rows.get(character_id)
+        character = self._models.get(character_id)
+        if row is None or character is None:
+            return
+        if character_id not in self._live:
+            # The change happened with no store listening; a snapshot catches the journal up
+            self.openCharacter(character_id)
+            self._live[character_id][1].saveCharacter()
+        if key not in INDEX_FIELDS:
+            return
+        self._entries[row][key] = getattr(character, key)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self._KEY_ROLES[key]])
+        self._save_index()
+    
+    def _load_index(self):
+        """Load roster.json, rebuilding it from the character folders if missing"""
+        try:
+            if self._index_file.exists():
+                with open(self._index_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            else:
+                self._entries = self._scan_characters()
+                if self._entries:
+                    self._save_index()
+        except Exception as e:
+            print(f"Error loading roster: {e}")
+            self._entries = []
+        self._rows = {entry["id"]: i for i, entry in enumerate(self._entries)}
+    
+    def _scan_characters(self):
+        entries = []
+        if not self._directory.exists():
+            return entries
+        for folder in sorted(self._directory.iterdir()):
+            if not folder.is_dir():
+                continue
+            state = ChangeJournal(folder).load()
+            summary = {key: state.get(key, default) for key, default in INDEX_FIELDS.items()}
+            entries.append(dict(summary, id=folder.name))
+        return entries
+    
+    def _save_index(self):
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._writer.submit(self._index_file, [dict(entry) for entry in self._entries])
@@ -0,0 +1,87 @@
+"""
+Table Sync for Qt/QML Version
+Publishes character and roll changes to the core table sync server
+"""
+
+from functools import partial
+from PySide6.QtCore import QObject, Signal, Slot, Property
+
+from core.sync import DEFAULT_HOST, DEFAULT_PORT, SyncServer
+
+class TableSync(QObject):
+    """Forwards model change signals to a SyncServer as per-property deltas
+    
+    Only the property whose signal fired is read and handed to the server,
+    which queues it on its own thread; the UI thread never touches a socket.
+    """
+    
+    # Emitted from the server thread; Qt queues it to the UI thread
+    clientCountChanged = Signal(int)
+    runningChanged = Signal()
+    
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        super().__init__()
+        self._server = SyncServer(host, port)
+        self._server.on_clients_changed = self.clientCountChanged.emit
+        self._client_count = 0
+        self.clientCountChanged.connect(self._set_client_count)
+        self._character = None
+        self._character_slots = []
+        self._rolls = 0
+    
+    @property
+    def server(self):
+        """The wrapped core SyncServer"""
+        return self._server
+    
+    def bindCharacter(self, character):
+        """Mirror a CharacterModel's properties as character.<property> keys"""
+        for signal, slot in self._character_slots:
+            signal.disconnect(slot)
+        self._character = character
+        self._character_slots = []
+        for key in character.PERSISTED_PROPERTIES + ("abilities",):
+            signal = getattr(character, key + "Changed")
+            slot = partial(self._publish_character, key)
+            signal.connect(slot)
+            self._character_slots.append((signal, slot))
+            self._publish_character(key)
+    
+    def bindDiceRoller(self, dice_roller):
+        """Mirror the latest finished roll as the roll key"""
+        dice_roller.rollFinished.connect(self._publish_roll)
+    
+    @Property(bool, notify=runningChanged)
+    def running(self):
+        return self._server.address is not None
+    
+    @Property(int, notify=clientCountChanged)
+    def clientCount(self):
+        return self._client_count
+    
+    @Slot()
+    def start(self):
+        """Start listening for table clients"""
+        self._server.start()
+        self.runningChanged.emit()
+    
+    @Slot()
+    def stop(self):
+        self._server.stop()
+        self.runningChanged.emit()
+    
+    def _set_client_count(self, count):
+        self._client_count = count
+    
+    def _publish_character(self, key):
+        if key == "abilities":
+            value = self._character.getAbilities()
+        else:
+            value = getattr(self._character, key)
+        self._server.publish("character." + key, value)
+    
+    def _publish_roll(self, dice, total, result_type):
+        # Numbered so two identical rolls in a row are still two changes
+        self._rolls += 1
+        self._server.publish("roll", {"n": self._rolls, "dice": list(dice), "total": total,
+                                      "resultType": result_type})
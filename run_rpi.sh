@@ -53,11 +53,18 @@ python3 -c "import PySide6" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "📦 Installing PySide6..."
     pip3 install PySide6 --user
+    NEEDS_QML_PRECOMPILE=1
 fi
 
 # Change to script directory
 cd "$(dirname "$0")"
 
+# Fill the QML bytecode cache once after a fresh install
+if [ -n "$NEEDS_QML_PRECOMPILE" ]; then
+    echo "⚙️  Precompiling QML screens..."
+    python3 main_qt.py --precompile-qml
+fi
+
 echo "🚀 Launching application..."
 python3 main_qt.py
 
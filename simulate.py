@@ -0,0 +1,133 @@
+"""
+Daggerheart Headless Simulator
+Runs ability rolls or whole encounters without a GUI and streams JSON lines
+
+    python simulate.py rolls -n 1000 --roll-type Ventaja --modifier 2
+    python simulate.py encounter -n 500 --seed 42
+    python simulate.py balance -n 100000 --seed 42 --workers 4
+    python simulate.py replay session.json
+"""
+
+import argparse
+import json
+import sys
+
+from core.dice import ROLL_TYPES, roll_ability
+from core.encounter import DEFAULT_ADVERSARY, DEFAULT_WEAPON, run_encounter
+from core.montecarlo import simulate
+from core.rng import StreamSet, replay_session
+
+
+def simulate_rolls(args, rng, out):
+    for i in range(args.count):
+        dice, total, result_type = roll_ability(args.roll_type, args.modifier, rng)
+        out.write(json.dumps({"trial": i, "dice": dice, "total": total, "result": result_type}) + "\n")
+
+
+def encounter_options(args):
+    """run_encounter keyword arguments from the shared encounter options"""
+    adversary = {
+        "hp": args.adversary_hp,
+        "difficulty": args.difficulty,
+        "attack": args.attack,
+        "damage": args.adversary_damage,
+    }
+    return {"adversary": adversary, "ability": args.ability, "weapon": args.weapon,
+            "evasion": args.evasion, "spend_hope": not args.no_hope}
+
+
+def simulate_encounters(args, rng, out):
+    options = encounter_options(args)
+    for i in range(args.count):
+        result = run_encounter(rng=rng, **options)
+        out.write(json.dumps(dict(result, trial=i)) + "\n")
+
+
+def simulate_replay(args, rng, out):
+    """Re-roll a saved DiceRoller.sessionLog() from its seed"""
+    with open(args.log, 'r', encoding='utf-8') as f:
+        log = json.load(f)
+    for i, result in enumerate(replay_session(int(log["seed"]), log["rolls"])):
+        if hasattr(result, "summary"):
+            record = result.summary()
+        elif hasattr(result, "tolist"):
+            record = {"totals": result.tolist()}
+        else:
+            record = {"dice": result[0], "total": result[1]}
+            if len(result) > 2:
+                record["result"] = result[2]
+        out.write(json.dumps(dict(record, roll=i, kind=log["rolls"][i][0])) + "\n")
+
+
+def simulate_balance(args, rng, out):
+    """Stream running statistics after every shard, then the final summary"""
+    def progress(stats):
+        out.write(json.dumps(dict(stats.summary(), final=False)) + "\n")
+        out.flush()
+
+    seed = args.seed if args.seed is not None else StreamSet().seed
+    stats = simulate(args.count, seed=seed, workers=args.workers, shard_size=args.shard_size,
+                     precision=args.precision, progress=progress, **encounter_options(args))
+    out.write(json.dumps(dict(stats.summary(), final=True, seed=seed)) + "\n")
+
+
+def positive_int(text):
+    """argparse type for counts that must be 1 or more"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seed", type=int, default=None, help="seed for reproducible runs")
+    common.add_argument("-n", "--count", type=positive_int, default=1, help="number of trials")
+
+    parser = argparse.ArgumentParser(description="Headless Daggerheart dice and encounter simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rolls = commands.add_parser("rolls", parents=[common], help="stream ability rolls")
+    rolls.add_argument("--roll-type", choices=list(ROLL_TYPES), default="Normal")
+    rolls.add_argument("--modifier", type=int, default=0)
+    rolls.set_defaults(run=simulate_rolls)
+
+    fight = argparse.ArgumentParser(add_help=False)
+    fight.add_argument("--ability", default="Fuerza")
+    fight.add_argument("--weapon", default=DEFAULT_WEAPON, help="damage such as 1d8+2")
+    fight.add_argument("--evasion", type=int, default=10)
+    fight.add_argument("--no-hope", action="store_true", help="never spend Hope for Ventaja")
+    fight.add_argument("--adversary-hp", type=int, default=DEFAULT_ADVERSARY["hp"])
+    fight.add_argument("--difficulty", type=int, default=DEFAULT_ADVERSARY["difficulty"])
+    fight.add_argument("--attack", type=int, default=DEFAULT_ADVERSARY["attack"])
+    fight.add_argument("--adversary-damage", default=DEFAULT_ADVERSARY["damage"])
+
+    encounter = commands.add_parser("encounter", parents=[common, fight], help="stream whole encounters")
+    encounter.set_defaults(run=simulate_encounters)
+
+    balance = commands.add_parser("balance", parents=[common, fight],
+                                  help="Monte-Carlo encounter statistics across a process pool")
+    balance.add_argument("--workers", type=positive_int, default=None, help="processes (default: all cores)")
+    balance.add_argument("--shard-size", type=positive_int, default=1000, help="trials per shard")
+    balance.add_argument("--precision", type=float, default=None,
+                         help="stop once the win-rate 95%% interval is within +/- this")
+    balance.set_defaults(run=simulate_balance)
+
+    replay = commands.add_parser("replay", help="replay a DiceRoller session log")
+    replay.add_argument("log", help="JSON file holding the sessionLog() of a DiceRoller")
+    replay.set_defaults(run=simulate_replay)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    rng = StreamSet(getattr(args, "seed", None)).stream("rolls")
+    try:
+        args.run(args, rng, sys.stdout)
+    except BrokenPipeError:
+        # Output piped into head or similar; stop quietly
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,33 @@
 # utils/settings.py
 """
 SettingsManager handles loading and saving settings to a JSON file.
+It is the Kivy face of the shared core SettingsStore.
 """
-import json
-import os
+from core.settings import SettingsStore
 
 class SettingsManager:
-    def __init__(self, filename):
+    def __init__(self, filename, save_delay=0.5):
         self.filename = filename
-        self.settings = {}
-        self.load()
+        self.store = SettingsStore(filename, save_delay=save_delay)
+
+    @property
+    def settings(self):
+        return self.store.as_dict()
 
     def load(self):
-        if os.path.exists(self.filename):
-            with open(self.filename, 'r') as f:
-                self.settings = json.load(f)
-        else:
-            self.settings = {}
+        self.store.reload()
 
     def save(self):
-        with open(self.filename, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        self.store.save()
+        self.store.flush()
 
     def get(self, key, default=None):
-        return self.settings.get(key, default)
+        return self.store.get(key, default)
 
     def set(self, key, value):
-        self.settings[key] = value
-        self.save()
+        # Validated, cached and written behind; a burst of sets costs one write
+        self.store.set(key, value)
+
+    def bind(self, key, callback):
+        """Call callback(key, value) when key changes; returns an unbind function"""
+        return self.store.subscribe(key, callback)